@@ -0,0 +1,211 @@
+# apps/core/db_router.py
+"""
+Primary/Replica Database Routing
+
+Performance Purpose:
+- Read-only requests (GET/HEAD/OPTIONS) read from DATABASE_REPLICAS, so
+  listing traffic no longer competes with offer writes on the primary
+- Replica choice is random per read; no I/O unless a connection must be
+  (re)established
+
+Consistency:
+- Writes, transactions on the primary, management commands and anything
+  outside a request always use the primary
+- Read-your-writes: after a successful write the user is pinned to the
+  primary for REPLICA_PIN_SECONDS (one cache key, checked once per request)
+- REPLICA_PRIMARY_APPS (auth, sessions, ...) always read from the primary,
+  so logins and token checks never see a lagging row
+- read_from_primary() moves the rest of a request to the primary (shared
+  caches filled shortly after a write, see apps.listings.cache)
+
+Failure Handling:
+- A replica that fails to connect is skipped for REPLICA_RETRY_SECONDS;
+  with no healthy replica left, reads fall back to the primary
+
+Setup: add "apps.core.db_router.PrimaryReplicaRouter" to DATABASE_ROUTERS and
+ReplicaRoutingMiddleware after AuthenticationMiddleware.
+"""
+
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.utils import OperationalError
+from django.http import HttpRequest, HttpResponse
+from django.utils.functional import empty
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+
+@dataclass
+class _RequestState:
+    request: HttpRequest
+    use_replica: bool
+    pin_checked: bool = False
+
+
+_state: ContextVar[Optional[_RequestState]] = ContextVar("db_routing_state", default=None)
+_down_lock = threading.Lock()
+_down_until: Dict[str, float] = {}
+
+
+def pin_key(user_id: Any) -> str:
+    return f"db:pin:user:{user_id}"
+
+
+def replicas() -> List[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", ()))
+
+
+def mark_down(alias: str) -> None:
+    """Skip the replica for REPLICA_RETRY_SECONDS"""
+    with _down_lock:
+        _down_until[alias] = time.monotonic() + getattr(settings, "REPLICA_RETRY_SECONDS", 30)
+
+
+def mark_up(alias: str) -> None:
+    with _down_lock:
+        _down_until.pop(alias, None)
+
+
+def read_from_primary() -> None:
+    """Send the remaining reads of the current request to the primary"""
+    state = _state.get()
+    if state is not None:
+        state.use_replica = False
+
+
+def _available(alias: str) -> bool:
+    until = _down_until.get(alias)
+    if until is not None and until > time.monotonic():
+        return False
+    connection = connections[alias]
+    if connection.connection is not None:
+        return True
+    try:
+        connection.ensure_connection()
+    except OperationalError:
+        logger.warning("Replica %s unavailable, reading from the primary", alias, exc_info=True)
+        mark_down(alias)
+        return False
+    mark_up(alias)
+    return True
+
+
+def _resolved_user(request: HttpRequest) -> Any:
+    """request.user only if already resolved (never triggers a lookup)"""
+    user = request.__dict__.get("user")
+    if user is None or getattr(user, "_wrapped", None) is empty:
+        return None
+    return user
+
+
+def _pinned(state: _RequestState) -> bool:
+    """One cache read per request, once the user is known"""
+    if state.pin_checked:
+        return False
+    user = _resolved_user(state.request)
+    if user is None:
+        return False
+    state.pin_checked = True
+    if not user.is_authenticated:
+        return False
+    try:
+        return cache.get(pin_key(user.pk)) is not None
+    except Exception:  # pylint: disable=broad-except
+        return True  # Cannot prove the user has not written recently
+
+
+class PrimaryReplicaRouter:
+    """Sends request reads to a healthy replica, everything else to the primary"""
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is None or not state.use_replica:
+            return None
+        if model._meta.app_label in getattr(settings, "REPLICA_PRIMARY_APPS", ()):
+            return None
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        if _pinned(state):
+            state.use_replica = False
+            return None
+
+        candidates = replicas()
+        random.shuffle(candidates)
+        for alias in candidates:
+            if _available(alias):
+                return alias
+        return None
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        # Replicas mirror the primary, so every alias holds the same rows
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any) -> Optional[bool]:
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Marks safe-method requests as replica-eligible and pins writers
+
+    Placement: after AuthenticationMiddleware. Sync and async capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _state.set(self._start(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        self._finish(request, response)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = _state.set(self._start(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        self._finish(request, response)
+        return response
+
+    @staticmethod
+    def _start(request: HttpRequest) -> _RequestState:
+        return _RequestState(request, use_replica=bool(replicas()) and request.method in SAFE_METHODS)
+
+    @staticmethod
+    def _finish(request: HttpRequest, response: HttpResponse) -> None:
+        if request.method in SAFE_METHODS or response.status_code >= 400:
+            return
+        user = _resolved_user(request)
+        if user is None or not user.is_authenticated:
+            return
+        try:
+            cache.set(pin_key(user.pk), 1, getattr(settings, "REPLICA_PIN_SECONDS", 5))
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not pin user %s to the primary", user.pk, exc_info=True)
@@ -0,0 +1,151 @@
+# apps/core/health.py
+"""
+Dependency Probes for Health Endpoints
+
+Performance Purpose:
+- Database and cache probes run concurrently on a small dedicated pool
+- Every probe has a hard timeout, so a slow dependency never pins a worker
+- Results are memoized briefly; probe storms collapse into one check
+
+Replicas:
+- Each DATABASE_REPLICAS alias gets its own probe ("replica:<alias>");
+  results feed the router's health map, but only the primary decides
+  the HTTP status (reads fall back to it)
+
+Settings:
+- HEALTH_CHECK_TIMEOUT: Seconds to wait for all probes (default 2.0)
+- HEALTH_CHECK_CACHE_TTL: Seconds a result is reused (default 5.0)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, connections
+from django.db.utils import OperationalError
+
+from . import db_router
+
+# (payload, http status)
+HealthResult = Tuple[Dict[str, Any], int]
+
+# HARDCODED: Bounded pool - hung probes can occupy at most these threads
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="health-probe")
+_lock = threading.Lock()
+_cached: Optional[Tuple[float, HealthResult]] = None
+
+
+def probe_database() -> str:
+    """SELECT 1 on a connection opened and closed by this probe"""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        return "connected"
+    except OperationalError as e:
+        return f"database_error: {str(e)}"
+    finally:
+        # Probe threads outlive requests: never leave their thread-local connection open
+        connection.close()
+
+
+def probe_replica(alias: str) -> str:
+    """SELECT 1 on a replica, updating the router's view of it"""
+    replica = connections[alias]
+    try:
+        with replica.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except OperationalError as e:
+        db_router.mark_down(alias)
+        return f"database_error: {str(e)}"
+    finally:
+        replica.close()
+    db_router.mark_up(alias)
+    return "connected"
+
+
+def probe_cache() -> str:
+    """Round-trip a short-lived key through the default cache"""
+    try:
+        cache.set("healthcheck", "ok", timeout=1)
+        return "connected" if cache.get("healthcheck") == "ok" else "unresponsive"
+    except Exception as e:  # pylint: disable=broad-except
+        return f"cache_error: {str(e)}"
+
+
+PROBES: Dict[str, Callable[[], str]] = {
+    "database": probe_database,
+    "cache": probe_cache,
+}
+
+
+def active_probes() -> Dict[str, Callable[[], str]]:
+    """PROBES plus one probe per configured replica"""
+    probes = dict(PROBES)
+    for alias in db_router.replicas():
+        probes[f"replica:{alias}"] = partial(probe_replica, alias)
+    return probes
+
+
+def run_probes(timeout: float) -> Dict[str, str]:
+    """Run all probes concurrently, reporting stragglers as timed out"""
+    futures = {name: _executor.submit(probe) for name, probe in active_probes().items()}
+    wait(futures.values(), timeout=timeout)
+    return {
+        name: future.result() if future.done() else f"timeout after {timeout}s"
+        for name, future in futures.items()
+    }
+
+
+def cached_result() -> Optional[HealthResult]:
+    """Fresh memoized result, if any (no locking, no I/O)"""
+    cached = _cached
+    if cached is not None and time.monotonic() - cached[0] < getattr(settings, "HEALTH_CHECK_CACHE_TTL", 5.0):
+        return cached[1]
+    return None
+
+
+def readiness() -> HealthResult:
+    """Memoized dependency status (database decides the HTTP status)"""
+    global _cached
+    ttl = getattr(settings, "HEALTH_CHECK_CACHE_TTL", 5.0)
+    timeout = getattr(settings, "HEALTH_CHECK_TIMEOUT", 2.0)
+
+    cached = _cached
+    if cached is not None and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # Single flight: callers reuse the stale result while one thread refreshes;
+    # with nothing cached yet they wait at most one probe timeout
+    if cached is not None:
+        acquired = _lock.acquire(blocking=False)
+    else:
+        acquired = _lock.acquire(timeout=timeout)
+    if not acquired:
+        if cached is not None:
+            return cached[1]
+        return _build_result({name: "unresponsive" for name in active_probes()})
+
+    try:
+        cached = _cached
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        result = _build_result(run_probes(timeout))
+        _cached = (time.monotonic(), result)
+        return result
+    finally:
+        _lock.release()
+
+
+def _build_result(services: Dict[str, str]) -> HealthResult:
+    status = 200 if services.get("database") == "connected" else 503
+    return (
+        {
+            "status": "ok" if status == 200 else "degraded",
+            "services": services,
+        },
+        status,
+    )
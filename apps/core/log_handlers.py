@@ -0,0 +1,22 @@
+# apps/core/log_handlers.py
+"""
+Logging Handlers
+
+Performance Purpose:
+- Settings modules stay free of filesystem side effects: the log directory
+  is created when the first record is written, not when Django imports
+  settings (every worker boot and manage.py call)
+- Use with "delay": True so processes that never log to the file
+  (collectstatic, check, migrate) never open it
+"""
+
+import os
+from logging.handlers import RotatingFileHandler
+
+
+class LazyRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that creates its parent directory on first open"""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
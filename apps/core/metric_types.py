@@ -0,0 +1,42 @@
+# apps/core/metric_types.py
+"""
+Prometheus Metric Types with a No-Op Fallback
+
+Purpose: prometheus-client ships with requirements/prod.txt only; modules on
+         every code path (login hashing, wait_for_db in CI) must import
+         without it. Metrics become no-ops when the package is absent.
+
+Usage:
+    from apps.core.metric_types import Counter, Gauge, Histogram
+"""
+
+from typing import Any
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:  # Development / CI: base + dev requirements only
+
+    class _NoOpMetric:
+        """Accepts the prometheus_client constructor and update calls, records nothing"""
+
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass
+
+        def labels(self, *args: Any, **kwargs: Any) -> "_NoOpMetric":
+            return self
+
+        def inc(self, amount: float = 1) -> None:
+            pass
+
+        def dec(self, amount: float = 1) -> None:
+            pass
+
+        def set(self, value: float) -> None:
+            pass
+
+        def observe(self, amount: float) -> None:
+            pass
+
+    Counter = Gauge = Histogram = _NoOpMetric  # type: ignore[misc,assignment]
+
+__all__ = ["Counter", "Gauge", "Histogram"]
@@ -0,0 +1,167 @@
+# apps/core/metrics.py
+"""
+Request Instrumentation for Prometheus
+
+Purpose:
+- Per-request database query count and time, labelled by view
+- Listing cache hit/miss/not-modified counters (X-Cache header, 304s)
+- Complements django_prometheus latency histograms served at /metrics
+- Gunicorn worker lifecycle: resident memory, requests served before exit,
+  exit reasons (fed by the hooks in config/gunicorn.py)
+
+Multiprocess Notes:
+- Set PROMETHEUS_MULTIPROC_DIR before the workers start (see docker-compose)
+- prometheus_client then writes per-process files that /metrics aggregates
+- Queries issued while a StreamingHttpResponse is consumed are not counted
+- Without prometheus-client (development, CI) every metric is a no-op
+  (apps.core.metric_types)
+"""
+
+import os
+import resource
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+from apps.core.metric_types import Counter, Gauge, Histogram
+
+DB_QUERIES = Histogram(
+    "django_request_db_queries",
+    "Database queries executed per request",
+    ["view"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),  # HARDCODED: N+1 shows up in the tail
+)
+DB_SECONDS = Histogram(
+    "django_request_db_seconds",
+    "Time spent in database queries per request",
+    ["view"],
+)
+LISTING_CACHE = Counter(
+    "listings_cache_responses_total",
+    "Listing responses by cache outcome",
+    ["view", "result"],
+)
+WORKER_RSS = Gauge(
+    "gunicorn_worker_rss_bytes",
+    "Resident memory of each live worker, sampled every few requests",
+    multiprocess_mode="liveall",  # One series per pid, dropped when the worker dies
+)
+WORKER_REQUESTS = Histogram(
+    "gunicorn_worker_lifetime_requests",
+    "Requests a worker served before it exited",
+    buckets=(10, 100, 250, 500, 750, 1000, 1250, 1500, 2500, 5000, 10000),  # HARDCODED: Around GUNICORN_MAX_REQUESTS
+)
+WORKER_EXITS = Counter(
+    "gunicorn_worker_exits_total",
+    "Worker exits by reason (recycled: max_requests reached, timeout: killed by the master)",
+    ["reason"],
+)
+
+RSS_SAMPLE_EVERY = 50  # HARDCODED: Requests between memory samples; a sample is one /proc read
+
+
+class _QueryTracker:
+    """connection.execute_wrapper callable accumulating count and time"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class QueryMetricsMiddleware:
+    """
+    Records DB usage per request on every configured database alias
+
+    Placement: after authentication (so auth queries are included), before
+    django_prometheus' PrometheusAfterMiddleware. Sync and async capable.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tracker = _QueryTracker()
+        with self._tracking(tracker):
+            response = self.get_response(request)
+        return self._record(request, response, tracker)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # Async ORM calls run on the request's thread-sensitive worker thread,
+        # which owns its own connection objects: install the wrappers there
+        tracker = _QueryTracker()
+        stack = await sync_to_async(self._tracking)(tracker)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._record(request, response, tracker)
+
+    @staticmethod
+    def _tracking(tracker: _QueryTracker) -> ExitStack:
+        stack = ExitStack()
+        for conn in connections.all():
+            stack.enter_context(conn.execute_wrapper(tracker))
+        return stack
+
+    def _record(self, request: HttpRequest, response: HttpResponse, tracker: _QueryTracker) -> HttpResponse:
+        view = self._view_name(request)
+        DB_QUERIES.labels(view).observe(tracker.count)
+        DB_SECONDS.labels(view).observe(tracker.seconds)
+
+        cache_result = response.get("X-Cache")
+        if cache_result:
+            LISTING_CACHE.labels(view, cache_result.lower()).inc()
+        elif response.status_code == 304:
+            LISTING_CACHE.labels(view, "not_modified").inc()
+        return response
+
+    @staticmethod
+    def _view_name(request: HttpRequest) -> str:
+        """Route name keeps label cardinality bounded (same rule as django_prometheus)"""
+        match = getattr(request, "resolver_match", None)
+        if match is not None and match.view_name:
+            return match.view_name
+        return "<unnamed view>"
+
+
+def _rss_bytes() -> Optional[int]:
+    """Current resident set size; peak RSS where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024  # kB on Linux
+
+
+def record_worker_request(worker: Any) -> None:
+    """gunicorn post_request: sample memory so creep between recycles is visible"""
+    if worker.nr % RSS_SAMPLE_EVERY == 1:
+        WORKER_RSS.set(_rss_bytes())
+
+
+def record_worker_exit(worker: Any) -> None:
+    """gunicorn worker_exit: how long the worker lived and why it left"""
+    reason = getattr(worker, "exit_reason", None)  # Set by the worker_abort hook
+    if reason is None:
+        reason = "recycled" if worker.nr >= worker.max_requests else "shutdown"
+    WORKER_REQUESTS.observe(worker.nr)
+    WORKER_EXITS.labels(reason).inc()
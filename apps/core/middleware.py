@@ -8,14 +8,21 @@ Security Purpose:
 - Logs access attempts for security auditing
 
 Implementation Details:
-- Case-insensitive path matching
+- Case-insensitive regex matching (BLOCKED_PATH_PATTERNS are regexes)
+- Patterns compiled once at startup into a single alternation
+- Small LRU of recent path verdicts keeps the hot path near-free
 - URL-decoding validation
 - Security headers injection
 - Dedicated security logging
 """
 
 import logging
+import re
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from functools import lru_cache
+from typing import Iterable, Pattern
 from urllib.parse import unquote
+from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpResponseForbidden
 from django.conf import settings
 
@@ -31,13 +38,25 @@ class BlockGitAccessMiddleware:
     2. URL decoding detection
     3. Security headers injection
     4. Detailed attempt logging
+    
+    Sync and async capable, so ASGI deployments avoid a thread hop here.
     """
+    sync_capable = True
+    async_capable = True
     
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
         self.blocked_patterns = getattr(settings, 'BLOCKED_PATH_PATTERNS', [r'\.git'])
+        self.blocked_regex = self._compile(self.blocked_patterns)
+        # HARDCODED default: bounded, so random-path floods only cost misses
+        cache_size = getattr(settings, 'BLOCKED_PATH_CACHE_SIZE', 1024)
+        self._is_blocked = lru_cache(maxsize=cache_size)(self._match)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         try:
             return self._process_request(request)
         except Exception as e:
@@ -45,15 +64,38 @@ class BlockGitAccessMiddleware:
                                 extra={'ip': request.META.get('REMOTE_ADDR')})
             return HttpResponseForbidden()
 
+    async def __acall__(self, request):
+        """Async twin of __call__: the check itself is pure CPU"""
+        try:
+            if self._is_blocked(request.path):
+                return self._block_request(request, unquote(request.path))
+        except Exception as e:
+            security_logger.error(f"Middleware error: {str(e)}", 
+                                extra={'ip': request.META.get('REMOTE_ADDR')})
+            return HttpResponseForbidden()
+        return await self.get_response(request)
+
     def _process_request(self, request):
         """Main request processing logic with enhanced security checks"""
-        decoded_path = unquote(request.path).lower()
-        
-        if any(pattern.lower() in decoded_path for pattern in self.blocked_patterns):
-            return self._block_request(request, decoded_path)
+        if self._is_blocked(request.path):
+            return self._block_request(request, unquote(request.path))
             
         return self.get_response(request)
 
+    def _match(self, path: str) -> bool:
+        """Uncached verdict: search the decoded path with the combined regex"""
+        return self.blocked_regex.search(unquote(path)) is not None
+
+    @staticmethod
+    def _compile(patterns: Iterable[str]) -> Pattern[str]:
+        """Fold all patterns into one case-insensitive alternation"""
+        # An empty alternation would match every path; (?!) never matches
+        combined = '|'.join(f'(?:{pattern})' for pattern in patterns) or '(?!)'
+        try:
+            return re.compile(combined, re.IGNORECASE)
+        except re.error as e:
+            raise ImproperlyConfigured(f"Invalid BLOCKED_PATH_PATTERNS entry: {e}")
+
     def _block_request(self, request, decoded_path):
         """Handle blocked requests with security logging and headers"""
         client_ip = request.META.get('REMOTE_ADDR', '0.0.0.0')
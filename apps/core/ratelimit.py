@@ -0,0 +1,348 @@
+# apps/core/ratelimit.py
+"""
+Sliding-Window Rate Limiting with a Local Pre-Check
+
+Performance Purpose:
+- Every limit that applies to a request (global + per-view) is evaluated
+  in ONE Redis round-trip: a Lua script checks all windows, then counts
+  the request against all of them atomically
+- Clients far below their limit are served from an in-process token
+  bucket: the script reserves a small batch of tokens ahead, and the
+  worker spends them locally with zero network hops
+- Sliding-window counter (current window + weighted previous window):
+  O(1) memory per client, no fixed-window burst at the boundary
+
+Accuracy Notes:
+- Reserved tokens count against the client immediately, so local
+  pre-checks can only ever be stricter than the shared limit
+- Leases are only handed out below RATELIMIT_LOCAL_THRESHOLD of the limit
+  and expire after RATELIMIT_LOCAL_TTL seconds
+
+Settings:
+- RATELIMIT_RATE / RATELIMIT_KEY: global limit applied to every request
+  (empty rate disables it); RATELIMIT_EXEMPT_PATHS skips probes/metrics
+- RATELIMIT_VIEW: handler rendering the 429 response
+- RATELIMIT_USE_CACHE: cache alias; Redis runs the Lua script, any other
+  backend (development, tests) uses an equivalent in-process store
+- Redis errors fail open (request allowed, warning logged)
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisCache
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpRequest, HttpResponse
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# KEYS: per limit, current-window key then previous-window key
+# ARGV: now, then per limit: limit, window seconds, tokens to reserve ahead,
+#       reservation ceiling (reserve only while the count stays below it)
+# Returns {0, limit index, retry after} or {1, reserved_1, ..., reserved_n}
+SLIDING_WINDOW_LUA = """
+local now = tonumber(ARGV[1])
+local n = #KEYS / 2
+local counts = {}
+for i = 1, n do
+    local limit = tonumber(ARGV[4 * i - 2])
+    local window = tonumber(ARGV[4 * i - 1])
+    local current = tonumber(redis.call('GET', KEYS[2 * i - 1]) or '0')
+    local previous = tonumber(redis.call('GET', KEYS[2 * i]) or '0')
+    local elapsed = now % window
+    local count = previous * (window - elapsed) / window + current
+    if count + 1 > limit then
+        return {0, i, math.ceil(window - elapsed)}
+    end
+    counts[i] = count
+end
+local result = {1}
+for i = 1, n do
+    local window = tonumber(ARGV[4 * i - 1])
+    local reserve = tonumber(ARGV[4 * i])
+    local ceiling = tonumber(ARGV[4 * i + 1])
+    if counts[i] + 1 + reserve > ceiling then
+        reserve = 0
+    end
+    redis.call('INCRBY', KEYS[2 * i - 1], 1 + reserve)
+    redis.call('EXPIRE', KEYS[2 * i - 1], window * 2)
+    result[i + 1] = reserve
+end
+return result
+"""
+
+
+@dataclass(frozen=True)
+class Limit:
+    """A named rate such as Limit("login-ip", "ip", "10/m")"""
+    name: str
+    key: str
+    rate: str
+
+    @property
+    def parsed(self) -> Tuple[int, int]:
+        return parse_rate(self.rate)
+
+
+@dataclass(frozen=True)
+class Decision:
+    allowed: bool
+    limit: Optional[Limit] = None
+    retry_after: int = 0
+
+
+@lru_cache(maxsize=64)
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """"100/m" -> (100, 60); "5/10s" -> (5, 10)"""
+    try:
+        count, period = rate.split("/")
+        multiplier = period[:-1] or "1"
+        return int(count), int(multiplier) * UNITS[period[-1]]
+    except (ValueError, KeyError, IndexError):
+        raise ImproperlyConfigured(f"Invalid rate limit '{rate}' (expected e.g. 100/m)")
+
+
+def client_key(request: HttpRequest, spec: str) -> str:
+    """
+    Resolve a key spec for the request
+
+    ip                   REMOTE_ADDR
+    header:<name>        last comma-separated value of the header (falls back to ip);
+                         proxies append, so for X-Forwarded-For this is the address
+                         nginx saw, not one the client sent
+    post:<field>         form or JSON body field (falls back to "")
+    user                 authenticated user id, else ip
+    """
+    if spec == "ip":
+        return request.META.get("REMOTE_ADDR", "")
+    if spec.startswith("header:"):
+        meta_name = "HTTP_" + spec[7:].upper().replace("-", "_")
+        value = request.META.get(meta_name, "").rsplit(",", 1)[-1].strip()
+        return value or request.META.get("REMOTE_ADDR", "")
+    if spec.startswith("post:"):
+        return str(_body_field(request, spec[5:]))
+    if spec == "user":
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        return request.META.get("REMOTE_ADDR", "")
+    raise ImproperlyConfigured(f"Unknown rate limit key '{spec}'")
+
+
+def _body_field(request: HttpRequest, name: str) -> Any:
+    if request.method != "POST":
+        return ""
+    if request.content_type == "application/json":
+        try:
+            # request.body is cached, so DRF can still parse it afterwards
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return ""
+        return data.get(name, "") if isinstance(data, dict) else ""
+    return request.POST.get(name, "")
+
+
+class _LocalLeases:
+    """Per-process token bucket of tokens already reserved in the shared store"""
+
+    max_entries = 10000  # HARDCODED: Bounded memory; expired entries pruned first
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, Tuple[int, float]] = {}
+
+    def take(self, keys: Sequence[str], now: float) -> List[bool]:
+        """Consume one token for every key that has one (per-key result)"""
+        taken = []
+        with self._lock:
+            for key in keys:
+                tokens, expires = self._tokens.get(key, (0, 0.0))
+                if tokens > 0 and expires > now:
+                    self._tokens[key] = (tokens - 1, expires)
+                    taken.append(True)
+                else:
+                    taken.append(False)
+        return taken
+
+    def give_back(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                if key in self._tokens:
+                    tokens, expires = self._tokens[key]
+                    self._tokens[key] = (tokens + 1, expires)
+
+    def grant(self, key: str, tokens: int, expires: float, now: float) -> None:
+        with self._lock:
+            if len(self._tokens) >= self.max_entries:
+                self._tokens = {k: v for k, v in self._tokens.items() if v[1] > now and v[0] > 0}
+                if len(self._tokens) >= self.max_entries:
+                    self._tokens.clear()
+            self._tokens[key] = (tokens, expires)
+
+
+class _InProcessStore:
+    """Same algorithm as SLIDING_WINDOW_LUA for non-Redis caches"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: Dict[str, Tuple[int, float]] = {}
+
+    def evaluate(self, keys: List[str], args: List[float]) -> List[int]:
+        now = args[0]
+        with self._lock:
+            self._counts = {k: v for k, v in self._counts.items() if v[1] > now}
+            counts = []
+            for i in range(len(keys) // 2):
+                limit, window = args[4 * i + 1], args[4 * i + 2]
+                current = self._counts.get(keys[2 * i], (0, 0))[0]
+                previous = self._counts.get(keys[2 * i + 1], (0, 0))[0]
+                elapsed = now % window
+                count = previous * (window - elapsed) / window + current
+                if count + 1 > limit:
+                    return [0, i + 1, math.ceil(window - elapsed)]
+                counts.append(count)
+
+            result = [1]
+            for i, count in enumerate(counts):
+                window, reserve, ceiling = args[4 * i + 2], args[4 * i + 3], args[4 * i + 4]
+                if count + 1 + reserve > ceiling:
+                    reserve = 0
+                current = self._counts.get(keys[2 * i], (0, 0))[0]
+                self._counts[keys[2 * i]] = (current + 1 + int(reserve), now + window * 2)
+                result.append(int(reserve))
+            return result
+
+
+class RateLimiter:
+    """Evaluates a set of limits for one request with at most one store call"""
+
+    def __init__(self) -> None:
+        self.leases = _LocalLeases()
+        self._local_store = _InProcessStore()
+        self._script: Any = None
+
+    def check(self, request: HttpRequest, limits: Sequence[Limit]) -> Decision:
+        if not limits:
+            return Decision(True)
+        now = time.time()
+        buckets = [self._bucket(limit, client_key(request, limit.key)) for limit in limits]
+
+        # Local pre-check: limits whose lease still holds a token cost nothing
+        taken = self.leases.take(buckets, now)
+        remote = [(limit, bucket) for limit, bucket, hit in zip(limits, buckets, taken) if not hit]
+        if not remote:
+            return Decision(True)
+
+        keys: List[str] = []
+        args: List[float] = [now]
+        for limit, bucket in remote:
+            count, window = limit.parsed
+            index = int(now // window)
+            keys += [f"{bucket}:{index}", f"{bucket}:{index - 1}"]
+            args += [count, window, *self._lease_size(count)]
+
+        try:
+            result = self._evaluate(keys, args)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Rate limit store unavailable, allowing request", exc_info=True)
+            return Decision(True)
+
+        if not result[0]:
+            self.leases.give_back([bucket for bucket, hit in zip(buckets, taken) if hit])
+            limit = remote[int(result[1]) - 1][0]
+            return Decision(False, limit, int(result[2]))
+
+        ttl = getattr(settings, "RATELIMIT_LOCAL_TTL", 1.0)
+        for (limit, bucket), reserved in zip(remote, result[1:]):
+            if int(reserved) > 0:
+                self.leases.grant(bucket, int(reserved), now + ttl, now)
+        return Decision(True)
+
+    @staticmethod
+    def _bucket(limit: Limit, key: str) -> str:
+        return f"rl:{limit.name}:{key}"
+
+    @staticmethod
+    def _lease_size(count: int) -> Tuple[int, float]:
+        """(tokens reserved ahead, ceiling below which reserving is allowed)"""
+        fraction = getattr(settings, "RATELIMIT_LOCAL_FRACTION", 0.05)
+        threshold = getattr(settings, "RATELIMIT_LOCAL_THRESHOLD", 0.5)
+        return int(count * fraction), count * threshold
+
+    def _evaluate(self, keys: List[str], args: List[float]) -> List[Any]:
+        cache = caches[getattr(settings, "RATELIMIT_USE_CACHE", "default")]
+        if not isinstance(cache, RedisCache):
+            return self._local_store.evaluate(keys, args)
+        if self._script is None:
+            # Raw redis-py client behind Django's RedisCache; EVALSHA with
+            # automatic EVAL fallback when the script cache was flushed
+            self._script = cache._cache.get_client(write=True).register_script(SLIDING_WINDOW_LUA)
+        return self._script(keys=keys, args=args)
+
+
+limiter = RateLimiter()
+
+
+def rate_limits(*limits: Limit) -> Callable[[Callable], Callable]:
+    """Declare per-view limits; RateLimitMiddleware checks them with the global one"""
+    def decorator(view: Callable) -> Callable:
+        view.rate_limits = getattr(view, "rate_limits", ()) + limits
+        return view
+    return decorator
+
+
+class RateLimitMiddleware:
+    """
+    Applies the global limit plus the view's declared limits in process_view
+
+    Replaces django_ratelimit's middleware; a blocked request is answered by
+    RATELIMIT_VIEW with a Retry-After header.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+        rate = getattr(settings, "RATELIMIT_RATE", "")
+        key = getattr(settings, "RATELIMIT_KEY", "ip")
+        self.global_limits: Tuple[Limit, ...] = (Limit("global", key, rate),) if rate else ()
+        for limit in self.global_limits:
+            parse_rate(limit.rate)  # Fail at startup on a malformed setting
+        self.exempt = tuple(getattr(settings, "RATELIMIT_EXEMPT_PATHS", ("/health", "/metrics")))
+        self.handler = import_string(settings.RATELIMIT_VIEW)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        # Sync: the response; async: the coroutine, awaited by the handler
+        return self.get_response(request)
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> Any:
+        if request.path.startswith(self.exempt):
+            limits = tuple(getattr(view_func, "rate_limits", ()))
+        else:
+            limits = self.global_limits + tuple(getattr(view_func, "rate_limits", ()))
+        if not limits:
+            return None
+
+        # Under ASGI Django runs this sync hook through sync_to_async
+        decision = limiter.check(request, limits)
+        if decision.allowed:
+            return None
+        response = self.handler(request, decision)
+        response["Retry-After"] = str(max(decision.retry_after, 1))
+        return response
@@ -0,0 +1,172 @@
+# apps/core/schema.py
+"""
+Precomputed OpenAPI Schema
+
+Performance Purpose:
+- drf-spectacular introspects every viewset and serializer to build the
+  schema; doing that per request burns a sync worker for each crawler hit
+- The schema is built once per deploy (generate_schema command) or once
+  per process on first request, then served from memory
+- Each format is kept raw and gzip-compressed with a content-hash ETag:
+  a request costs a dict lookup, a revalidation costs a 304
+
+Files (OPENAPI_SCHEMA_DIR):
+    openapi.yaml / openapi.yaml.gz / openapi.json / openapi.json.gz
+
+Startup: drf-spectacular (and its YAML, uritemplate, extension imports)
+loads only when a schema is built or the docs page is first opened;
+workers that never serve docs never import it.
+
+Negotiation: JSON for ?format=json or an Accept header naming json,
+otherwise YAML (drf-spectacular's default).
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from django.views.decorators.http import require_GET
+
+logger = logging.getLogger(__name__)
+
+MEDIA_TYPES = {
+    "yaml": "application/vnd.oai.openapi; charset=utf-8",
+    "json": "application/vnd.oai.openapi+json; charset=utf-8",
+}
+
+
+@dataclass(frozen=True)
+class SchemaDocument:
+    body: bytes
+    compressed: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes, compressed: Optional[bytes] = None) -> "SchemaDocument":
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        # mtime=0 keeps the compressed bytes identical across builds
+        return cls(body, compressed or gzip.compress(body, compresslevel=9, mtime=0), etag)
+
+
+def build_schema() -> Dict[str, SchemaDocument]:
+    """Run drf-spectacular once and render every served format"""
+    from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    for module in getattr(settings, "OPENAPI_EXTENSION_MODULES", ()):
+        import_module(module)  # Extensions register themselves on class creation
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=spectacular_settings.SERVE_PUBLIC)
+    return {
+        "yaml": SchemaDocument.from_body(OpenApiYamlRenderer().render(schema, renderer_context={})),
+        "json": SchemaDocument.from_body(OpenApiJsonRenderer().render(schema, renderer_context={})),
+    }
+
+
+def write_schema(documents: Dict[str, SchemaDocument], directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for fmt, document in documents.items():
+        (directory / f"openapi.{fmt}").write_bytes(document.body)
+        (directory / f"openapi.{fmt}.gz").write_bytes(document.compressed)
+
+
+def read_schema(directory: Path) -> Optional[Dict[str, SchemaDocument]]:
+    """Precomputed documents, or None when any file is missing"""
+    try:
+        return {
+            fmt: SchemaDocument.from_body(
+                (directory / f"openapi.{fmt}").read_bytes(),
+                (directory / f"openapi.{fmt}.gz").read_bytes(),
+            )
+            for fmt in MEDIA_TYPES
+        }
+    except OSError:
+        return None
+
+
+_lock = threading.Lock()
+_documents: Optional[Dict[str, SchemaDocument]] = None
+
+
+def get_documents() -> Dict[str, SchemaDocument]:
+    """Memoized per process: precomputed files first, generation as fallback"""
+    global _documents
+    if _documents is None:
+        with _lock:
+            if _documents is None:
+                documents = read_schema(Path(settings.OPENAPI_SCHEMA_DIR))
+                if documents is None:
+                    logger.warning("No precomputed OpenAPI schema in %s, generating", settings.OPENAPI_SCHEMA_DIR)
+                    documents = build_schema()
+                _documents = documents
+    return _documents
+
+
+def preload_documents() -> bool:
+    """
+    Memoize the precomputed files if present (gunicorn master, preload_app)
+
+    Never generates: building would import drf-spectacular into the master
+    and every forked worker. Without files, the first docs request builds.
+    """
+    global _documents
+    with _lock:
+        if _documents is None:
+            _documents = read_schema(Path(settings.OPENAPI_SCHEMA_DIR))
+    return _documents is not None
+
+
+def reset() -> None:
+    """Forget the memoized schema (tests, after regenerating in-process)"""
+    global _documents
+    with _lock:
+        _documents = None
+
+
+def _wants_json(request: HttpRequest) -> bool:
+    return request.GET.get("format") == "json" or "json" in request.headers.get("Accept", "")
+
+
+@require_GET
+def schema_view(request: HttpRequest) -> HttpResponse:
+    """OpenAPI schema from memory, gzip-encoded when the client accepts it"""
+    fmt = "json" if _wants_json(request) else "yaml"
+    document = get_documents()[fmt]
+
+    compressed = "gzip" in request.headers.get("Accept-Encoding", "")
+    # Each content-coding is its own representation, so it gets its own tag
+    etag = document.etag[:-1] + '-gzip"' if compressed else document.etag
+
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    elif compressed:
+        response = HttpResponse(document.compressed, content_type=MEDIA_TYPES[fmt])
+        response["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(document.body, content_type=MEDIA_TYPES[fmt])
+
+    response["ETag"] = etag
+    response["Cache-Control"] = f"public, max-age={getattr(settings, 'OPENAPI_SCHEMA_MAX_AGE', 300)}"
+    patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+    return response
+
+
+_redoc: Optional[Callable[..., Any]] = None
+
+
+def redoc_view(request: HttpRequest) -> HttpResponse:
+    """ReDoc page; drf-spectacular's view is imported on the first docs hit"""
+    global _redoc
+    if _redoc is None:
+        from drf_spectacular.views import SpectacularRedocView
+        _redoc = SpectacularRedocView.as_view(url_name="schema")
+    return _redoc(request)
@@ -0,0 +1,82 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.utils import OperationalError
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core import db_router
+from apps.listings import cache as listings_cache
+from apps.listings.models import Property
+
+REPLICAS = ["replica_1", "replica_2"]
+
+
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+class PrimaryReplicaRouterTests(SimpleTestCase):
+    def setUp(self):
+        self.router = db_router.PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+        # Replica aliases are not configured here; pretend both are connected
+        patcher = mock.patch.object(db_router, "_available", return_value=True)
+        self.available = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _read_alias(self, request, model=Property):
+        token = db_router._state.set(db_router.ReplicaRoutingMiddleware._start(request))
+        try:
+            return self.router.db_for_read(model)
+        finally:
+            db_router._state.reset(token)
+
+    def test_safe_requests_read_from_a_replica(self):
+        self.assertIn(self._read_alias(self.factory.get("/api/v1/properties")), REPLICAS)
+
+    def test_writes_and_background_work_use_the_primary(self):
+        self.assertIsNone(self._read_alias(self.factory.post("/api/v1/offers")))
+        self.assertIsNone(self.router.db_for_read(Property))  # No request (commands, threads)
+        self.assertEqual(self.router.db_for_write(Property), "default")
+
+    def test_auth_models_stay_on_the_primary(self):
+        self.assertIsNone(self._read_alias(self.factory.get("/"), get_user_model()))
+
+    def test_recent_writer_is_pinned_to_the_primary(self):
+        user = mock.Mock(pk=4242, is_authenticated=True)
+        self.addCleanup(cache.delete, db_router.pin_key(user.pk))
+
+        write = self.factory.post("/api/v1/offers")
+        write.user = user
+        db_router.ReplicaRoutingMiddleware._finish(write, mock.Mock(status_code=201))
+
+        read = self.factory.get("/api/v1/properties")
+        read.user = user
+        self.assertIsNone(self._read_alias(read))
+
+    def test_listing_cache_misses_after_a_write_fill_from_the_primary(self):
+        self.addCleanup(cache.delete, listings_cache.RECENT_WRITE_KEY)
+        token = db_router._state.set(db_router.ReplicaRoutingMiddleware._start(self.factory.get("/api/v1/properties")))
+        self.addCleanup(db_router._state.reset, token)
+
+        cache.delete(listings_cache.RECENT_WRITE_KEY)
+        listings_cache.fill_from_primary_after_write()
+        self.assertIn(self.router.db_for_read(Property), REPLICAS)
+
+        listings_cache.bump_generation()  # Opens the recent-write window
+        listings_cache.fill_from_primary_after_write()
+        self.assertIsNone(self.router.db_for_read(Property))
+
+    def test_falls_back_to_primary_when_replicas_are_down(self):
+        self.available.return_value = False
+        self.assertIsNone(self._read_alias(self.factory.get("/api/v1/properties")))
+
+
+class ReplicaAvailabilityTests(SimpleTestCase):
+    def test_failed_connection_marks_replica_down(self):
+        connection = mock.Mock(connection=None)
+        connection.ensure_connection.side_effect = OperationalError("down")
+        self.addCleanup(db_router.mark_up, "replica_x")
+        with mock.patch.object(db_router, "connections", {"replica_x": connection}), \
+                self.assertLogs("apps.core.db_router", "WARNING"):
+            self.assertFalse(db_router._available("replica_x"))
+            self.assertFalse(db_router._available("replica_x"))
+        self.assertEqual(connection.ensure_connection.call_count, 1)
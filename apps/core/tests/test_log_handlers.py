@@ -0,0 +1,20 @@
+import logging
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from apps.core.log_handlers import LazyRotatingFileHandler
+
+
+class LazyRotatingFileHandlerTests(SimpleTestCase):
+    def test_directory_created_on_first_record(self):
+        with tempfile.TemporaryDirectory() as root:
+            path = Path(root) / "nested" / "app.log"
+            handler = LazyRotatingFileHandler(path, maxBytes=1024, backupCount=1, delay=True)
+            self.addCleanup(handler.close)
+            self.assertFalse(path.parent.exists())
+
+            handler.emit(logging.makeLogRecord({"msg": "hello"}))
+            handler.flush()
+            self.assertIn("hello", path.read_text())
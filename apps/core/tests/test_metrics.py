@@ -0,0 +1,74 @@
+# apps/core/tests/test_metrics.py
+import importlib.util
+import sys
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+try:
+    from prometheus_client import REGISTRY
+    from apps.core.metrics import QueryMetricsMiddleware, record_worker_exit, record_worker_request
+except ImportError:  # prometheus-client ships with requirements/prod.txt only
+    REGISTRY = None
+
+@skipUnless(REGISTRY, "prometheus-client not installed")
+class QueryMetricsMiddlewareTests(TestCase):
+    def _sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_counts_queries_per_request(self):
+        def view(request):
+            list(get_user_model().objects.all())
+            list(get_user_model().objects.all())
+            return HttpResponse("ok")
+
+        before = self._sample("django_request_db_queries_sum", view="<unnamed view>")
+        QueryMetricsMiddleware(view)(RequestFactory().get("/"))
+        after = self._sample("django_request_db_queries_sum", view="<unnamed view>")
+        self.assertEqual(after - before, 2)
+
+    def test_counts_listing_cache_outcomes(self):
+        def view(request):
+            response = HttpResponse("ok")
+            response["X-Cache"] = "HIT"
+            return response
+
+        before = self._sample("listings_cache_responses_total", view="<unnamed view>", result="hit")
+        QueryMetricsMiddleware(view)(RequestFactory().get("/"))
+        after = self._sample("listings_cache_responses_total", view="<unnamed view>", result="hit")
+        self.assertEqual(after - before, 1)
+
+
+@skipUnless(REGISTRY, "prometheus-client not installed")
+class WorkerLifecycleMetricsTests(SimpleTestCase):
+    def _exits(self, reason):
+        return REGISTRY.get_sample_value("gunicorn_worker_exits_total", {"reason": reason}) or 0
+
+    def test_exit_reasons(self):
+        before = {reason: self._exits(reason) for reason in ("recycled", "shutdown", "timeout")}
+        record_worker_exit(SimpleNamespace(nr=1003, max_requests=1003))
+        record_worker_exit(SimpleNamespace(nr=10, max_requests=1050))
+        record_worker_exit(SimpleNamespace(nr=10, max_requests=1050, exit_reason="timeout"))
+        for reason in before:
+            self.assertEqual(self._exits(reason) - before[reason], 1, reason)
+
+    def test_rss_sampled_on_first_request(self):
+        record_worker_request(SimpleNamespace(nr=1))
+        self.assertGreater(REGISTRY.get_sample_value("gunicorn_worker_rss_bytes"), 0)
+
+
+class MetricTypesFallbackTests(SimpleTestCase):
+    def test_metrics_are_no_ops_without_prometheus_client(self):
+        spec = importlib.util.find_spec("apps.core.metric_types")
+        module = importlib.util.module_from_spec(spec)
+        with mock.patch.dict(sys.modules, {"prometheus_client": None}):  # import raises ImportError
+            spec.loader.exec_module(module)
+
+        counter = module.Counter("fallback_total", "help", ["reason"])
+        counter.labels(reason="x").inc()
+        module.Gauge("fallback_gauge", "help", multiprocess_mode="livesum").dec()
+        module.Histogram("fallback_seconds", "help", buckets=(1,)).observe(0.5)
+        self.assertIs(module.Counter, module.Histogram)
@@ -0,0 +1,27 @@
+# apps/core/tests/test_middleware.py
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core.middleware import BlockGitAccessMiddleware
+
+class BlockGitAccessMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = BlockGitAccessMiddleware(lambda request: HttpResponse("ok"))
+
+    def test_blocks_configured_patterns(self):
+        for path in ("/.git/config", "/static/.GIT/HEAD", "/%252egit/HEAD", "/.env", "/index.php~"):
+            with self.subTest(path=path):
+                response = self.middleware(self.factory.get(path))
+                self.assertEqual(response.status_code, 403)
+                self.assertEqual(response["Cache-Control"], "no-store, max-age=0")
+
+    def test_allows_regular_paths(self):
+        for path in ("/api/v1/properties", "/api/v1/gitlab-sync", "/health/~user/profile"):
+            with self.subTest(path=path):
+                self.assertEqual(self.middleware(self.factory.get(path)).status_code, 200)
+
+    @override_settings(BLOCKED_PATH_PATTERNS=[])
+    def test_empty_pattern_list_blocks_nothing(self):
+        middleware = BlockGitAccessMiddleware(lambda request: HttpResponse("ok"))
+        self.assertEqual(middleware(self.factory.get("/.git/config")).status_code, 200)
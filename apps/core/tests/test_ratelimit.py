@@ -0,0 +1,84 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from apps.core.ratelimit import Limit, RateLimiter, RateLimitMiddleware, client_key, parse_rate, rate_limits
+
+
+class RateLimiterTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.limiter = RateLimiter()
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("100/m"), (100, 60))
+        self.assertEqual(parse_rate("5/10s"), (5, 10))
+
+    @override_settings(RATELIMIT_LOCAL_FRACTION=0)
+    def test_blocks_after_limit(self):
+        limit = Limit("t-block", "ip", "3/m")
+        request = self.factory.get("/", REMOTE_ADDR="10.0.0.1")
+        allowed = [self.limiter.check(request, [limit]).allowed for _ in range(4)]
+        self.assertEqual(allowed, [True, True, True, False])
+
+        decision = self.limiter.check(request, [limit])
+        self.assertEqual(decision.limit, limit)
+        self.assertGreater(decision.retry_after, 0)
+        # Other clients keep their own window
+        self.assertTrue(self.limiter.check(self.factory.get("/", REMOTE_ADDR="10.0.0.2"), [limit]).allowed)
+
+    def test_local_leases_never_exceed_limit(self):
+        limit = Limit("t-lease", "ip", "100/m")
+        request = self.factory.get("/", REMOTE_ADDR="10.0.0.3")
+        allowed = sum(self.limiter.check(request, [limit]).allowed for _ in range(150))
+        self.assertEqual(allowed, 100)
+
+    @override_settings(RATELIMIT_LOCAL_FRACTION=0)
+    def test_denied_request_counts_against_no_limit(self):
+        loose, strict = Limit("t-loose", "ip", "5/m"), Limit("t-strict", "post:username", "1/m")
+        for username in ("a", "a", "b", "c"):
+            self.limiter.check(self.factory.post("/", {"username": username}, REMOTE_ADDR="10.0.0.4"), [loose, strict])
+        # 3 allowed + 1 denied: the denial was not counted against the ip limit
+        request = self.factory.post("/", {"username": "d"}, REMOTE_ADDR="10.0.0.4")
+        self.assertTrue(self.limiter.check(request, [loose, strict]).allowed)
+
+    def test_forwarded_for_key_ignores_client_supplied_entries(self):
+        # nginx appends $remote_addr to whatever X-Forwarded-For the client sent
+        spoofed = [
+            self.factory.get("/", HTTP_X_FORWARDED_FOR=f"198.51.100.{i}, 203.0.113.7", REMOTE_ADDR="172.18.0.5")
+            for i in range(3)
+        ]
+        self.assertEqual({client_key(request, "header:x-forwarded-for") for request in spoofed}, {"203.0.113.7"})
+        self.assertEqual(client_key(self.factory.get("/", REMOTE_ADDR="172.18.0.5"), "header:x-forwarded-for"), "172.18.0.5")
+
+    @override_settings(RATELIMIT_LOCAL_FRACTION=0)
+    def test_json_body_key(self):
+        limit = Limit("t-json", "post:username", "1/m")
+        post = lambda: self.factory.post("/", '{"username": "x"}', content_type="application/json")
+        self.assertTrue(self.limiter.check(post(), [limit]).allowed)
+        self.assertFalse(self.limiter.check(post(), [limit]).allowed)
+
+
+@override_settings(RATELIMIT_RATE="2/m", RATELIMIT_KEY="ip", RATELIMIT_LOCAL_FRACTION=0)
+class RateLimitMiddlewareTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = RateLimitMiddleware(lambda request: HttpResponse("ok"))
+
+    def _process(self, path, view=lambda request: None, ip="10.1.0.1"):
+        return self.middleware.process_view(self.factory.get(path, REMOTE_ADDR=ip), view, (), {})
+
+    def test_global_limit_returns_429_with_retry_after(self):
+        self.assertIsNone(self._process("/api/v1/properties"))
+        self.assertIsNone(self._process("/api/v1/properties"))
+        response = self._process("/api/v1/properties")
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+
+    def test_probes_are_exempt(self):
+        for _ in range(3):
+            self.assertIsNone(self._process("/health/", ip="10.1.0.2"))
+
+    def test_view_limits_apply(self):
+        view = rate_limits(Limit("t-view", "ip", "1/m"))(lambda request: None)
+        self.assertIsNone(self._process("/x", view, ip="10.1.0.3"))
+        self.assertEqual(self._process("/x", view, ip="10.1.0.3").status_code, 429)
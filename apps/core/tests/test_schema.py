@@ -0,0 +1,71 @@
+import gzip
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from apps.core import schema
+
+
+class SchemaViewTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        call_command("generate_schema", output_dir=cls.directory.name, stdout=StringIO())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+        super().tearDownClass()
+
+    def setUp(self):
+        schema.reset()
+        self.addCleanup(schema.reset)
+        settings_override = override_settings(OPENAPI_SCHEMA_DIR=Path(self.directory.name))
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_serves_precomputed_files(self):
+        response = self.client.get(reverse("schema"), {"format": "json"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, (Path(self.directory.name) / "openapi.json").read_bytes())
+        self.assertIn("/api/v1/properties", response.json()["paths"])
+
+    def test_gzip_and_conditional_requests(self):
+        response = self.client.get(reverse("schema"), HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertTrue(gzip.decompress(response.content).startswith(b"openapi:"))
+
+        revalidated = self.client.get(
+            reverse("schema"), HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_generates_when_files_are_missing(self):
+        with override_settings(OPENAPI_SCHEMA_DIR=Path(self.directory.name) / "missing"), \
+                self.assertLogs("apps.core.schema", "WARNING"):
+            response = self.client.get(reverse("schema"))
+        self.assertEqual(response.status_code, 200)
+
+    def test_preload_reads_files_and_never_generates(self):
+        with mock.patch.object(schema, "build_schema") as build:
+            self.assertTrue(schema.preload_documents())
+            schema.reset()
+            with override_settings(OPENAPI_SCHEMA_DIR=Path(self.directory.name) / "missing"):
+                self.assertFalse(schema.preload_documents())
+        build.assert_not_called()
+
+    def test_extension_modules_loaded_for_build(self):
+        spec = json.loads((Path(self.directory.name) / "openapi.json").read_bytes())
+        self.assertIn("jwtAuth", spec["components"]["securitySchemes"])
+
+    def test_redoc_page(self):
+        response = self.client.get(reverse("apidocs"))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, reverse("schema"))
@@ -1,7 +1,13 @@
 # apps/core/tests/test_views.py
-from django.test import TestCase
+import time
+from unittest import mock
+
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from apps.core import health
+
+@override_settings(HEALTH_CHECK_CACHE_TTL=0)
 class HealthCheckTests(TestCase):
     def test_health_endpoint(self):
         response = self.client.get(reverse('health-check'))
@@ -10,6 +16,39 @@ class HealthCheckTests(TestCase):
             "status": "ok",
             "services": {
                 "database": "connected",
-                "cache": "enabled"
+                "cache": "connected"
             }
-        })
\ No newline at end of file
+        })
+
+    def test_liveness_endpoint(self):
+        response = self.client.get(reverse('health-live'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"status": "ok"})
+
+    @override_settings(HEALTH_CHECK_TIMEOUT=0.1)
+    def test_slow_probe_times_out(self):
+        def stalled():
+            time.sleep(0.5)
+            return "connected"
+
+        with mock.patch.dict(health.PROBES, {"database": stalled}):
+            started = time.monotonic()
+            response = self.client.get(reverse('health-ready'))
+
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["services"]["database"], "timeout after 0.1s")
+
+    @override_settings(HEALTH_CHECK_CACHE_TTL=60)
+    def test_result_is_memoized(self):
+        probe = mock.Mock(return_value="connected")
+        with mock.patch.object(health, "_cached", None), mock.patch.dict(health.PROBES, {"database": probe}):
+            self.client.get(reverse('health-check'))
+            self.client.get(reverse('health-check'))
+        probe.assert_called_once()
+
+    def test_probe_closes_its_connection(self):
+        # Probe threads outlive requests, so their connection must not linger
+        with mock.patch.object(health.connection, "close") as close:
+            self.assertEqual(health.probe_database(), "connected")
+        close.assert_called_once()
@@ -6,28 +6,29 @@ Security Considerations:
 - Exposed without authentication (by design for health checks)
 - Limited to GET requests only
 - No sensitive data exposure in responses
-- Rate limited via django-ratelimit
+- Rate limited via apps.core.ratelimit (probes and metrics are exempt)
 
 Key Functions:
 1. rate_limit_exceeded: Custom handler for 429 responses
-2. health_check: Comprehensive system status verification
+2. liveness_check: Process-only probe (no I/O)
+3. health_check: Dependency readiness verification (memoized, time-bounded)
+4. health_check_async: ASGI variant of health_check (mounted by config/asgi_urls.py)
 """
 
+from asgiref.sync import sync_to_async
 from django.http import HttpRequest, JsonResponse, HttpResponse
-from django.db import connection
-from django.db.utils import OperationalError
 from django.views.decorators.http import require_GET
-from django.core.cache import cache
 from typing import Any
 
-@require_GET
-def rate_limit_exceeded(request: HttpRequest, exception: Exception) -> JsonResponse:
+from . import health
+
+def rate_limit_exceeded(request: HttpRequest, decision: Any) -> JsonResponse:
     """
-    Custom handler for rate-limited requests
+    Custom handler for rate-limited requests (any method)
     
     Args:
         request: Incoming HTTP request
-        exception: Ratelimit exception (not used but required by Django)
+        decision: ratelimit.Decision naming the exceeded limit (not exposed)
         
     Returns:
         JsonResponse: Standardized error response with 429 status
@@ -40,14 +41,24 @@ def rate_limit_exceeded(request: HttpRequest, exception: Exception) -> JsonRespo
         status=429,
     )
 
+@require_GET
+def liveness_check(request: HttpRequest) -> JsonResponse:
+    """
+    Cheap liveness probe
+    
+    Touches no external dependency, so it stays fast even while
+    Postgres or Redis are degraded. Use for container/process checks.
+    """
+    return JsonResponse({"status": "ok"})
+
 @require_GET
 def health_check(request: HttpRequest) -> JsonResponse:
     """
-    Comprehensive system health verification
+    Comprehensive system health verification (readiness)
     
     Flow:
-    1. Database connection test
-    2. Cache service verification
+    1. Database and cache probes run concurrently with a hard timeout
+    2. Result is memoized for HEALTH_CHECK_CACHE_TTL seconds
     3. Response construction with status codes
     
     Security:
@@ -57,33 +68,24 @@ def health_check(request: HttpRequest) -> JsonResponse:
     Returns:
         JsonResponse: System status with appropriate HTTP status code
     """
-    # Database Connectivity Check
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-            db_status = "connected"
-    except OperationalError as e:
-        db_status = f"database_error: {str(e)}"
-    
-    # Cache Service Check
-    try:
-        # Test read/write capability
-        cache.set("healthcheck", "ok", timeout=1)
-        cached_value = cache.get("healthcheck")
-        cache_status = "connected" if cached_value == "ok" else "unresponsive"
-    except Exception as e:  # pylint: disable=broad-except
-        cache_status = f"cache_error: {str(e)}"
-    
-    # Determine overall system status
-    overall_status = 200 if db_status == "connected" else 503
+    payload, status = health.readiness()
+    response = JsonResponse(payload, status=status)
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+@require_GET
+async def health_check_async(request: HttpRequest) -> JsonResponse:
+    """
+    ASGI readiness check
     
-    return JsonResponse(
-        {
-            "status": "ok" if overall_status == 200 else "degraded",
-            "services": {
-                "database": db_status,
-                "cache": cache_status
-            }
-        },
-        status=overall_status
-    )
\ No newline at end of file
+    Serves the memoized result without leaving the event loop; a refresh
+    runs the bounded probes on a worker thread so the loop never blocks.
+    """
+    result = health.cached_result()
+    if result is None:
+        result = await sync_to_async(health.readiness, thread_sensitive=False)()
+    payload, status = result
+    response = JsonResponse(payload, status=status)
+    response["Cache-Control"] = "no-store"
+    return response
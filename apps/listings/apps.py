@@ -22,6 +22,5 @@ class ListingsConfig(AppConfig):
     verbose_name = _("Property Listings Management")  
 
     def ready(self):  
-        """Security Note: Disabled until signal implementation"""  
-        # Reserved for future signal registration  
-        pass  
\ No newline at end of file
+        """Register model signal handlers (listing cache invalidation)"""  
+        from apps.listings import signals  # noqa: F401  
\ No newline at end of file
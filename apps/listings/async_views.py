@@ -0,0 +1,133 @@
+# apps/listings/async_views.py
+"""
+Async (ASGI) Read Paths for Published Properties
+
+Performance Purpose:
+- Property list/retrieve without holding a worker thread per request
+- Async ORM and cache APIs, so one process overlaps many slow round-trips
+
+Compatibility:
+- Mounted only by config/asgi_urls.py (ASGI deployment); WSGI keeps the
+  DRF PropertyViewSet
+- Reuses PropertyViewSet configuration: queryset, RowSerializer fast path,
+  keyset pagination, response cache keys and ETag validators
+- Responses are JSON only (no browsable API renderer); ?stream=ndjson
+  streams the same NDJSON export as WSGI from an async iterator
+"""
+
+from typing import Any, Dict, Optional
+
+from django.http import HttpRequest, HttpResponse, HttpResponseNotAllowed
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from .conditional import Validators
+from .views import PropertyViewSet
+
+_renderer = JSONRenderer()
+
+
+def _property_view(request: HttpRequest, action: str, **kwargs: Any) -> PropertyViewSet:
+    """PropertyViewSet configured for one request, without DRF dispatch"""
+    view = PropertyViewSet(action=action, args=(), kwargs=kwargs, format_kwarg=None)
+    view.request = Request(request)
+    return view
+
+
+def _respond(request: HttpRequest, data: Any, validators: Validators, cache_hit: bool) -> HttpResponse:
+    response = HttpResponse(_renderer.render(data), content_type="application/json")
+    response["X-Cache"] = "HIT" if cache_hit else "MISS"
+    _set_validators(response, validators)
+    return response
+
+
+def _error(exc: APIException) -> HttpResponse:
+    """Same JSON error body DRF's exception handler would produce"""
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {"detail": exc.detail}
+    return HttpResponse(
+        _renderer.render(data),
+        content_type="application/json",
+        status=exc.status_code,
+    )
+
+
+def _not_modified(request: HttpRequest, validators: Validators) -> Optional[HttpResponse]:
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        _set_validators(response, validators)
+    return response
+
+
+def _set_validators(response: HttpResponse, validators: Validators) -> None:
+    etag, last_modified = validators
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+
+
+async def property_list(request: HttpRequest) -> HttpResponse:
+    """Async GET /api/v1/properties (same body and headers as the DRF view)"""
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+
+    view = _property_view(request, "list")
+    try:
+        queryset = view.filter_queryset(view.get_queryset())
+    except APIException as exc:  # e.g. malformed ?min_price
+        return _error(exc)
+
+    if view.wants_stream(view.request):
+        return view.streaming_response(view.astream_rows(queryset))
+
+    validators = await view.alist_validators(view.request, queryset)
+    not_modified = _not_modified(request, validators)
+    if not_modified is not None:
+        return not_modified
+
+    async def compute() -> Dict[str, Any]:
+        row_serializer = view.get_row_serializer()
+        paginator = view.paginator
+        page = await paginator.apaginate_queryset(row_serializer.rows(queryset), view.request)
+        return paginator.get_paginated_response(row_serializer.many(page)).data
+
+    try:
+        data, cache_hit = await view.acached_data(view.request, "list", compute)
+    except APIException as exc:  # e.g. tampered pagination cursor
+        return _error(exc)
+    return _respond(request, data, validators, cache_hit)
+
+
+async def property_detail(request: HttpRequest, pk: int) -> HttpResponse:
+    """Async GET /api/v1/properties/<pk>"""
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET", "HEAD"])
+
+    view = _property_view(request, "retrieve", pk=pk)
+    try:
+        queryset = view.filter_queryset(view.get_queryset()).filter(pk=pk)
+    except APIException as exc:  # e.g. malformed ?min_price
+        return _error(exc)
+
+    validators = await view.aretrieve_validators(view.request, queryset)
+    if validators is None:
+        return _error(NotFound("No Property matches the given query."))
+    not_modified = _not_modified(request, validators)
+    if not_modified is not None:
+        return not_modified
+
+    async def compute() -> Dict[str, Any]:
+        row_serializer = view.get_row_serializer()
+        row = await row_serializer.rows(queryset).afirst()
+        if row is None:
+            raise NotFound("No Property matches the given query.")
+        return row_serializer.to_representation(row)
+
+    try:
+        data, cache_hit = await view.acached_data(view.request, "retrieve", compute)
+    except APIException as exc:  # Row deleted between validation and fetch
+        return _error(exc)
+    return _respond(request, data, validators, cache_hit)
@@ -0,0 +1,189 @@
+# apps/listings/bulk.py
+"""
+Batch Write Endpoints for Listing ViewSets
+
+Performance Purpose:
+- One HTTP round-trip, one auth pass and one transaction for up to
+  bulk_max_items creates or updates
+- Items are validated by the viewset's serializer (many=True child), with
+  related primary keys resolved by one in_bulk() query per relation
+- Rows are written with bulk_create / bulk_update, not per-item saves
+
+API:
+- POST  <list-url>/bulk  [{...}, ...]           create, owned by the caller
+- PATCH <list-url>/bulk  [{"id": 1, ...}, ...]  partial update of own rows
+- Response: {"results": [{"index", "status", "data" | "errors"}], counts};
+  201/200 when every item succeeds, 207 when some fail, 400 when none do
+
+Note: bulk paths bypass model signals; on_bulk_write() is the hook for
+side effects such as listing cache invalidation.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import permissions, status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+HTTP_207_MULTI_STATUS = 207
+
+
+def _is_key(value: Any) -> bool:
+    """Integer primary key as sent in JSON (bool is an int subclass)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+class BulkWriteMixin:
+    """
+    ViewSet mixin adding POST/PATCH <list-url>/bulk
+
+    Subclasses set bulk_owner_field (the user foreign key filled from
+    request.user) and may override get_bulk_queryset() for update scope.
+    """
+
+    bulk_owner_field = "owner"
+    bulk_max_items = 500  # HARDCODED: Items per request
+
+    def get_permissions(self) -> List[Any]:
+        if self.action == "bulk":
+            return [permissions.IsAuthenticated()]
+        return super().get_permissions()
+
+    def get_bulk_queryset(self) -> Any:
+        """Rows the caller may update (defaults to rows they own)"""
+        model = self.get_serializer_class().Meta.model
+        return model.objects.filter(**{self.bulk_owner_field: self.request.user})
+
+    def on_bulk_write(self) -> None:
+        """Called inside the write transaction after any rows were written"""
+
+    @action(detail=False, methods=["post", "patch"], url_path="bulk")
+    def bulk(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"non_field_errors": ["Expected a non-empty list of objects."]})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({"non_field_errors": [f"At most {self.bulk_max_items} items per request."]})
+
+        if request.method == "POST":
+            return self._bulk_create(items)
+        return self._bulk_update(items)
+
+    def _bulk_create(self, items: List[Any]) -> Response:
+        child = self.get_serializer(data=items, many=True).child
+        self._prefetch_relations(child, items)
+        model = child.Meta.model
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending: List[Tuple[int, Any]] = []
+        for index, item in enumerate(items):
+            try:
+                validated = child.run_validation(item)
+            except ValidationError as exc:
+                results[index] = {"index": index, "status": "invalid", "errors": exc.detail}
+                continue
+            validated[self.bulk_owner_field] = self.request.user
+            pending.append((index, model(**validated)))
+
+        if pending:
+            with transaction.atomic():
+                model.objects.bulk_create([obj for _, obj in pending])
+                self.on_bulk_write()
+
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        for index, obj in pending:
+            results[index] = {"index": index, "status": "created", "data": serializer_class(obj, context=context).data}
+        return self._bulk_response(results, "created", status.HTTP_201_CREATED)
+
+    def _bulk_update(self, items: List[Any]) -> Response:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        ids: Dict[int, int] = {}  # request index -> primary key
+        seen = set()
+        for index, item in enumerate(items):
+            pk = item.get("id") if isinstance(item, dict) else None
+            if not _is_key(pk):
+                results[index] = {"index": index, "status": "invalid", "errors": {"id": ["An integer id is required."]}}
+            elif pk in seen:
+                results[index] = {"index": index, "status": "invalid", "errors": {"id": ["Duplicate id in request."]}}
+            else:
+                ids[index] = pk
+                seen.add(pk)
+
+        # partial is read from the root (list) serializer by every field
+        child = self.get_serializer(data=items, many=True, partial=True).child
+        self._prefetch_relations(child, [items[index] for index in ids])
+        updated: List[Tuple[int, Any]] = []
+        fields = set()
+        with transaction.atomic():
+            instances = self.get_bulk_queryset().select_for_update().in_bulk(list(ids.values()))
+            for index, pk in ids.items():
+                instance = instances.get(pk)
+                if instance is None:
+                    results[index] = {"index": index, "status": "not_found", "errors": {"id": ["Not found."]}}
+                    continue
+                child.instance = instance
+                try:
+                    validated = child.run_validation(items[index])
+                except ValidationError as exc:
+                    results[index] = {"index": index, "status": "invalid", "errors": exc.detail}
+                    continue
+                for name, value in validated.items():
+                    setattr(instance, name, value)
+                fields.update(validated)
+                updated.append((index, instance))
+
+            if updated:
+                now = timezone.now()  # bulk_update() does not apply auto_now
+                for _, instance in updated:
+                    instance.updated_at = now
+                child.Meta.model.objects.bulk_update([obj for _, obj in updated], [*fields, "updated_at"])
+                self.on_bulk_write()
+
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        for index, obj in updated:
+            results[index] = {"index": index, "status": "updated", "data": serializer_class(obj, context=context).data}
+        return self._bulk_response(results, "updated", status.HTTP_200_OK)
+
+    @staticmethod
+    def _prefetch_relations(child: Any, items: List[Any]) -> None:
+        """
+        Resolve writable primary-key relations with one in_bulk() per field
+
+        PrimaryKeyRelatedField would otherwise run queryset.get() per item;
+        unknown keys fall back to it so error messages stay identical.
+        """
+        for field in child.fields.values():
+            if not isinstance(field, PrimaryKeyRelatedField) or field.read_only:
+                continue
+            keys = {
+                item.get(field.field_name) for item in items
+                if isinstance(item, dict) and _is_key(item.get(field.field_name))
+            }
+            found = field.get_queryset().in_bulk(keys) if keys else {}
+            fallback = field.to_internal_value
+
+            def to_internal_value(data: Any, found: Dict[Any, Any] = found, fallback: Any = fallback) -> Any:
+                if _is_key(data) and data in found:
+                    return found[data]
+                return fallback(data)
+
+            field.to_internal_value = to_internal_value
+
+    @staticmethod
+    def _bulk_response(results: List[Optional[Dict[str, Any]]], success: str, success_status: int) -> Response:
+        written = sum(1 for result in results if result["status"] == success)
+        failed = len(results) - written
+        if not failed:
+            code = success_status
+        elif not written:
+            code = status.HTTP_400_BAD_REQUEST
+        else:
+            code = HTTP_207_MULTI_STATUS
+        return Response({success: written, "failed": failed, "results": results}, status=code)
@@ -0,0 +1,270 @@
+# apps/listings/cache.py
+"""
+Versioned Response Cache for Published Listings
+
+Performance Purpose:
+- Serves repeated property list/detail reads without touching Postgres
+- O(1) invalidation: one generation counter bump orphans every cached page
+- Single-flight lock so an expiry or bump does not stampede the database
+
+Implementation Details:
+- Keys embed the current generation: listings:property:v<gen>:<digest>
+- Generation is bumped from post_save/post_delete signals (see signals.py)
+- Cache outages degrade to uncached reads, never to errors
+
+Replica Consistency:
+- Entries are shared by every user, so they must never be filled from a
+  replica that has not replayed the write behind the latest bump
+- A bump first opens a recent-write window (REPLICA_PIN_SECONDS, the lag
+  bound the router already assumes); misses inside it are computed from
+  the primary, so pinned writers and everyone else get post-write pages
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.core.db_router import read_from_primary
+
+logger = logging.getLogger(__name__)
+
+GENERATION_KEY = "listings:property:generation"
+RECENT_WRITE_KEY = "listings:property:recent_write"
+_MISSING = object()
+
+
+def _seed_generation() -> int:
+    """
+    Millisecond clock seed for a missing counter
+
+    If the counter is evicted, reseeding from the clock still yields a value
+    larger than any generation handed out before, so stale keys stay orphaned.
+    """
+    return time.time_ns() // 1_000_000
+
+
+def get_generation() -> int:
+    """Current listing generation (seeded on first use)"""
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, _seed_generation(), timeout=None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+async def aget_generation() -> int:
+    """Async counterpart of get_generation (ASGI views)"""
+    generation = await cache.aget(GENERATION_KEY)
+    if generation is None:
+        await cache.aadd(GENERATION_KEY, _seed_generation(), timeout=None)
+        generation = await cache.aget(GENERATION_KEY)
+    return generation
+
+
+def bump_generation() -> None:
+    """Invalidate every cached listing response"""
+    try:
+        # Before the bump: whoever reads the new generation also sees the window
+        cache.set(RECENT_WRITE_KEY, 1, timeout=getattr(settings, "REPLICA_PIN_SECONDS", 5))
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Counter missing: a fresh clock seed is already newer than any old value
+        cache.add(GENERATION_KEY, _seed_generation(), timeout=None)
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Listing cache generation bump failed")
+
+
+def fill_from_primary_after_write() -> None:
+    """
+    Call on a miss, after reading the generation and before computing
+
+    Replicas may still lag the write that opened the window; the value is
+    about to be shared under the new generation, so read the primary.
+    """
+    if cache.get(RECENT_WRITE_KEY) is not None:
+        read_from_primary()
+
+
+async def afill_from_primary_after_write() -> None:
+    """Async counterpart of fill_from_primary_after_write"""
+    if await cache.aget(RECENT_WRITE_KEY) is not None:
+        read_from_primary()
+
+
+def memoize_versioned(name: str, compute: Callable[[], Any]) -> Any:
+    """Cache a small derived value until the next generation bump"""
+    try:
+        key = f"listings:property:v{get_generation()}:{name}"
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            fill_from_primary_after_write()
+    except Exception:  # pylint: disable=broad-except
+        return compute()
+
+    if value is _MISSING:
+        value = compute()
+        try:
+            cache.set(key, value, timeout=getattr(settings, "LISTINGS_CACHE_TIMEOUT", 300))
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Listing cache write failed", exc_info=True)
+    return value
+
+
+async def amemoize_versioned(name: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Async counterpart of memoize_versioned"""
+    try:
+        key = f"listings:property:v{await aget_generation()}:{name}"
+        value = await cache.aget(key, _MISSING)
+        if value is _MISSING:
+            await afill_from_primary_after_write()
+    except Exception:  # pylint: disable=broad-except
+        return await compute()
+
+    if value is _MISSING:
+        value = await compute()
+        try:
+            await cache.aset(key, value, timeout=getattr(settings, "LISTINGS_CACHE_TIMEOUT", 300))
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Listing cache write failed", exc_info=True)
+    return value
+
+
+class CachedResponseMixin:
+    """
+    Read-through cache for list/retrieve on public viewsets
+
+    Cache Rules:
+    - Only successful (200) responses are stored
+    - Keyed on the absolute URI so pagination links stay host-correct
+    - Misses within the recent-write window read the primary (shared entry)
+    - Concurrent misses for one key wait for a single recomputation
+    """
+
+    cache_prefix = "listings:property"
+    cache_lock_timeout = 10  # HARDCODED: Seconds a recompute may hold the lock
+    cache_lock_wait = 2.0  # HARDCODED: Seconds followers wait before computing themselves
+    cache_poll_interval = 0.05  # HARDCODED: Follower polling step
+
+    def get_cache_timeout(self) -> int:
+        return getattr(settings, "LISTINGS_CACHE_TIMEOUT", 300)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        parent = super().list
+        return self._cached(request, "list", lambda: parent(request, *args, **kwargs))
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        parent = super().retrieve
+        return self._cached(request, "retrieve", lambda: parent(request, *args, **kwargs))
+
+    def _cache_key(self, request: Request, action: str, generation: int) -> str:
+        digest = hashlib.md5(request.build_absolute_uri().encode("utf-8")).hexdigest()
+        return f"{self.cache_prefix}:v{generation}:{action}:{digest}"
+
+    def _cached(self, request: Request, action: str, compute: Callable[[], Response]) -> Response:
+        try:
+            key = self._cache_key(request, action, get_generation())
+            data = cache.get(key, _MISSING)
+            if data is _MISSING:
+                fill_from_primary_after_write()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Listing cache unavailable, serving uncached", exc_info=True)
+            return compute()
+
+        if data is not _MISSING:
+            return self._hit(data)
+
+        lock_key = f"{key}:lock"
+        try:
+            is_leader = cache.add(lock_key, 1, timeout=self.cache_lock_timeout)
+        except Exception:  # pylint: disable=broad-except
+            return compute()
+
+        if is_leader:
+            try:
+                return self._fill(key, compute)
+            finally:
+                cache.delete(lock_key)
+
+        # Another worker is recomputing this key: wait briefly for its result
+        data = self._wait_for(key)
+        if data is not _MISSING:
+            return self._hit(data)
+        return self._fill(key, compute)
+
+    def _fill(self, key: str, compute: Callable[[], Response]) -> Response:
+        response = compute()
+        if response.status_code == 200:
+            try:
+                cache.set(key, response.data, timeout=self.get_cache_timeout())
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Listing cache write failed", exc_info=True)
+        response["X-Cache"] = "MISS"
+        return response
+
+    def _wait_for(self, key: str) -> Any:
+        deadline = time.monotonic() + self.cache_lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(self.cache_poll_interval)
+            data = cache.get(key, _MISSING)
+            if data is not _MISSING:
+                return data
+        return _MISSING
+
+    async def acached_data(
+        self, request: Request, action: str, compute: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Async read-through for ASGI views: returns (data, cache_hit)
+
+        Shares keys and stored payloads with the sync path, so WSGI and ASGI
+        workers fill and reuse the same entries.
+        """
+        try:
+            key = self._cache_key(request, action, await aget_generation())
+            data = await cache.aget(key, _MISSING)
+            if data is _MISSING:
+                await afill_from_primary_after_write()
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Listing cache unavailable, serving uncached", exc_info=True)
+            return await compute(), False
+
+        if data is not _MISSING:
+            return data, True
+
+        lock_key = f"{key}:lock"
+        try:
+            is_leader = await cache.aadd(lock_key, 1, timeout=self.cache_lock_timeout)
+        except Exception:  # pylint: disable=broad-except
+            return await compute(), False
+
+        if not is_leader:
+            deadline = time.monotonic() + self.cache_lock_wait
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.cache_poll_interval)
+                data = await cache.aget(key, _MISSING)
+                if data is not _MISSING:
+                    return data, True
+
+        try:
+            data = await compute()
+            try:
+                await cache.aset(key, data, timeout=self.get_cache_timeout())
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Listing cache write failed", exc_info=True)
+            return data, False
+        finally:
+            if is_leader:
+                await cache.adelete(lock_key)
+
+    @staticmethod
+    def _hit(data: Any) -> Response:
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
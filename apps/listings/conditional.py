@@ -0,0 +1,113 @@
+# apps/listings/conditional.py
+"""
+Conditional GET Support for Listing Endpoints
+
+Performance Purpose:
+- Polling clients revalidate with If-None-Match / If-Modified-Since
+- Unchanged resources answer 304 before any serialization or cache read
+- Validators come from one cheap aggregate, never from the response body
+
+Validators:
+- list: max(updated_at) + row count of the filtered queryset, plus the URL
+- retrieve: the row's own updated_at
+"""
+
+import hashlib
+from calendar import timegm
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .cache import amemoize_versioned, memoize_versioned
+from .fastread import lookup_queryset
+
+# (etag, last_modified timestamp) - last_modified is None for empty results
+Validators = Tuple[str, Optional[int]]
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin adding ETag / Last-Modified to list and retrieve
+
+    Design Notes:
+    - Weak ETags: the representation is semantically, not byte, stable
+    - Any change to the filtered set invalidates every page of the list
+    - Missing rows fall through so the normal 404 handling applies
+    - cache_validators memoizes the aggregate until the listing generation
+      changes (only valid for querysets invalidated by cache.bump_generation)
+    """
+
+    cache_validators = False
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        queryset = self.filter_queryset(self.get_queryset())
+
+        def summarize() -> Tuple[Optional[datetime], int]:
+            summary = queryset.order_by().aggregate(last=Max("updated_at"), total=Count("pk"))
+            return summary["last"], summary["total"]
+
+        if self.cache_validators:
+            last_updated, total = memoize_versioned(self._summary_key(request), summarize)
+        else:
+            last_updated, total = summarize()
+
+        validators = self._validators(request, last_updated, total)
+        return self._conditional(request, validators, super().list, *args, **kwargs)
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        updated_at = lookup_queryset(self).values_list("updated_at", flat=True).first()
+        if updated_at is None:
+            return super().retrieve(request, *args, **kwargs)
+        validators = self._validators(request, updated_at, 1)
+        return self._conditional(request, validators, super().retrieve, *args, **kwargs)
+
+    async def alist_validators(self, request: Request, queryset: Any) -> Validators:
+        """Async counterpart of the list validators (ASGI views)"""
+        async def summarize() -> Tuple[Optional[datetime], int]:
+            summary = await queryset.order_by().aaggregate(last=Max("updated_at"), total=Count("pk"))
+            return summary["last"], summary["total"]
+
+        if self.cache_validators:
+            last_updated, total = await amemoize_versioned(self._summary_key(request), summarize)
+        else:
+            last_updated, total = await summarize()
+        return self._validators(request, last_updated, total)
+
+    async def aretrieve_validators(self, request: Request, queryset: Any) -> Optional[Validators]:
+        """Async counterpart of the detail validators; None when the row is missing"""
+        updated_at = await queryset.values_list("updated_at", flat=True).afirst()
+        if updated_at is None:
+            return None
+        return self._validators(request, updated_at, 1)
+
+    def _conditional(self, request: Request, validators: Validators, render: Any, *args: Any, **kwargs: Any) -> Any:
+        etag, last_modified = validators
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = render(request, *args, **kwargs)
+            if not isinstance(response, Response) or response.status_code != 200:
+                return response
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    @staticmethod
+    def _summary_key(request: Request) -> str:
+        digest = hashlib.md5(request.build_absolute_uri().encode("utf-8")).hexdigest()
+        return f"validators:{digest}"
+
+    @staticmethod
+    def _validators(request: Request, last_updated: Optional[datetime], total: int) -> Validators:
+        """Derive the ETag from the URL, negotiated media range and data version"""
+        stamp = last_updated.isoformat() if last_updated is not None else "empty"
+        source = "|".join((request.get_full_path(), request.META.get("HTTP_ACCEPT", ""), stamp, str(total)))
+        etag = "W/" + quote_etag(hashlib.md5(source.encode("utf-8")).hexdigest())
+        last_modified = timegm(last_updated.utctimetuple()) if last_updated is not None else None
+        return etag, last_modified
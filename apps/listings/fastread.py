@@ -0,0 +1,69 @@
+# apps/listings/fastread.py
+"""
+Fast-Path Reads for Listing ViewSets
+
+Performance Purpose:
+- list/retrieve read values_list() rows instead of model instances
+- Field converters are resolved once per request, not per row and field
+- Response bodies are identical to the regular ModelSerializer output
+
+Usage:
+- Mix in before the DRF viewset base class
+- Write actions (create/update) keep using serializer_class
+"""
+
+from typing import Any
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from django.http import Http404
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .serializers import RowSerializer
+
+
+def not_found(queryset: QuerySet) -> Http404:
+    return Http404("No %s matches the given query." % queryset.model._meta.object_name)
+
+
+def lookup_queryset(view: Any) -> QuerySet:
+    """
+    The view's filtered queryset narrowed to the URL lookup
+
+    Malformed lookup values (e.g. "abc" for an integer pk) raise Http404,
+    as get_object_or_404 does. Shared by every retrieve that bypasses
+    get_object(), so their 404s cannot drift apart.
+    """
+    lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+    queryset = view.filter_queryset(view.get_queryset())
+    try:
+        return queryset.filter(**{view.lookup_field: view.kwargs[lookup_url_kwarg]})
+    except (TypeError, ValueError, ValidationError):
+        raise not_found(queryset)
+
+
+class FastReadMixin:
+    """ViewSet mixin serving list/retrieve through RowSerializer"""
+
+    def get_row_serializer(self) -> RowSerializer:
+        return RowSerializer(self.get_serializer_class(), context=self.get_serializer_context())
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        row_serializer = self.get_row_serializer()
+        rows = row_serializer.rows(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(row_serializer.many(page))
+        return Response(row_serializer.many(rows))
+
+    def retrieve(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        row_serializer = self.get_row_serializer()
+        queryset = lookup_queryset(self)
+
+        row = row_serializer.rows(queryset).first()
+        if row is None:
+            raise not_found(queryset)
+        self.check_object_permissions(request, row)
+        return Response(row_serializer.to_representation(row))
@@ -0,0 +1,167 @@
+# apps/listings/geo.py
+"""
+Map Viewport and Radius Queries for Properties
+
+Performance Purpose:
+- Map panning costs a GiST index scan, not a full-table scan
+- Boxes compile to point(longitude, latitude) <@ box(...), the exact
+  expression of property_location_gist_idx (built-in types, no extension)
+- Radius queries seek the enclosing box first, then apply an exact
+  great-circle test to the few candidate rows
+
+Query Parameters:
+- bbox=west,south,east,north (degrees; boxes crossing the antimeridian are
+  rejected - clients split them)
+- near=lat,lon&radius_km=R (R up to MAX_RADIUS_KM)
+
+Compatibility:
+- Other databases (SQLite in development) get plain BETWEEN comparisons
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import BooleanField, F, FloatField, Func, QuerySet, Value
+from django.db.models.functions import Cos, Power, Radians, Sin
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+
+EARTH_RADIUS_KM = 6371.0088  # Mean Earth radius (IUGG)
+KM_PER_DEGREE_LAT = 111.32
+MAX_RADIUS_KM = 500.0  # HARDCODED: Wider searches should page the feed instead
+
+# (west, south, east, north)
+Box = Tuple[float, float, float, float]
+
+
+class WithinBox(Func):
+    """Boolean: the row's (longitude, latitude) lies inside the box"""
+
+    output_field = BooleanField()
+
+    def __init__(self, box: Box) -> None:
+        west, south, east, north = box
+        super().__init__(
+            F("longitude"), F("latitude"),
+            *(Value(float(edge), output_field=FloatField()) for edge in (west, south, east, north)),
+        )
+
+    def _compile_all(self, compiler: Any, connection: Any) -> Tuple[List[str], List[List[Any]]]:
+        compiled = [compiler.compile(expression) for expression in self.get_source_expressions()]
+        return [sql for sql, _ in compiled], [list(params) for _, params in compiled]
+
+    def as_sql(self, compiler: Any, connection: Any, **extra_context: Any) -> Tuple[str, List[Any]]:
+        (lon, lat, west, south, east, north), p = self._compile_all(compiler, connection)
+        sql = f"({lat} BETWEEN {south} AND {north} AND {lon} BETWEEN {west} AND {east})"
+        return sql, [*p[1], *p[3], *p[5], *p[0], *p[2], *p[4]]
+
+    def as_postgresql(self, compiler: Any, connection: Any, **extra_context: Any) -> Tuple[str, List[Any]]:
+        (lon, lat, west, south, east, north), p = self._compile_all(compiler, connection)
+        sql = f"point({lon}, {lat}) <@ box(point({west}, {south}), point({east}, {north}))"
+        return sql, [param for params in p for param in params]
+
+
+def radius_box(lat: float, lon: float, radius_km: float) -> Box:
+    """Smallest lat/lon box containing the circle (full width near the poles)"""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    south, north = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    if north >= 90.0 or south <= -90.0:
+        return (-180.0, south, 180.0, north)
+    dlon = radius_km / (KM_PER_DEGREE_LAT * math.cos(math.radians(lat)))
+    if dlon >= 180.0:
+        return (-180.0, south, 180.0, north)
+    # Clamped rather than wrapped: circles crossing the antimeridian lose
+    # their far side, matching the bbox rule above
+    return (max(lon - dlon, -180.0), south, min(lon + dlon, 180.0), north)
+
+
+def within_radius(queryset: QuerySet, lat: float, lon: float, radius_km: float) -> QuerySet:
+    """Index-backed box seek plus exact haversine test"""
+    lat1, lon1 = math.radians(lat), math.radians(lon)
+    dlat = Radians(F("latitude")) - Value(lat1)
+    dlon = Radians(F("longitude")) - Value(lon1)
+    # hav(d/R) = sin^2(dlat/2) + cos(lat1) cos(lat2) sin^2(dlon/2);
+    # comparing against hav(r/R) avoids asin/sqrt per row
+    haversine = Power(Sin(dlat / 2), 2) + Value(math.cos(lat1)) * Cos(Radians(F("latitude"))) * Power(Sin(dlon / 2), 2)
+    limit = math.sin(radius_km / (2 * EARTH_RADIUS_KM)) ** 2
+    return (
+        queryset.filter(WithinBox(radius_box(lat, lon, radius_km)))
+        .alias(_haversine=haversine)
+        .filter(_haversine__lte=limit)
+    )
+
+
+class PropertyGeoFilter(BaseFilterBackend):
+    """Applies ?bbox and ?near/?radius_km to the property queryset"""
+
+    bbox_param = "bbox"
+    near_param = "near"
+    radius_param = "radius_km"
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: Any) -> QuerySet:
+        params = request.query_params
+        bbox = self._floats(params, self.bbox_param, 4)
+        if bbox is not None:
+            west, south, east, north = bbox
+            self._check_point(self.bbox_param, south, west)
+            self._check_point(self.bbox_param, north, east)
+            if south > north or west > east:
+                raise ValidationError({self.bbox_param: "Expected west,south,east,north with west <= east and south <= north."})
+            queryset = queryset.filter(WithinBox((west, south, east, north)))
+
+        near = self._floats(params, self.near_param, 2)
+        radius = self._floats(params, self.radius_param, 1)
+        if (near is None) != (radius is None):
+            raise ValidationError({self.radius_param: f"{self.near_param} and {self.radius_param} must be given together."})
+        if near is not None:
+            lat, lon = near
+            self._check_point(self.near_param, lat, lon)
+            radius_km = radius[0]
+            if not 0 < radius_km <= MAX_RADIUS_KM:
+                raise ValidationError({self.radius_param: f"Must be greater than 0 and at most {MAX_RADIUS_KM:g}."})
+            queryset = within_radius(queryset, lat, lon, radius_km)
+        return queryset
+
+    @staticmethod
+    def _floats(params: Any, name: str, count: int) -> Optional[List[float]]:
+        raw = params.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            values = [float(part) for part in raw.split(",")]
+        except ValueError:
+            values = []
+        if len(values) != count or not all(math.isfinite(value) for value in values):
+            raise ValidationError({name: f"Expected {count} comma-separated numbers."})
+        return values
+
+    @staticmethod
+    def _check_point(name: str, lat: float, lon: float) -> None:
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            raise ValidationError({name: "Latitude must be within ±90 and longitude within ±180."})
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": self.bbox_param,
+                "required": False,
+                "in": "query",
+                "description": "Viewport as west,south,east,north (degrees)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.near_param,
+                "required": False,
+                "in": "query",
+                "description": "Radius centre as lat,lon (requires radius_km)",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.radius_param,
+                "required": False,
+                "in": "query",
+                "description": f"Radius in kilometres (max {MAX_RADIUS_KM:g})",
+                "schema": {"type": "number", "maximum": MAX_RADIUS_KM},
+            },
+        ]
@@ -0,0 +1,97 @@
+# apps/listings/management/commands/bench_serializers.py
+"""
+Serializer Throughput Micro-Benchmark
+
+Purpose: Compares PropertySerializer against the RowSerializer fast path
+Security: Pure in-memory run, never touches the database
+Flow:
+1. Build synthetic Property instances and equivalent row tuples
+2. Verify both paths render identical JSON
+3. Report best-of-N rows/sec for each path
+"""
+
+import time
+from collections import namedtuple
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any, Callable, List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.listings.models import Property
+from apps.listings.serializers import PropertySerializer, RowSerializer
+
+class Command(BaseCommand):
+    """Measure rows/sec of the ModelSerializer and values_list() read paths"""
+
+    help = "Benchmarks PropertySerializer against the RowSerializer fast path"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=10000,
+            help="Synthetic rows per run (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Runs per serializer, best is reported (default: %(default)s)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        if options["rows"] <= 0 or options["repeat"] <= 0:
+            raise CommandError("--rows and --repeat must be positive integers")
+
+        instances = self._build_instances(options["rows"])
+        fast = RowSerializer(PropertySerializer)
+        Row = namedtuple("Row", fast.columns)
+        rows = [Row(*(getattr(obj, self._attname(column)) for column in fast.columns)) for obj in instances]
+
+        renderer = JSONRenderer()
+        if renderer.render(PropertySerializer(instances, many=True).data) != renderer.render(fast.many(rows)):
+            raise CommandError("Fast path output differs from PropertySerializer")
+
+        baseline = self._measure(lambda: PropertySerializer(instances, many=True).data, options["repeat"])
+        optimized = self._measure(lambda: fast.many(rows), options["repeat"])
+
+        count = options["rows"]
+        self.stdout.write(f"PropertySerializer: {count / baseline:,.0f} rows/sec")
+        self.stdout.write(f"RowSerializer:      {count / optimized:,.0f} rows/sec")
+        self.stdout.write(self.style.SUCCESS(f"Speedup: {baseline / optimized:.1f}x"))
+
+    def _build_instances(self, count: int) -> List[Property]:
+        """Unsaved but fully populated instances (pk and timestamps set)"""
+        now = timezone.now()
+        return [
+            Property(
+                id=i,
+                owner_id=i % 50 + 1,
+                price=Decimal("50000.00") + i,
+                is_published=True,
+                created_at=now - timedelta(minutes=i),
+                updated_at=now,
+            )
+            for i in range(1, count + 1)
+        ]
+
+    @staticmethod
+    def _attname(column: str) -> str:
+        """values_list() yields raw keys for relations (owner -> owner_id)"""
+        field = Property._meta.get_field(column)
+        return field.attname
+
+    @staticmethod
+    def _measure(func: Callable[[], Any], repeat: int) -> float:
+        """Best wall time over several runs"""
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
@@ -0,0 +1,50 @@
+# apps/listings/management/commands/generate_schema.py
+"""
+OpenAPI Schema Precomputation
+
+Purpose: Build the drf-spectacular schema once per deploy instead of per request
+Security: Writes only public API metadata (same content /api/schema/ serves)
+Flow:
+1. Introspect the API once (drf-spectacular)
+2. Render YAML and JSON, each with a gzip copy
+3. Write them to OPENAPI_SCHEMA_DIR for apps.core.schema to serve
+
+Example (release step, before workers start):
+    python manage.py generate_schema
+"""
+
+import time
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.core.schema import build_schema, write_schema
+
+class Command(BaseCommand):
+    """Precompute the OpenAPI schema files"""
+
+    help = "Generates the OpenAPI schema (YAML/JSON, raw and gzip) served by /api/schema/"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "--output-dir",
+            type=str,
+            help="Target directory (default: OPENAPI_SCHEMA_DIR)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        directory = Path(options["output_dir"] or settings.OPENAPI_SCHEMA_DIR)
+        started = time.perf_counter()
+        documents = build_schema()
+        write_schema(documents, directory)
+
+        sizes = ", ".join(
+            f"{fmt} {len(doc.body):,}B -> {len(doc.compressed):,}B gzip" for fmt, doc in documents.items()
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Schema written to {directory} in {time.perf_counter() - started:.2f}s ({sizes})"
+        ))
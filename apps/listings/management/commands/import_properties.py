@@ -0,0 +1,282 @@
+# apps/listings/management/commands/import_properties.py
+"""
+Bulk Property Import
+
+Purpose: Onboard agency catalogs (tens of thousands of rows) in one run
+Security: Owners must already exist; every row is checked against the
+          Property field validators before it reaches the database
+Flow:
+1. Stream CSV or NDJSON input (file or stdin), never loading it whole
+2. Validate each batch: field validators (price floor, numeric(14,2),
+   coordinate ranges) plus one owner-existence query per batch
+3. Load valid rows with PostgreSQL COPY (or bulk_create elsewhere), one
+   transaction per batch; rejected rows go to the error report
+4. Invalidate listing caches once and report throughput
+
+Example:
+    python manage.py import_properties agency.csv --batch-size 5000 --errors rejects.ndjson
+
+Columns: owner, price, title, description, latitude, longitude, is_published
+Note: search_vector is filled by its trigger, so imported rows are searchable
+"""
+
+import csv
+import io
+import json
+import sys
+import time
+from dataclasses import dataclass, field as dataclass_field
+from decimal import Decimal
+from itertools import islice
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, connections, transaction
+from django.utils import timezone
+
+from apps.listings.cache import bump_generation
+from apps.listings.models import Property
+
+FIELDS = ("price", "title", "description", "latitude", "longitude", "is_published")
+REQUIRED = ("owner", "price")
+COPY_COLUMNS = ("owner_id", *FIELDS, "created_at", "updated_at")
+TRUE_VALUES = {"1", "true", "t", "yes", "y"}
+FALSE_VALUES = {"0", "false", "f", "no", "n"}
+
+# (line number, raw record)
+Record = Tuple[int, Dict[str, Any]]
+
+
+@dataclass
+class BatchResult:
+    loaded: int = 0
+    rejected: List[Dict[str, Any]] = dataclass_field(default_factory=list)
+
+class Command(BaseCommand):
+    """Stream, validate and bulk-load Property rows"""
+
+    help = "Imports properties from CSV or NDJSON with batched validation and COPY/bulk_create loading"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "path",
+            type=str,
+            help="Input file, or - for stdin"
+        )
+        parser.add_argument(
+            "--format",
+            choices=("csv", "ndjson"),
+            help="Input format (default: from the file extension, csv for stdin)"
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,  # HARDCODED: Rows per validation query and transaction
+            help="Rows per batch (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--method",
+            choices=("auto", "copy", "bulk"),
+            default="auto",
+            help="Load with COPY (PostgreSQL) or bulk_create; auto picks COPY when available"
+        )
+        parser.add_argument(
+            "--errors",
+            type=str,
+            help="Write rejected rows as NDJSON ({line, errors}) to this path"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate only, write nothing"
+        )
+        parser.add_argument(
+            "--db-alias",
+            type=str,
+            default="default",
+            help="Database connection alias (default: %(default)s)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        if options["batch_size"] <= 0:
+            raise CommandError("--batch-size must be a positive integer")
+
+        alias = options["db_alias"]
+        method = self._resolve_method(options["method"], alias)
+        input_format = options["format"] or ("ndjson" if options["path"].endswith((".ndjson", ".jsonl")) else "csv")
+
+        source = sys.stdin if options["path"] == "-" else open(options["path"], encoding="utf-8", newline="")
+        errors_file = open(options["errors"], "w", encoding="utf-8") if options["errors"] else None
+        loaded = rejected = 0
+        started = time.perf_counter()
+        try:
+            records = self._read(source, input_format)
+            for number, batch in enumerate(self._batches(records, options["batch_size"]), start=1):
+                result = self._process(batch, alias, method, options["dry_run"])
+                loaded += result.loaded
+                rejected += len(result.rejected)
+                for rejection in result.rejected:
+                    if errors_file is not None:
+                        errors_file.write(json.dumps(rejection) + "\n")
+                self.stdout.write(
+                    f"Batch {number}: {result.loaded} {'valid' if options['dry_run'] else 'loaded'}, "
+                    f"{len(result.rejected)} rejected"
+                )
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if errors_file is not None:
+                errors_file.close()
+            if loaded and not options["dry_run"]:
+                # bulk_create/COPY bypass post_save, so invalidate explicitly
+                bump_generation()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Validated' if options['dry_run'] else 'Imported'} {loaded} rows ({rejected} rejected) "
+            f"in {elapsed:.2f}s via {method}: {loaded / elapsed if elapsed else 0:,.0f} rows/sec"
+        ))
+
+    def _resolve_method(self, method: str, alias: str) -> str:
+        copy_available = connections[alias].vendor == "postgresql"
+        if method == "copy" and not copy_available:
+            raise CommandError("--method copy requires PostgreSQL")
+        if method == "auto":
+            return "copy" if copy_available else "bulk"
+        return method
+
+    def _read(self, source: TextIO, input_format: str) -> Iterator[Record]:
+        """Yield (line number, record) pairs without buffering the input"""
+        if input_format == "csv":
+            reader = csv.DictReader(source)
+            missing = [name for name in REQUIRED if name not in (reader.fieldnames or ())]
+            if missing:
+                raise CommandError(f"CSV header is missing required columns: {', '.join(missing)}")
+            for record in reader:
+                yield reader.line_num, record
+            return
+
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            try:
+                # Decimal keeps prices exact (floats would round numeric(14,2))
+                record = json.loads(line, parse_float=Decimal)
+            except ValueError as e:
+                record = {"__error__": f"Invalid JSON: {e}"}
+            if not isinstance(record, dict):
+                record = {"__error__": "Expected a JSON object"}
+            yield line_number, record
+
+    @staticmethod
+    def _batches(records: Iterator[Record], size: int) -> Iterator[List[Record]]:
+        while True:
+            batch = list(islice(records, size))
+            if not batch:
+                return
+            yield batch
+
+    def _process(self, batch: List[Record], alias: str, method: str, dry_run: bool) -> BatchResult:
+        result = BatchResult()
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+        for line, record in batch:
+            values, errors = self._clean(record)
+            if errors:
+                result.rejected.append({"line": line, "errors": errors})
+            else:
+                valid.append((line, values))
+
+        # One query per batch instead of one ForeignKey lookup per row
+        owner_ids = {values["owner_id"] for _, values in valid}
+        known = set(
+            get_user_model().objects.using(alias).filter(pk__in=owner_ids).values_list("pk", flat=True)
+        )
+        rows = []
+        for line, values in valid:
+            if values["owner_id"] in known:
+                rows.append(values)
+            else:
+                result.rejected.append({"line": line, "errors": {"owner": ["Unknown user id."]}})
+
+        if not rows or dry_run:
+            result.loaded = len(rows)
+            return result
+
+        try:
+            with transaction.atomic(using=alias):
+                if method == "copy":
+                    self._copy(rows, alias)
+                else:
+                    Property.objects.using(alias).bulk_create(
+                        [Property(**values) for values in rows], batch_size=len(rows)
+                    )
+        except DatabaseError as e:
+            first, last = batch[0][0], batch[-1][0]
+            result.rejected.append({"line": f"{first}-{last}", "errors": {"batch": [str(e)]}})
+            return result
+        result.loaded = len(rows)
+        return result
+
+    @staticmethod
+    def _clean(record: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[str]]]:
+        """Apply the model field validators; returns (values, errors)"""
+        if "__error__" in record:
+            return {}, {"row": [record["__error__"]]}
+
+        values: Dict[str, Any] = {}
+        errors: Dict[str, List[str]] = {}
+        for name in REQUIRED:
+            if record.get(name) in (None, ""):
+                errors[name] = ["This field is required."]
+
+        try:
+            values["owner_id"] = int(record.get("owner"))
+        except (TypeError, ValueError):
+            errors.setdefault("owner", ["A valid user id is required."])
+
+        for name in FIELDS:
+            model_field = Property._meta.get_field(name)
+            raw = record.get(name)
+            if raw in (None, "") and name not in REQUIRED:
+                values[name] = None if model_field.null else model_field.get_default()
+                continue
+            if name == "is_published" and isinstance(raw, str):
+                lowered = raw.strip().lower()
+                if lowered not in TRUE_VALUES | FALSE_VALUES:
+                    errors[name] = ["Must be true or false."]
+                    continue
+                raw = lowered in TRUE_VALUES
+            try:
+                # to_python + validators: MinValueValidator(50000), max_digits, ranges
+                values[name] = model_field.clean(raw, None)
+            except ValidationError as e:
+                errors.setdefault(name, []).extend(e.messages)
+
+        if not errors and (values["latitude"] is None) != (values["longitude"] is None):
+            errors["latitude"] = ["latitude and longitude must be given together."]
+        return values, errors
+
+    @staticmethod
+    def _copy(rows: List[Dict[str, Any]], alias: str) -> None:
+        """COPY FROM STDIN (psycopg2); one round-trip per batch"""
+        now = timezone.now()
+        buffer = io.StringIO()
+        # Strings (and None) are quoted; FORCE_NULL turns "" back into NULL
+        # for the nullable coordinates while empty titles stay empty strings
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+        for values in rows:
+            writer.writerow([values["owner_id"], *(values[name] for name in FIELDS), now.isoformat(), now.isoformat()])
+        buffer.seek(0)
+
+        connection = connections[alias]
+        quote = connection.ops.quote_name
+        sql = (
+            f"COPY {quote(Property._meta.db_table)} ({', '.join(map(quote, COPY_COLUMNS))}) "
+            f"FROM STDIN WITH (FORMAT csv, FORCE_NULL ({quote('latitude')}, {quote('longitude')}))"
+        )
+        with connection.cursor() as cursor:
+            cursor.cursor.copy_expert(sql, buffer)
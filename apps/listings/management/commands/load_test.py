@@ -0,0 +1,119 @@
+# apps/listings/management/commands/load_test.py
+"""
+HTTP Load Test for Listing Endpoints
+
+Purpose: Compare deployments (e.g. WSGI sync workers vs ASGI) under load
+Security: Only issues GET requests against the URL you pass
+Flow:
+1. Open one keep-alive connection per simulated client
+2. Fire --requests GETs spread over --concurrency clients
+3. Report throughput and latency percentiles
+
+Example:
+    python manage.py load_test --url http://127.0.0.1:8000/api/v1/properties
+"""
+
+import http.client
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+class Command(BaseCommand):
+    """Closed-loop load generator reporting rps and p50/p95/p99 latency"""
+
+    help = "Load-tests an HTTP endpoint and reports throughput and latency percentiles"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "--url",
+            type=str,
+            required=True,
+            help="Absolute http(s) URL to GET"
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Total requests to send (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Concurrent clients (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Per-request timeout in seconds (default: %(default)s)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        if options["requests"] <= 0 or options["concurrency"] <= 0:
+            raise CommandError("--requests and --concurrency must be positive integers")
+
+        target = urlsplit(options["url"])
+        if target.scheme not in ("http", "https") or not target.netloc:
+            raise CommandError("--url must be an absolute http(s) URL")
+
+        concurrency = min(options["concurrency"], options["requests"])
+        shares = [options["requests"] // concurrency] * concurrency
+        for i in range(options["requests"] % concurrency):
+            shares[i] += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda n: self._client(target, n, options["timeout"]), shares))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for client in results for latency in client[0])
+        errors = sum(client[1] for client in results)
+        self._report(latencies, errors, elapsed)
+
+    def _client(self, target: Any, count: int, timeout: float) -> Tuple[List[float], int]:
+        """One keep-alive connection issuing `count` sequential GETs"""
+        connection_class = http.client.HTTPSConnection if target.scheme == "https" else http.client.HTTPConnection
+        conn = connection_class(target.netloc, timeout=timeout)
+        path = target.path or "/"
+        if target.query:
+            path = f"{path}?{target.query}"
+
+        latencies: List[float] = []
+        errors = 0
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path, headers={"Accept": "application/json"})
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 400:
+                    errors += 1
+                else:
+                    latencies.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                conn.close()
+                conn = connection_class(target.netloc, timeout=timeout)
+        conn.close()
+        return latencies, errors
+
+    def _report(self, latencies: List[float], errors: int, elapsed: float) -> None:
+        """Standardized result output"""
+        if not latencies:
+            raise CommandError(f"All requests failed ({errors} errors)")
+
+        # quantiles() needs two points; a single sample is its own percentile
+        cuts = statistics.quantiles(latencies if len(latencies) > 1 else latencies * 2, n=100, method="inclusive")
+        self.stdout.write(f"Requests:   {len(latencies)} ok, {errors} errors in {elapsed:.2f}s")
+        self.stdout.write(f"Throughput: {len(latencies) / elapsed:,.1f} req/s")
+        self.stdout.write(
+            f"Latency:    p50 {cuts[49] * 1000:.1f}ms  p95 {cuts[94] * 1000:.1f}ms  "
+            f"p99 {cuts[98] * 1000:.1f}ms  max {latencies[-1] * 1000:.1f}ms"
+        )
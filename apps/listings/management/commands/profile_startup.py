@@ -0,0 +1,121 @@
+# apps/listings/management/commands/profile_startup.py
+"""
+Process Startup Profiler
+
+Purpose: Measure what a gunicorn worker / manage.py invocation pays before
+         serving anything, and which imports dominate it
+Security: Runs the project in child processes only; reads no data
+Flow:
+1. Spawn fresh interpreters (cold imports) running the worker boot path:
+   django.setup(), URLconf resolution, WSGI handler (middleware) creation
+2. Time each run; one extra run with `python -X importtime`
+3. Report wall-time statistics and the heaviest imports (cumulative,
+   grouped per top-level package or per module)
+
+Example:
+    python manage.py profile_startup --repeat 7 --top 20
+    python manage.py profile_startup --by module
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+BOOT_SCRIPT = (
+    "import django; django.setup(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns; "
+    "from django.core.wsgi import get_wsgi_application; get_wsgi_application()"
+)
+
+class Command(BaseCommand):
+    """Report cold-start wall time and per-module import cost"""
+
+    help = "Profiles process startup: wall time over N cold boots and import time per module"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,  # HARDCODED: Enough runs for a stable median
+            help="Cold boots to time (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=15,
+            help="Heaviest imports to list (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--by",
+            choices=("package", "module"),
+            default="package",
+            help="Group import time by top-level package or list single modules"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        if options["repeat"] <= 0:
+            raise CommandError("--repeat must be a positive integer")
+
+        timings = [self._boot() for _ in range(options["repeat"])]
+        self.stdout.write(
+            f"Cold boot over {len(timings)} runs: median {statistics.median(timings):.0f}ms, "
+            f"min {min(timings):.0f}ms, max {max(timings):.0f}ms"
+        )
+
+        imports = self._import_times()
+        rows = self._group(imports, options["by"])[:options["top"]]
+        total = sum(cumulative for _, cumulative, depth in imports if depth == 0) / 1000
+        self.stdout.write(f"Imports: {total:.0f}ms total; heaviest by {options['by']}:")
+        for name, milliseconds in rows:
+            self.stdout.write(f"  {milliseconds:8.1f}ms  {name}")
+
+    @staticmethod
+    def _run(extra: List[str]) -> subprocess.CompletedProcess:
+        result = subprocess.run(
+            [sys.executable, *extra, "-c", BOOT_SCRIPT],
+            capture_output=True, text=True, env=os.environ.copy(),
+        )
+        if result.returncode:
+            raise CommandError(f"Boot failed:\n{result.stderr[-2000:]}")
+        return result
+
+    def _boot(self) -> float:
+        started = time.perf_counter()
+        self._run([])
+        return (time.perf_counter() - started) * 1000
+
+    def _import_times(self) -> List[Tuple[str, int, int]]:
+        """(module, cumulative microseconds, nesting depth) from -X importtime"""
+        imports = []
+        for line in self._run(["-X", "importtime"]).stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            depth = (len(name) - len(name.lstrip()) - 1) // 2
+            imports.append((name.strip(), int(cumulative), depth))
+        return imports
+
+    @staticmethod
+    def _group(imports: List[Tuple[str, int, int]], by: str) -> List[Tuple[str, float]]:
+        if by == "module":
+            rows = [(name, cumulative / 1000) for name, cumulative, _ in imports]
+        else:
+            # A package's cost is the cumulative time of its outermost imports
+            totals: Dict[str, float] = defaultdict(float)
+            stack: List[str] = []
+            for name, cumulative, depth in reversed(imports):
+                del stack[depth:]
+                package = name.split(".")[0]
+                if package not in stack:
+                    totals[package] += cumulative / 1000
+                stack.append(package)
+            rows = list(totals.items())
+        return sorted(rows, key=lambda row: row[1], reverse=True)
@@ -0,0 +1,57 @@
+# apps/listings/management/commands/refresh_property_summary.py
+"""
+Property Summary Refresh
+
+Purpose: Keeps PropertySummary (dashboard statistics) current
+Security: Reads Property, writes only PropertySummary and its watermark
+Flow:
+1. Recompute groups touched since the stored updated_at watermark
+2. --full rebuilds every group (first run, after deletes/reassignments)
+3. Report changed rows, groups written/deleted and the new watermark
+
+Example (cron):
+    */5 * * * *  python manage.py refresh_property_summary
+    0 3 * * *    python manage.py refresh_property_summary --full
+"""
+
+import time
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.listings.summary import refresh_summaries
+
+class Command(BaseCommand):
+    """Incrementally refresh per-owner and per-month price statistics"""
+
+    help = "Refreshes PropertySummary from properties changed since the last run"
+
+    def add_arguments(self, parser: Any) -> None:
+        """Configure command-line parameters"""
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild every group instead of only the changed ones"
+        )
+        parser.add_argument(
+            "--overlap",
+            type=int,
+            default=300,  # HARDCODED: Longest expected write transaction
+            help="Seconds re-read below the watermark (default: %(default)s)"
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Main command execution flow"""
+        if options["overlap"] < 0:
+            raise CommandError("--overlap must not be negative")
+
+        started = time.perf_counter()
+        result = refresh_summaries(full=options["full"], overlap=timedelta(seconds=options["overlap"]))
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Full' if result.full else 'Incremental'} refresh in {elapsed:.2f}s: "
+            f"{result.changed_rows} rows scanned, {result.groups_written} groups written, "
+            f"{result.groups_deleted} removed, watermark {result.watermark}"
+        ))
@@ -1,94 +1,219 @@
 # apps/listings/management/commands/wait_for_db.py
 """
-Database Connection Readiness Check
+Dependency Readiness Gate
 
-Purpose: Ensures database availability before application startup
+Purpose: Ensures databases and caches are reachable before application startup
 Security: Contains no sensitive operations, only connection checks
 Flow:
-1. Parse command-line arguments
-2. Attempt database connection with retries
-3. Fail gracefully with timeout if unreachable
+1. Resolve dependencies: database aliases (default: all) and cache aliases
+2. Probe every dependency concurrently; each retries with exponential
+   backoff and full jitter, never sleeping past the wall-clock deadline
+3. Report per-dependency readiness time and attempts; fail with a
+   non-zero exit when anything is still down at the deadline
+
+Metrics: startup_dependency_wait_seconds{dependency,outcome} and
+startup_dependency_attempts{dependency} (merged by /metrics when
+PROMETHEUS_MULTIPROC_DIR is shared with the app; no-ops without
+prometheus-client, e.g. in CI)
+
+Example:
+    python manage.py wait_for_db --timeout 60
+    python manage.py wait_for_db --db-alias default --no-cache
 """
 
+import random
+import threading
 import time
-from typing import Any
-from django.core.management.base import BaseCommand
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.management.base import BaseCommand, CommandError
 from django.db import connections
-from django.db.utils import OperationalError, InterfaceError
+
+from apps.core.metric_types import Gauge, Histogram
+
+WAIT_SECONDS = Histogram(
+    "startup_dependency_wait_seconds",
+    "Time until a dependency answered during startup",
+    ["dependency", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),  # HARDCODED: Cold starts take seconds
+)
+ATTEMPTS = Gauge(
+    "startup_dependency_attempts",
+    "Probe attempts a dependency needed during the last startup",
+    ["dependency"],
+    multiprocess_mode="max",
+)
+
+
+@dataclass
+class ProbeResult:
+    ready: bool = False
+    attempts: int = 0
+    seconds: float = 0.0
+    error: str = ""
+
 
 class Command(BaseCommand):
-    """Wait for database availability with configurable timeout and retries"""
-    
-    help = "Ensures database connectivity before application startup"
-    
+    """Wait for every database and cache concurrently, bounded by one deadline"""
+
+    help = "Ensures database and cache connectivity before application startup"
+
     def add_arguments(self, parser: Any) -> None:
         """Configure command-line parameters"""
         parser.add_argument(
-            "--timeout", 
-            type=int,
+            "--timeout",
+            type=float,
             default=60,  # HARDCODED: Set via DJANGO_DB_WAIT_TIMEOUT in production
-            help="Maximum wait time in seconds (default: %(default)s)"
+            help="Wall-clock deadline in seconds for all dependencies (default: %(default)s)"
         )
         parser.add_argument(
             "--interval",
-            type=int,
-            default=3,  # HARDCODED: Set via DJANGO_DB_WAIT_INTERVAL if needed
-            help="Retry interval in seconds (default: %(default)s)"
+            type=float,
+            default=0.1,  # HARDCODED: First retry delay; doubles per attempt
+            help="Initial backoff in seconds (default: %(default)s)"
+        )
+        parser.add_argument(
+            "--max-interval",
+            type=float,
+            default=3,  # HARDCODED: Backoff ceiling
+            help="Maximum backoff in seconds (default: %(default)s)"
         )
         parser.add_argument(
             "--db-alias",
             type=str,
-            default="default",  # HARDCODED: Use for multi-database setups
-            help="Database connection alias (default: %(default)s)"
+            action="append",
+            help="Database alias to check; repeatable, 'all' for every alias (default: all)"
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Skip the cache (Redis) checks"
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Main command execution flow"""
         self._validate_options(options)
-        success = self._attempt_connection(
-            options["db_alias"],
-            options["timeout"],
-            options["interval"]
-        )
-        
-        if not success:
-            raise TimeoutError(f"Database unavailable after {options['timeout']}s")
+        probes: Dict[str, Callable[[], None]] = {
+            f"database:{alias}": self._database_probe(alias)
+            for alias in self._resolve_aliases(options["db_alias"])
+        }
+        if not options["no_cache"]:
+            probes.update({f"cache:{alias}": self._cache_probe(alias) for alias in settings.CACHES})
+
+        self.stdout.write(f"Checking {', '.join(probes)} (deadline {options['timeout']:g}s)...")
+        deadline = time.monotonic() + options["timeout"]
+        stop = threading.Event()
+        futures = {
+            name: self._start_probe(
+                name, probe, deadline, options["interval"], options["max_interval"], stop
+            )
+            for name, probe in probes.items()
+        }
+        wait(futures.values(), timeout=max(deadline - time.monotonic(), 0) + 0.5)
+        stop.set()  # Stragglers stop retrying
+        results = {
+            name: future.result() if future.done() else ProbeResult(error="no answer before the deadline")
+            for name, future in futures.items()
+        }
+
+        failed = self._report(results)
+        if failed:
+            raise CommandError(f"Unavailable after {options['timeout']:g}s: {', '.join(failed)}")
 
     def _validate_options(self, options: dict) -> None:
         """Ensure parameter sanity"""
         if options["timeout"] <= 0:
-            raise ValueError("Timeout must be positive integer")
-        if options["interval"] <= 0:
-            raise ValueError("Interval must be positive integer")
-
-    def _attempt_connection(self, db_alias: str, timeout: int, interval: int) -> bool:
-        """Main connection retry logic"""
-        max_attempts = timeout // interval
-        self.stdout.write(f"Checking database '{db_alias}' availability...")
-        
-        for attempt in range(1, max_attempts + 1):
-            if self._test_connection(db_alias):
-                return True
-            self._log_attempt(attempt, max_attempts, interval)
-            time.sleep(interval)
-        
-        return False
-
-    def _test_connection(self, db_alias: str) -> bool:
-        """Perform actual database connection test"""
-        try:
-            conn = connections[db_alias]
-            conn.ensure_connection()
-            if conn.is_usable():
-                self.stdout.write(self.style.SUCCESS("Database connection verified"))
-                return True
-            return False
-        except (OperationalError, InterfaceError) as e:
-            self.stdout.write(self.style.WARNING(f"Connection error: {str(e)}"))
-            return False
-
-    def _log_attempt(self, attempt: int, max_attempts: int, interval: int) -> None:
-        """Standardized attempt logging"""
-        progress = f"[{attempt}/{max_attempts}]"
-        message = f"{progress} Retrying in {interval}s..."
-        self.stdout.write(message)
\ No newline at end of file
+            raise CommandError("--timeout must be positive")
+        if options["interval"] <= 0 or options["max_interval"] < options["interval"]:
+            raise CommandError("--interval must be positive and not above --max-interval")
+
+    def _resolve_aliases(self, requested: Optional[List[str]]) -> List[str]:
+        """Expand 'all' and reject aliases missing from DATABASES"""
+        if not requested or "all" in requested:
+            return list(connections)
+        unknown = [alias for alias in requested if alias not in connections]
+        if unknown:
+            raise CommandError(f"Unknown database alias: {', '.join(unknown)}")
+        return list(dict.fromkeys(requested))
+
+    @staticmethod
+    def _database_probe(alias: str) -> Callable[[], None]:
+        def probe() -> None:
+            # Connections are per thread: open, verify, and close this one
+            connection = connections[alias]
+            try:
+                connection.ensure_connection()
+                if not connection.is_usable():
+                    raise ConnectionError("connection not usable")
+            finally:
+                connection.close()
+        return probe
+
+    @staticmethod
+    def _cache_probe(alias: str) -> Callable[[], None]:
+        def probe() -> None:
+            cache = caches[alias]
+            cache.set("wait_for_db", "ok", timeout=5)
+            if cache.get("wait_for_db") != "ok":
+                raise ConnectionError("cache did not return the written value")
+        return probe
+
+    def _start_probe(self, name: str, *args: Any) -> "Future[ProbeResult]":
+        """
+        Run _wait_for on a daemon thread
+
+        Not a ThreadPoolExecutor: the interpreter joins executor threads at
+        exit, so a connect hung past the deadline would hold the process
+        open. Daemon threads are abandoned when the command exits.
+        """
+        future: "Future[ProbeResult]" = Future()
+
+        def run() -> None:
+            try:
+                future.set_result(self._wait_for(*args))
+            except BaseException as e:  # pylint: disable=broad-except
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"wait-for-{name}", daemon=True).start()
+        return future
+
+    @staticmethod
+    def _wait_for(
+        probe: Callable[[], None], deadline: float, base: float, cap: float, stop: threading.Event
+    ) -> ProbeResult:
+        """Retry with full-jitter exponential backoff until success or the deadline"""
+        result = ProbeResult()
+        started = time.monotonic()
+        while True:
+            result.attempts += 1
+            try:
+                probe()
+                result.ready = True
+                break
+            except Exception as e:  # pylint: disable=broad-except
+                result.error = str(e).strip() or type(e).__name__
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or stop.is_set():
+                break
+            delay = random.uniform(0, min(cap, base * 2 ** (result.attempts - 1)))
+            if stop.wait(min(delay, remaining)):
+                break
+        result.seconds = time.monotonic() - started
+        return result
+
+    def _report(self, results: Dict[str, ProbeResult]) -> List[str]:
+        failed = []
+        for name, result in results.items():
+            WAIT_SECONDS.labels(dependency=name, outcome="ready" if result.ready else "timeout").observe(result.seconds)
+            ATTEMPTS.labels(dependency=name).set(result.attempts)
+            summary = f"{name}: {result.seconds:.2f}s, {result.attempts} attempt(s)"
+            if result.ready:
+                self.stdout.write(self.style.SUCCESS(f"{summary} - ready"))
+            else:
+                failed.append(name)
+                self.stdout.write(self.style.ERROR(f"{summary} - {result.error}"))
+        return failed
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.6 on 2026-10-17 13:00
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Property',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Immutable record creation timestamp (UTC)', verbose_name='Creation Timestamp')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Tracked modification timestamp (UTC)', verbose_name='Last Modified')),
+                ('price', models.DecimalField(decimal_places=2, max_digits=14, validators=[django.core.validators.MinValueValidator(50000)])),
+                ('is_published', models.BooleanField(default=False, help_text='Only published properties are exposed by the public API', verbose_name='Published')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='properties', to=settings.AUTH_USER_MODEL, verbose_name='Property Owner')),
+            ],
+            options={
+                'verbose_name': 'Property',
+                'verbose_name_plural': 'Properties',
+            },
+        ),
+        migrations.CreateModel(
+            name='Offer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='Immutable record creation timestamp (UTC)', verbose_name='Creation Timestamp')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='Tracked modification timestamp (UTC)', verbose_name='Last Modified')),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=14, validators=[django.core.validators.MinValueValidator(0)])),
+                ('buyer', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='offers', to=settings.AUTH_USER_MODEL, verbose_name='Buyer')),
+                ('property', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offers', to='listings.property', verbose_name='Property')),
+            ],
+            options={
+                'verbose_name': 'Offer',
+                'verbose_name_plural': 'Offers',
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.0.6 on 2026-10-17 13:14
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='property_search_gin_idx')
+
+# Built-in trigger: keeps search_vector in step with every write path,
+# including bulk_create and COPY, which bypass model signals
+CREATE_TRIGGER = """
+CREATE TRIGGER property_search_vector_update
+BEFORE INSERT OR UPDATE OF title, description ON listings_property
+FOR EACH ROW EXECUTE FUNCTION
+tsvector_update_trigger(search_vector, 'pg_catalog.english', title, description);
+UPDATE listings_property
+SET search_vector = to_tsvector('pg_catalog.english', title || ' ' || description);
+"""
+DROP_TRIGGER = "DROP TRIGGER IF EXISTS property_search_vector_update ON listings_property;"
+
+
+def create_search_objects(apps, schema_editor):
+    """GIN index and trigger exist on PostgreSQL only (development uses SQLite)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('listings', 'Property'), SEARCH_INDEX)
+    schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_TRIGGER)
+    schema_editor.remove_index(apps.get_model('listings', 'Property'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0002_property_published_recent_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='description',
+            field=models.TextField(blank=True, default='', verbose_name='Description'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='tsvector of title and description (trigger maintained)', null=True),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='title',
+            field=models.CharField(blank=True, default='', max_length=200, verbose_name='Title'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['price'], name='property_published_price_idx'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='property', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_objects, drop_search_objects),
+            ],
+        ),
+    ]
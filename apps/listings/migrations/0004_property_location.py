@@ -0,0 +1,54 @@
+# Generated by Django 5.0.6 on 2026-10-17 13:40
+
+import django.contrib.postgres.indexes
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+LOCATION_INDEX = django.contrib.postgres.indexes.GistIndex(models.Func(models.F('longitude'), models.F('latitude'), function='point'), condition=models.Q(('is_published', True)), name='property_location_gist_idx')
+
+
+def create_location_index(apps, schema_editor):
+    """Built-in point/box GiST support: no extension needed, PostgreSQL only"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('listings', 'Property'), LOCATION_INDEX)
+
+
+def drop_location_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('listings', 'Property'), LOCATION_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0003_property_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='Latitude'),
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='Longitude'),
+        ),
+        migrations.AddConstraint(
+            model_name='property',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('latitude__isnull', True), ('longitude__isnull', True)), models.Q(('latitude__isnull', False), ('longitude__isnull', False)), _connector='OR'), name='property_location_complete'),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='property', index=LOCATION_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_location_index, drop_location_index),
+            ],
+        ),
+    ]
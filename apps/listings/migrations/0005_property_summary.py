@@ -0,0 +1,50 @@
+# Generated by Django 5.0.6 on 2026-10-17 13:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('listings', '0004_property_location'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertySummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('owner', 'Owner'), ('month', 'Creation month')], max_length=16)),
+                ('key', models.CharField(max_length=32)),
+                ('count', models.PositiveIntegerField()),
+                ('average_price', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('median_price', models.DecimalField(decimal_places=2, max_digits=14)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Property Summary',
+                'verbose_name_plural': 'Property Summaries',
+            },
+        ),
+        migrations.CreateModel(
+            name='SummaryWatermark',
+            fields=[
+                ('name', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('value', models.DateTimeField(null=True)),
+            ],
+            options={
+                'verbose_name': 'Summary Watermark',
+                'verbose_name_plural': 'Summary Watermarks',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['updated_at'], name='property_updated_at_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='propertysummary',
+            constraint=models.UniqueConstraint(fields=('dimension', 'key'), name='property_summary_unique_key'),
+        ),
+    ]
@@ -14,8 +14,11 @@ Adds:
 """
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.core.validators import MinValueValidator
+from django.db.models import Q
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.utils.translation import gettext_lazy as _
 
 class Listing(models.Model):
@@ -44,6 +47,14 @@ class Property(Listing):
     - Owner foreign key to existing User model
     - Price validation matching PostgreSQL numeric(14,2)
     - Published state control
+
+    Location Notes:
+    - latitude/longitude are WGS84 degrees, both set or both empty
+    - A GiST index on point(longitude, latitude) serves map queries (0004)
+
+    Search Notes:
+    - search_vector is maintained by a PostgreSQL trigger (migration 0003),
+      so bulk_create/COPY paths stay searchable without signals
     """
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -56,4 +67,141 @@ class Property(Listing):
         decimal_places=2,
         validators=[MinValueValidator(50000)],  # Minimum $50k property
     )
-    # ... (other fields maintain original behavior)
\ No newline at end of file
+    is_published = models.BooleanField(
+        default=False,
+        verbose_name=_("Published"),
+        help_text=_("Only published properties are exposed by the public API")
+    )
+    title = models.CharField(
+        max_length=200,
+        blank=True,
+        default="",
+        verbose_name=_("Title")
+    )
+    description = models.TextField(
+        blank=True,
+        default="",
+        verbose_name=_("Description")
+    )
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+        verbose_name=_("Latitude")
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+        verbose_name=_("Longitude")
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text=_("tsvector of title and description (trigger maintained)")
+    )
+    # ... (other fields maintain original behavior)
+
+    class Meta:
+        verbose_name = _("Property")
+        verbose_name_plural = _("Properties")
+        indexes = [
+            # Backs the public feed: WHERE is_published ORDER BY created_at DESC, id DESC
+            # Keyset pagination seeks into this index instead of sorting the table
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='property_published_recent_idx',
+                condition=Q(is_published=True),
+            ),
+            # Price range filters on the public feed (?min_price / ?max_price)
+            models.Index(
+                fields=['price'],
+                name='property_published_price_idx',
+                condition=Q(is_published=True),
+            ),
+            # Incremental summary refresh: rows changed since the watermark
+            models.Index(fields=['updated_at'], name='property_updated_at_idx'),
+            # Full-text search (?q=); created on PostgreSQL only, see 0003
+            GinIndex(fields=['search_vector'], name='property_search_gin_idx'),
+            # Map viewport/radius queries (?bbox, ?near); PostgreSQL only, see 0004
+            GistIndex(
+                models.Func(models.F('longitude'), models.F('latitude'), function='point'),
+                name='property_location_gist_idx',
+                condition=Q(is_published=True),
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=Q(latitude__isnull=True, longitude__isnull=True)
+                | Q(latitude__isnull=False, longitude__isnull=False),
+                name='property_location_complete',
+            ),
+        ]
+
+class Offer(Listing):
+    """
+    Purchase offer placed by a buyer on a property
+
+    Security Additions:
+    - Buyer foreign key set server-side (never client supplied)
+    - Amount stored with the same numeric(14,2) precision as Property.price
+    """
+    property = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='offers',
+        verbose_name=_("Property")
+    )
+    buyer = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name='offers',
+        verbose_name=_("Buyer")
+    )
+    amount = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        validators=[MinValueValidator(0)],
+    )
+
+    class Meta:
+        verbose_name = _("Offer")
+        verbose_name_plural = _("Offers")
+
+class PropertySummary(models.Model):
+    """
+    Precomputed price statistics over published properties
+
+    One row per (dimension, key): an owner id or a UTC creation month
+    ("YYYY-MM"). Maintained by the refresh_property_summary command and
+    read by the summary endpoint with a unique-index lookup.
+    """
+    DIMENSION_OWNER = 'owner'
+    DIMENSION_MONTH = 'month'
+    DIMENSION_CHOICES = [
+        (DIMENSION_OWNER, _("Owner")),
+        (DIMENSION_MONTH, _("Creation month")),
+    ]
+
+    dimension = models.CharField(max_length=16, choices=DIMENSION_CHOICES)
+    key = models.CharField(max_length=32)
+    count = models.PositiveIntegerField()
+    average_price = models.DecimalField(max_digits=14, decimal_places=2)
+    median_price = models.DecimalField(max_digits=14, decimal_places=2)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _("Property Summary")
+        verbose_name_plural = _("Property Summaries")
+        constraints = [
+            models.UniqueConstraint(fields=['dimension', 'key'], name='property_summary_unique_key'),
+        ]
+
+class SummaryWatermark(models.Model):
+    """Highest Property.updated_at already folded into PropertySummary"""
+    name = models.CharField(max_length=64, primary_key=True)
+    value = models.DateTimeField(null=True)
+
+    class Meta:
+        verbose_name = _("Summary Watermark")
+        verbose_name_plural = _("Summary Watermarks")
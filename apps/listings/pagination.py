@@ -0,0 +1,198 @@
+# apps/listings/pagination.py
+"""
+Keyset (Cursor) Pagination for Listing Feeds
+
+Performance Purpose:
+- Seeks into the (created_at, id) index instead of OFFSET scanning
+- Page N costs the same as page 1 regardless of table size
+- Bounded page size protects workers from unbounded result sets
+
+Implementation Details:
+- Opaque base64 cursor carrying the last seen (created_at, id) key
+- Composite key comparison so timestamp ties never skip or repeat rows
+- Forward and backward navigation (next/previous links)
+"""
+
+from base64 import b64decode, b64encode
+from typing import Any, List, Optional, Tuple
+from urllib import parse
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+# (reverse, (created_at, pk)) - position is None on the first page
+KeysetCursor = Tuple[bool, Optional[Tuple[Any, int]]]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Newest-first keyset paginator keyed on (created_at, id)
+
+    Query Parameters:
+    - cursor: Opaque position token taken from next/previous links
+    - page_size: Optional page size, capped at max_page_size
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    page_size = 20  # HARDCODED: Default feed page
+    max_page_size = 100  # HARDCODED: Upper bound per request
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> List[Any]:
+        """Fetch one page (plus a sentinel row) starting after the cursor key"""
+        return self.finalize_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> List[Any]:
+        """Async counterpart of paginate_queryset (async ORM iteration)"""
+        return self.finalize_page([row async for row in self.page_queryset(queryset, request)])
+
+    def page_queryset(self, queryset: QuerySet, request: Request) -> QuerySet:
+        """Order, seek and slice the queryset for the requested cursor"""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.reverse, self.position = self.decode_cursor(request)
+
+        if self.reverse:
+            queryset = queryset.order_by('created_at', 'id')
+        else:
+            queryset = queryset.order_by('-created_at', '-id')
+
+        if self.position is not None:
+            queryset = queryset.filter(self._seek_filter(*self.position))
+
+        # One extra row tells us whether another page follows
+        return queryset[:self.page_size + 1]
+
+    def finalize_page(self, results: List[Any]) -> List[Any]:
+        """Trim the sentinel row and work out next/previous availability"""
+        self.page = results[:self.page_size]
+        has_following = len(results) > self.page_size
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = self.position is not None
+
+        return self.page
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view: Any) -> List[dict]:
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': f'Number of results per page (max {self.max_page_size}).',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+    def get_page_size(self, request: Request) -> int:
+        """Client page size, clamped to [1, max_page_size]"""
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(False, self._key(self.page[-1]))
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(True, self._key(self.page[0]))
+
+    def decode_cursor(self, request: Request) -> KeysetCursor:
+        """Parse the opaque cursor token (404 on tampering, like DRF)"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return False, None
+
+        try:
+            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            created_raw, pk_raw = tokens['p'][0].split('|', 1)
+            created_at = parse_datetime(created_raw)
+            if created_at is None:
+                raise ValueError(created_raw)
+            return reverse, (created_at, int(pk_raw))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, reverse: bool, key: Tuple[Any, int]) -> str:
+        """Build an absolute URL carrying the given cursor"""
+        tokens = {'p': f'{key[0].isoformat()}|{key[1]}'}
+        if reverse:
+            tokens['r'] = '1'
+        querystring = parse.urlencode(tokens, doseq=True)
+        encoded = b64encode(querystring.encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def _seek_filter(self, created_at: Any, pk: int) -> Q:
+        """Row-value comparison (created_at, id) < / > (cursor key)"""
+        if self.reverse:
+            return Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        return Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+
+    @staticmethod
+    def _key(instance: Any) -> Tuple[Any, int]:
+        """Works for model instances and values_list(named=True) rows"""
+        return instance.created_at, instance.id
+
+
+class PropertyCursorPagination(KeysetPagination):
+    """Public property feed pagination (see property_published_recent_idx)"""
+
+
+class SummaryCursorPagination(CursorPagination):
+    """
+    Summary rows in key order within a dimension
+
+    WHERE dimension = %s ORDER BY key seeks the (dimension, key) unique index.
+    Keys are strings, so owner ids sort lexicographically.
+    """
+    ordering = 'key'
+    page_size = 100  # HARDCODED: Summary rows per page
+    page_size_query_param = 'page_size'
+    max_page_size = 1000  # HARDCODED: Upper bound per request
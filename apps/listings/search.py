@@ -0,0 +1,186 @@
+# apps/listings/search.py
+"""
+Server-Side Property Search and Facets
+
+Performance Purpose:
+- Keyword and price filtering run in Postgres, not on downloaded feeds
+- ?q= matches the trigger-maintained search_vector through its GIN index
+- Price ranges use the partial price index on published rows
+- Facet counts (price buckets, owners) come from one grouped aggregate
+
+Query Parameters:
+- q: websearch syntax ("garden -pool", "\"sea view\"")
+- min_price / max_price: inclusive decimal bounds
+
+Compatibility:
+- Results keep the feed's keyset order (created_at, id), so cursors work
+- On SQLite (development) ?q= falls back to case-insensitive substring match
+"""
+
+import hashlib
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
+from django.db.models import Count, Q, QuerySet
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .cache import memoize_versioned
+
+# HARDCODED: Bucket edges (upper bounds, exclusive); the model floor is 50k
+DEFAULT_PRICE_BUCKETS = (100_000, 250_000, 500_000, 1_000_000)
+MAX_QUERY_LENGTH = 200  # HARDCODED: Longer keyword strings are rejected
+
+
+class PropertySearchFilter(BaseFilterBackend):
+    """Applies ?q, ?min_price and ?max_price to the property queryset"""
+
+    search_param = "q"
+    min_price_param = "min_price"
+    max_price_param = "max_price"
+
+    def filter_queryset(self, request: Request, queryset: QuerySet, view: Any) -> QuerySet:
+        params = request.query_params
+        min_price = self._price(params, self.min_price_param)
+        max_price = self._price(params, self.max_price_param)
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise ValidationError({self.min_price_param: "Must not exceed max_price."})
+
+        if min_price is not None:
+            queryset = queryset.filter(price__gte=min_price)
+        if max_price is not None:
+            queryset = queryset.filter(price__lte=max_price)
+
+        terms = params.get(self.search_param, "").strip()
+        if len(terms) > MAX_QUERY_LENGTH:
+            raise ValidationError({self.search_param: f"Must be at most {MAX_QUERY_LENGTH} characters."})
+        if terms:
+            queryset = self._search(queryset, terms)
+        return queryset
+
+    @staticmethod
+    def _search(queryset: QuerySet, terms: str) -> QuerySet:
+        if connections[queryset.db].vendor == "postgresql":
+            return queryset.filter(search_vector=SearchQuery(terms, config="english", search_type="websearch"))
+        return queryset.filter(Q(title__icontains=terms) | Q(description__icontains=terms))
+
+    @staticmethod
+    def _price(params: Any, name: str) -> Optional[Decimal]:
+        raw = params.get(name)
+        if raw in (None, ""):
+            return None
+        try:
+            value = Decimal(raw)
+        except InvalidOperation:
+            raise ValidationError({name: "A valid number is required."})
+        if not value.is_finite():
+            raise ValidationError({name: "A valid number is required."})
+        return value
+
+    def get_schema_operation_parameters(self, view: Any) -> List[Dict[str, Any]]:
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": "Full-text keywords (websearch syntax)",
+                "schema": {"type": "string", "maxLength": MAX_QUERY_LENGTH},
+            },
+            {
+                "name": self.min_price_param,
+                "required": False,
+                "in": "query",
+                "description": "Minimum price (inclusive)",
+                "schema": {"type": "number"},
+            },
+            {
+                "name": self.max_price_param,
+                "required": False,
+                "in": "query",
+                "description": "Maximum price (inclusive)",
+                "schema": {"type": "number"},
+            },
+        ]
+
+
+def price_buckets() -> List[Tuple[Optional[Decimal], Optional[Decimal]]]:
+    """[min, max) ranges between the configured edges (open at both ends)"""
+    edges: Sequence[Any] = getattr(settings, "LISTINGS_PRICE_BUCKETS", DEFAULT_PRICE_BUCKETS)
+    bounds = [None, *(Decimal(edge) for edge in edges), None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def facet_counts(queryset: QuerySet, owner_limit: int) -> Dict[str, Any]:
+    """
+    Price-bucket and owner facets in a single GROUP BY owner query
+
+    Each owner row carries its own bucket counts, so the price facet is the
+    column sum and no second scan is needed.
+    """
+    buckets = price_buckets()
+    annotations = {"total": Count("pk")}
+    for i, (low, high) in enumerate(buckets):
+        condition = Q()
+        if low is not None:
+            condition &= Q(price__gte=low)
+        if high is not None:
+            condition &= Q(price__lt=high)
+        annotations[f"bucket_{i}"] = Count("pk", filter=condition)
+
+    rows = list(queryset.order_by().values("owner").annotate(**annotations))
+    rows.sort(key=lambda row: (-row["total"], row["owner"]))
+    return {
+        "total": sum(row["total"] for row in rows),
+        "price": [
+            {
+                "min": str(low) if low is not None else None,
+                "max": str(high) if high is not None else None,
+                "count": sum(row[f"bucket_{i}"] for row in rows),
+            }
+            for i, (low, high) in enumerate(buckets)
+        ],
+        "owner": [{"owner": row["owner"], "count": row["total"]} for row in rows[:owner_limit]],
+    }
+
+
+class FacetedSearchMixin:
+    """
+    ViewSet mixin adding GET <list-url>/search/: a list page plus facets
+
+    Design Notes:
+    - The page is the regular list() response for the same query string, so
+      it shares caching, ETags and keyset cursors with the plain feed
+    - Facets ignore cursor/page_size and are memoized per filter set (every
+      other query parameter, so new filter backends are covered) until
+      the listing generation changes (requires cache.bump_generation writes)
+    """
+
+    facet_owner_limit = 20  # HARDCODED: Owners listed in the owner facet
+
+    @action(detail=False, methods=["get"])
+    def search(self, request: Request, *args: Any, **kwargs: Any) -> Any:
+        response = self.list(request, *args, **kwargs)
+        if not isinstance(response, Response) or response.status_code != 200:
+            return response  # 304, NDJSON stream or error
+
+        queryset = self.filter_queryset(self.get_queryset())
+        paging = {self.paginator.cursor_query_param, self.paginator.page_size_query_param}
+        filters = urlencode(sorted(
+            (name, values) for name, values in request.query_params.lists() if name not in paging
+        ), doseq=True)
+        digest = hashlib.md5(filters.encode("utf-8")).hexdigest()
+        response.data = {
+            **response.data,
+            "facets": memoize_versioned(
+                f"facets:{digest}",
+                lambda: facet_counts(queryset, self.facet_owner_limit),
+            ),
+        }
+        return response
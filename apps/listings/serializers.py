@@ -1,15 +1,151 @@
 # apps/listings/serializers.py
-from rest_framework import serializers
-from .models import Property, Offer
+import decimal
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import QuerySet
+from rest_framework import ISO_8601, serializers
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.settings import api_settings
+from .models import Property, PropertySummary, Offer
 
 class PropertySerializer(serializers.ModelSerializer):
     class Meta:
         model = Property
-        fields = '__all__'
+        exclude = ('search_vector',)  # Trigger-maintained index column, not API data
         read_only_fields = ('owner', 'created_at', 'updated_at')
 
+    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Mirror the property_location_complete constraint
+
+        Coordinates come as a pair or not at all; partial updates are checked
+        against the stored value. Bulk writes skip full_clean(), so without
+        this an unpaired latitude fails the whole batch with IntegrityError.
+        """
+        location = {
+            name: attrs[name] if name in attrs else getattr(self.instance, name, None)
+            for name in ('latitude', 'longitude')
+        }
+        if (location['latitude'] is None) != (location['longitude'] is None):
+            missing = 'longitude' if location['longitude'] is None else 'latitude'
+            raise serializers.ValidationError({missing: ['Latitude and longitude must be set together.']})
+        return attrs
+
 class OfferSerializer(serializers.ModelSerializer):
     class Meta:
         model = Offer
         fields = '__all__'
-        read_only_fields = ('buyer', 'created_at', 'updated_at')
\ No newline at end of file
+        read_only_fields = ('buyer', 'created_at', 'updated_at')
+
+class PropertySummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PropertySummary
+        fields = ('dimension', 'key', 'count', 'average_price', 'median_price', 'refreshed_at')
+        read_only_fields = fields
+
+class RowSerializer:
+    """
+    Read-only fast path for flat ModelSerializers
+
+    Reads rows with values_list() (no model instances, no per-field
+    attribute lookups) and applies the converters of the wrapped
+    serializer's own fields, so the output is identical to
+    ``serializer_class(instance).data``.
+
+    Only plain column fields and primary-key relations are supported;
+    anything else raises ImproperlyConfigured when the plan is built.
+    """
+
+    def __init__(self, serializer_class: type, context: Optional[Dict[str, Any]] = None):
+        serializer = serializer_class(context=context or {})
+        model = serializer.Meta.model
+        plan: List[Tuple[str, Optional[Callable[[Any], Any]]]] = []
+        columns: List[str] = []
+
+        for field in serializer.fields.values():
+            if field.write_only:
+                continue
+            columns.append(self._column_for(model, field))
+            plan.append((field.field_name, self._converter_for(field)))
+
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.plan = tuple(plan)
+
+    def rows(self, queryset: QuerySet) -> QuerySet:
+        """Named row tuples carrying exactly the columns the plan needs"""
+        return queryset.values_list(*self.columns, named=True)
+
+    def to_representation(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
+        ret = {}
+        for (name, convert), value in zip(self.plan, row):
+            # Mirrors Serializer.to_representation: None bypasses the converter
+            ret[name] = value if value is None or convert is None else convert(value)
+        return ret
+
+    def many(self, rows: Iterable[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+        return [self.to_representation(row) for row in rows]
+
+    @staticmethod
+    def _column_for(model: Any, field: serializers.Field) -> str:
+        source = field.source
+        if '.' in source or source == '*':
+            raise ImproperlyConfigured(f"RowSerializer cannot read dotted source '{source}'")
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise ImproperlyConfigured(f"RowSerializer field '{source}' is not a model column")
+        if not model_field.concrete or model_field.many_to_many:
+            raise ImproperlyConfigured(f"RowSerializer field '{source}' is not a model column")
+        return source
+
+    @staticmethod
+    def _converter_for(field: serializers.Field) -> Optional[Callable[[Any], Any]]:
+        if isinstance(field, PrimaryKeyRelatedField):
+            # values_list() already yields the raw key, i.e. value.pk
+            return field.pk_field.to_representation if field.pk_field is not None else None
+        if isinstance(field, (serializers.RelatedField, serializers.BaseSerializer)):
+            raise ImproperlyConfigured(f"RowSerializer cannot render '{field.field_name}'")
+        if isinstance(field, (serializers.IntegerField, serializers.BooleanField)):
+            return None  # Database already returns the primitive
+        if isinstance(field, serializers.DecimalField):
+            return RowSerializer._decimal_converter(field)
+        if isinstance(field, serializers.DateTimeField):
+            return RowSerializer._datetime_converter(field)
+        return field.to_representation
+
+    @staticmethod
+    def _decimal_converter(field: serializers.DecimalField) -> Callable[[Any], Any]:
+        """DecimalField.to_representation with the quantize context built once"""
+        coerce_to_string = getattr(field, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING)
+        if (not coerce_to_string or field.localize or field.normalize_output
+                or field.decimal_places is None):
+            return field.to_representation
+
+        context = decimal.getcontext().copy()
+        if field.max_digits is not None:
+            context.prec = field.max_digits
+        quantum = decimal.Decimal('.1') ** field.decimal_places
+        rounding = field.rounding
+
+        def convert(value: Any) -> str:
+            if not isinstance(value, decimal.Decimal):
+                value = decimal.Decimal(str(value).strip())
+            return '{:f}'.format(value.quantize(quantum, rounding=rounding, context=context))
+        return convert
+
+    @staticmethod
+    def _datetime_converter(field: serializers.DateTimeField) -> Callable[[Any], Any]:
+        """ISO 8601 DateTimeField.to_representation with the timezone resolved once"""
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+        if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+            return field.to_representation
+
+        def convert(value: Any) -> Any:
+            if not isinstance(value, datetime) or value.tzinfo is None:
+                return field.to_representation(value)
+            text = value.astimezone(field_timezone).isoformat()
+            return text[:-6] + 'Z' if text.endswith('+00:00') else text
+        return convert
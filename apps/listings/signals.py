@@ -0,0 +1,27 @@
+# apps/listings/signals.py
+"""
+Listing Model Signal Handlers
+
+Purpose:
+- Invalidate cached listing responses when a Property changes
+- Bump runs on transaction commit so readers never cache pre-commit state
+
+Note: QuerySet.update()/bulk_create() bypass these signals; callers of bulk
+paths must call cache.bump_generation() themselves.
+"""
+
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_generation
+from .models import Property
+
+
+@receiver(post_save, sender=Property, dispatch_uid="listings_property_saved")
+@receiver(post_delete, sender=Property, dispatch_uid="listings_property_deleted")
+def invalidate_property_cache(sender: Any, **kwargs: Any) -> None:
+    """Orphan every cached property response after the write commits"""
+    transaction.on_commit(bump_generation)
@@ -0,0 +1,183 @@
+# apps/listings/summary.py
+"""
+Incremental Refresh of Property Summary Statistics
+
+Performance Purpose:
+- Dashboards read count / average / median price per owner and per UTC
+  creation month from PropertySummary instead of aggregating Property
+- Each refresh only recomputes the groups touched by rows whose updated_at
+  passed the stored watermark (property_updated_at_idx)
+
+Flow:
+1. Lock the watermark row (one refresh at a time)
+2. Collect owners/months of rows changed since watermark - overlap
+3. Recompute those groups from published rows, streamed in price order
+4. Upsert the results, drop groups that became empty, advance the watermark
+
+Limitations:
+- Hard deletes and owner reassignment leave the old group stale until the
+  next --full run (schedule one periodically); QuerySet.update() does not
+  touch updated_at and is invisible to incremental runs
+"""
+
+import statistics
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import groupby
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Max, Q, QuerySet
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from .models import Property, PropertySummary, SummaryWatermark
+
+WATERMARK_NAME = "property_summary"
+CENTS = Decimal("0.01")
+KEY_BATCH_SIZE = 1000  # HARDCODED: Group keys per recompute query
+ITERATOR_CHUNK_SIZE = 2000  # HARDCODED: Rows per cursor round-trip
+
+
+@dataclass
+class RefreshResult:
+    """Outcome of one refresh run"""
+    full: bool
+    changed_rows: int
+    groups_written: int
+    groups_deleted: int
+    watermark: Optional[datetime]
+
+
+def month_key(value: datetime) -> str:
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m")
+
+
+def _month_range(key: str) -> Tuple[datetime, datetime]:
+    start = datetime.strptime(key, "%Y-%m").replace(tzinfo=dt_timezone.utc)
+    end = (start + timedelta(days=32)).replace(day=1)
+    return start, end
+
+
+def _statistics(prices: List[Decimal]) -> Dict[str, Any]:
+    """prices must be sorted (the queries order by price)"""
+    count = len(prices)
+    return {
+        "count": count,
+        "average_price": (sum(prices) / count).quantize(CENTS, rounding=ROUND_HALF_UP),
+        "median_price": statistics.median(prices).quantize(CENTS, rounding=ROUND_HALF_UP),
+    }
+
+
+def _grouped(rows: Iterable[Tuple[Any, Decimal]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(key, price) rows ordered by key then price -> (key, statistics)"""
+    for key, group in groupby(rows, key=lambda row: row[0]):
+        yield key, _statistics([price for _, price in group])
+
+
+def _owner_groups(published: QuerySet, owners: Optional[List[int]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    queryset = published if owners is None else published.filter(owner_id__in=owners)
+    rows = queryset.order_by("owner_id", "price").values_list("owner_id", "price")
+    for owner_id, stats in _grouped(rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE)):
+        yield str(owner_id), stats
+
+
+def _month_groups(published: QuerySet, months: Optional[List[str]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    queryset = published
+    if months is not None:
+        # Plain created_at ranges stay index-friendly (no expression filter)
+        ranges = Q()
+        for key in months:
+            start, end = _month_range(key)
+            ranges |= Q(created_at__gte=start, created_at__lt=end)
+        queryset = queryset.filter(ranges)
+    rows = (
+        queryset.annotate(month=TruncMonth("created_at", tzinfo=dt_timezone.utc))
+        .order_by("month", "price")
+        .values_list("month", "price")
+    )
+    for month, stats in _grouped(rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE)):
+        yield month_key(month), stats
+
+
+def _batches(keys: Set[Any]) -> Iterator[List[Any]]:
+    ordered = sorted(keys)
+    for start in range(0, len(ordered), KEY_BATCH_SIZE):
+        yield ordered[start:start + KEY_BATCH_SIZE]
+
+
+def _write(dimension: str, groups: Iterable[Tuple[str, Dict[str, Any]]]) -> Set[str]:
+    """Upsert groups on the (dimension, key) constraint; returns written keys"""
+    objects = [PropertySummary(dimension=dimension, key=key, **stats) for key, stats in groups]
+    PropertySummary.objects.bulk_create(
+        objects,
+        batch_size=KEY_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["dimension", "key"],
+        update_fields=["count", "average_price", "median_price", "refreshed_at"],
+    )
+    return {obj.key for obj in objects}
+
+
+def refresh_summaries(full: bool = False, overlap: timedelta = timedelta(minutes=5)) -> RefreshResult:
+    """
+    Bring PropertySummary up to date
+
+    overlap re-reads rows just below the watermark, so transactions that
+    committed late with an older updated_at are not skipped. Recomputing a
+    group is idempotent, so the overlap only costs time.
+    """
+    published = Property.objects.filter(is_published=True)
+    with transaction.atomic():
+        watermark, _ = SummaryWatermark.objects.select_for_update().get_or_create(name=WATERMARK_NAME)
+        full = full or watermark.value is None
+
+        if full:
+            new_watermark = Property.objects.aggregate(last=Max("updated_at"))["last"]
+            changed_rows = published.count()
+            owners: Optional[Set[int]] = None
+            months: Optional[Set[str]] = None
+        else:
+            owners, months = set(), set()
+            changed_rows = 0
+            new_watermark = watermark.value
+            # All rows, not only published ones: unpublishing changes a group too
+            changed = Property.objects.filter(updated_at__gt=watermark.value - overlap)
+            for owner_id, created_at, updated_at in changed.values_list(
+                "owner_id", "created_at", "updated_at"
+            ).iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+                changed_rows += 1
+                owners.add(owner_id)
+                months.add(month_key(created_at))
+                new_watermark = max(new_watermark, updated_at)
+
+        started = timezone.now()
+        written = deleted = 0
+        for dimension, keys, compute in (
+            (PropertySummary.DIMENSION_OWNER, owners, _owner_groups),
+            (PropertySummary.DIMENSION_MONTH, months, _month_groups),
+        ):
+            stale = PropertySummary.objects.filter(dimension=dimension)
+            if keys is None:
+                written += len(_write(dimension, compute(published, None)))
+                # Every live group was just rewritten; anything older is gone
+                deleted += stale.filter(refreshed_at__lt=started).delete()[0]
+                continue
+            for batch in _batches(keys):
+                kept = _write(dimension, compute(published, batch))
+                gone = {str(key) for key in batch} - kept
+                if gone:
+                    deleted += stale.filter(key__in=gone).delete()[0]
+                written += len(kept)
+
+        watermark.value = new_watermark
+        watermark.save(update_fields=["value"])
+
+    return RefreshResult(
+        full=full,
+        changed_rows=changed_rows,
+        groups_written=written,
+        groups_deleted=deleted,
+        watermark=new_watermark,
+    )
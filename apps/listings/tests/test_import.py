@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from apps.listings.cache import get_generation
+from apps.listings.models import Property
+
+
+class ImportPropertiesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="agency", password="pw")
+
+    def _write(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command("import_properties", *args, stdout=out)
+        return out.getvalue()
+
+    def test_csv_import_loads_valid_rows_and_reports_rejects(self):
+        path = self._write(".csv", (
+            "owner,price,title,latitude,longitude,is_published\n"
+            f"{self.owner.pk},150000.00,Loft,48.85,2.35,true\n"
+            f"{self.owner.pk},49999.99,Too cheap,,,true\n"
+            f"{self.owner.pk},123.456,Bad precision,,,false\n"
+            "999999,200000,Ghost owner,,,true\n"
+            f"{self.owner.pk},250000,Half located,48.85,,true\n"
+            f"{self.owner.pk},300000,Plain,,,no\n"
+        ))
+        errors_path = self._write(".ndjson", "")
+        generation = get_generation()
+
+        output = self._run(path, "--batch-size", "4", "--errors", errors_path)
+
+        self.assertIn("Batch 1: 1 loaded, 3 rejected", output)
+        self.assertIn("Batch 2: 1 loaded, 1 rejected", output)
+        self.assertEqual(
+            sorted(Property.objects.values_list("title", "price", "latitude", "is_published")),
+            [("Loft", Decimal("150000.00"), 48.85, True), ("Plain", Decimal("300000.00"), None, False)],
+        )
+        with open(errors_path, encoding="utf-8") as f:
+            rejects = {row["line"]: row["errors"] for row in map(json.loads, f)}
+        self.assertEqual(sorted(rejects), [3, 4, 5, 6])
+        self.assertIn("price", rejects[3])
+        self.assertEqual(rejects[5], {"owner": ["Unknown user id."]})
+        self.assertGreater(get_generation(), generation)
+
+    def test_ndjson_keeps_decimal_precision(self):
+        path = self._write(".ndjson", (
+            json.dumps({"owner": self.owner.pk, "title": "Exact"})[:-1] + ', "price": 987654321.99}\n'
+            "not json\n"
+        ))
+        output = self._run(path)
+        self.assertIn("Imported 1 rows (1 rejected)", output)
+        self.assertEqual(Property.objects.get().price, Decimal("987654321.99"))
+
+    def test_dry_run_writes_nothing(self):
+        path = self._write(".csv", f"owner,price\n{self.owner.pk},100000\n")
+        output = self._run(path, "--dry-run")
+        self.assertIn("Validated 1 rows", output)
+        self.assertFalse(Property.objects.exists())
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY loading requires PostgreSQL (CI runs it)")
+class ImportPropertiesCopyTests(TestCase):
+    """The COPY path (the auto default on PostgreSQL) must store exactly what bulk_create does"""
+
+    COLUMNS = ("owner_id", "price", "title", "description", "latitude", "longitude", "is_published")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="agency", password="pw")
+
+    def _import(self, method, content):
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        output = StringIO()
+        call_command("import_properties", path, "--method", method, stdout=output)
+        return output.getvalue()
+
+    def test_copy_matches_bulk_create(self):
+        content = (
+            "owner,price,title,description,latitude,longitude,is_published\n"
+            f"{self.owner.pk},150000.00,\"Loft, \"\"quoted\"\"\",\"Line one\nline two\",48.85,2.35,true\n"
+            f"{self.owner.pk},987654321.99,,,,,no\n"
+            f"{self.owner.pk},60000,Ünïcode,,-33.8688,151.2093,1\n"
+        )
+        stored = {}
+        for method in ("copy", "bulk"):
+            Property.objects.all().delete()
+            self.assertIn("Imported 3 rows (0 rejected)", self._import(method, content))
+            stored[method] = sorted(Property.objects.values_list(*self.COLUMNS), key=lambda row: row[1])
+
+        self.assertEqual(stored["copy"], stored["bulk"])
+        self.assertEqual(stored["copy"][2][2:6], ("", "", None, None))  # "" title/description, NULL coordinates
+        self.assertEqual(stored["copy"][1][2], 'Loft, "quoted"')
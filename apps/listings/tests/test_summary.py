@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.listings.models import Property, PropertySummary
+from apps.listings.summary import refresh_summaries
+
+
+class PropertySummaryRefreshTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user_model = get_user_model()
+        cls.alice = user_model.objects.create_user(username="alice", password="pw")
+        cls.bob = user_model.objects.create_user(username="bob", password="pw")
+        for price in ("100000.00", "200000.00", "600000.00"):
+            Property.objects.create(owner=cls.alice, price=Decimal(price), is_published=True)
+        Property.objects.create(owner=cls.bob, price=Decimal("900000.00"), is_published=False)
+
+    def _summary(self, dimension, key):
+        return PropertySummary.objects.get(dimension=dimension, key=str(key))
+
+    def test_full_refresh_computes_statistics(self):
+        result = refresh_summaries()
+        self.assertTrue(result.full)
+
+        alice = self._summary(PropertySummary.DIMENSION_OWNER, self.alice.pk)
+        self.assertEqual(alice.count, 3)
+        self.assertEqual(alice.average_price, Decimal("300000.00"))
+        self.assertEqual(alice.median_price, Decimal("200000.00"))
+        self.assertFalse(PropertySummary.objects.filter(key=str(self.bob.pk)).exists())
+
+        month = datetime.now(timezone.utc).strftime("%Y-%m")
+        self.assertEqual(self._summary(PropertySummary.DIMENSION_MONTH, month).count, 3)
+
+    def test_incremental_refresh_only_touches_changed_groups(self):
+        refresh_summaries()
+        bob_property = Property.objects.get(owner=self.bob)
+        bob_property.is_published = True
+        bob_property.save()
+
+        result = refresh_summaries(overlap=timedelta(0))
+        self.assertFalse(result.full)
+        self.assertEqual(result.changed_rows, 1)
+        self.assertEqual(self._summary(PropertySummary.DIMENSION_OWNER, self.bob.pk).count, 1)
+        self.assertEqual(self._summary(PropertySummary.DIMENSION_OWNER, self.alice.pk).count, 3)
+
+    def test_unpublishing_removes_empty_group(self):
+        refresh_summaries()
+        Property.objects.filter(owner=self.bob).update(is_published=True)
+        refresh_summaries(full=True)
+        bob_property = Property.objects.get(owner=self.bob)
+        bob_property.is_published = False
+        bob_property.save()
+
+        result = refresh_summaries(overlap=timedelta(0))
+        self.assertEqual(result.groups_deleted, 1)
+        self.assertFalse(PropertySummary.objects.filter(key=str(self.bob.pk)).exists())
+
+    def test_command_reports_refresh(self):
+        out = StringIO()
+        call_command("refresh_property_summary", "--full", stdout=out)
+        self.assertIn("Full refresh", out.getvalue())
+
+
+class PropertySummaryViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(username="owner", password="pw")
+        Property.objects.create(owner=owner, price=Decimal("150000.00"), is_published=True)
+        refresh_summaries()
+        cls.owner = owner
+
+    def test_lists_dimension(self):
+        response = self.client.get(reverse("api_v1:property-summary-list"), {"dimension": "owner"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["key"], row["count"], row["median_price"]) for row in response.json()["results"]],
+            [(str(self.owner.pk), 1, "150000.00")],
+        )
+
+    def test_dimension_is_required(self):
+        response = self.client.get(reverse("api_v1:property-summary-list"))
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,457 @@
+# apps/listings/tests/test_views.py
+import json
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+
+from apps.listings.models import Offer, Property
+from apps.listings.serializers import PropertySerializer
+from apps.listings.tests.utils import QueryBudgetMixin
+from apps.listings.views import PropertyViewSet
+
+
+class PropertyPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="owner", password="pw")
+        cls.properties = [
+            Property.objects.create(owner=cls.owner, price=Decimal("100000.00"), is_published=True)
+            for _ in range(5)
+        ]
+        Property.objects.create(owner=cls.owner, price=Decimal("100000.00"), is_published=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def _ids(self, response):
+        return [row["id"] for row in response.json()["results"]]
+
+    def test_pages_follow_keyset_order(self):
+        url = reverse("api_v1:property-list")
+        expected = [p.id for p in sorted(self.properties, key=lambda p: (p.created_at, p.id), reverse=True)]
+
+        first = self.client.get(url, {"page_size": 2})
+        self.assertEqual(self._ids(first), expected[:2])
+        self.assertIsNone(first.json()["previous"])
+
+        second = self.client.get(first.json()["next"])
+        self.assertEqual(self._ids(second), expected[2:4])
+
+        back = self.client.get(second.json()["previous"])
+        self.assertEqual(self._ids(back), expected[:2])
+
+        last = self.client.get(second.json()["next"])
+        self.assertEqual(self._ids(last), expected[4:])
+        self.assertIsNone(last.json()["next"])
+
+    def test_page_size_is_bounded(self):
+        response = self.client.get(reverse("api_v1:property-list"), {"page_size": 10_000})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 5)
+
+    def test_invalid_cursor_returns_404(self):
+        response = self.client.get(reverse("api_v1:property-list"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+
+class PropertyStreamingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(username="owner", password="pw")
+        for _ in range(3):
+            Property.objects.create(owner=owner, price=Decimal("250000.00"), is_published=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_ndjson_stream_matches_list_rows(self):
+        url = reverse("api_v1:property-list")
+        paged = self.client.get(url, {"page_size": 100}).json()["results"]
+
+        response = self.client.get(url, {"stream": "ndjson"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], paged)
+
+    def test_ndjson_stream_reads_keyset_chunks_across_timestamp_ties(self):
+        Property.objects.update(created_at=Property.objects.earliest("created_at").created_at)
+        url = reverse("api_v1:property-list")
+        paged = self.client.get(url, {"page_size": 100}).json()["results"]
+
+        with mock.patch.object(PropertyViewSet, "stream_chunk_size", 2), CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"stream": "ndjson"})
+            lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line) for line in lines], paged)
+        self.assertEqual(len([query for query in queries if "listings_property" in query["sql"]]), 2)
+
+
+class FastReadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(username="owner", password="pw")
+        cls.property = Property.objects.create(owner=owner, price=Decimal("123456.70"), is_published=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_matches_model_serializer(self):
+        response = self.client.get(reverse("api_v1:property-list"))
+        expected = PropertySerializer(Property.objects.get(pk=self.property.pk)).data
+        self.assertEqual(response.json()["results"], [json.loads(JSONRenderer().render(expected))])
+
+    def test_retrieve_matches_model_serializer(self):
+        response = self.client.get(reverse("api_v1:property-detail", args=[self.property.pk]))
+        expected = PropertySerializer(Property.objects.get(pk=self.property.pk)).data
+        self.assertEqual(response.content, JSONRenderer().render(expected))
+
+    def test_retrieve_unpublished_returns_404(self):
+        self.property.is_published = False
+        self.property.save()
+        response = self.client.get(reverse("api_v1:property-detail", args=[self.property.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_retrieve_malformed_pk_returns_404(self):
+        self.client.force_login(self.property.owner)
+        response = self.client.get(reverse("api_v1:offer-detail", args=["abc"]))
+        self.assertEqual(response.status_code, 404)
+
+
+class PropertyCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="owner", password="pw")
+        cls.property = Property.objects.create(owner=cls.owner, price=Decimal("300000.00"), is_published=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_repeat_reads_skip_the_database(self):
+        url = reverse("api_v1:property-list")
+        first = self.client.get(url)
+        self.assertEqual(first["X-Cache"], "MISS")
+
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.json(), first.json())
+
+    def test_save_invalidates_cached_responses(self):
+        url = reverse("api_v1:property-detail", args=[self.property.pk])
+        self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.property.price = Decimal("310000.00")
+            self.property.save()
+
+        response = self.client.get(url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["price"], "310000.00")
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create_user(username="owner", password="pw")
+        cls.property = Property.objects.create(owner=cls.owner, price=Decimal("400000.00"), is_published=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_matching_etag_returns_304(self):
+        url = reverse("api_v1:property-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_new_listing_changes_etag(self):
+        url = reverse("api_v1:property-list")
+        etag = self.client.get(url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Property.objects.create(owner=self.owner, price=Decimal("410000.00"), is_published=True)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_honours_if_modified_since(self):
+        url = reverse("api_v1:property-detail", args=[self.property.pk])
+        last_modified = self.client.get(url)["Last-Modified"]
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_retrieve_malformed_pk_returns_404(self):
+        response = self.client.get(reverse("api_v1:property-detail", args=["abc"]))
+        self.assertEqual(response.status_code, 404)
+
+class ListQueryBudgetTests(QueryBudgetMixin, TestCase):
+    # Fixed budgets: must hold for 1 row and for a full page alike
+    PROPERTY_LIST_BUDGET = 2  # validators aggregate + page
+    OFFER_LIST_BUDGET = 3  # session + user + page
+
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        cls.buyer = User.objects.create_user(username="buyer", password="pw")
+        owners = User.objects.bulk_create(User(username=f"owner{i}") for i in range(60))
+        for owner in owners:
+            listing = Property.objects.create(owner=owner, price=Decimal("500000.00"), is_published=True)
+            Offer.objects.create(property=listing, buyer=cls.buyer, amount=Decimal("480000.00"))
+
+    def setUp(self):
+        cache.clear()
+
+    def test_property_list_budget(self):
+        for page_size in (1, 50):
+            cache.clear()
+            with self.subTest(page_size=page_size), self.assertQueryBudget(self.PROPERTY_LIST_BUDGET):
+                response = self.client.get(reverse("api_v1:property-list"), {"page_size": page_size})
+            self.assertEqual(len(response.json()["results"]), page_size)
+
+    def test_offer_list_budget(self):
+        self.client.force_login(self.buyer)
+        with self.assertQueryBudget(self.OFFER_LIST_BUDGET):
+            response = self.client.get(reverse("api_v1:offer-list"))
+        self.assertEqual(len(response.json()), 60)
+
+    def test_property_stream_reads_no_user_rows(self):
+        # Owners render as ids: the instance path must not join auth_user
+        with self.assertQueryBudget(1) as context:
+            response = self.client.get(reverse("api_v1:property-list"), {"stream": "ndjson"})
+            rows = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(rows), 60)
+        self.assertNotIn("auth_user", context.captured_queries[0]["sql"])
+
+
+@override_settings(ROOT_URLCONF="config.asgi_urls")
+class AsyncPropertyViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(username="owner", password="pw")
+        cls.properties = [
+            Property.objects.create(owner=owner, price=Decimal("600000.00"), is_published=True)
+            for _ in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_async_list_matches_drf_view(self):
+        url = "/api/v1/properties?page_size=2"
+        async_response = await self.async_client.get(url)
+        await cache.aclear()
+        with override_settings(ROOT_URLCONF="config.urls"):
+            sync_response = await self.async_client.get(url)
+
+        self.assertEqual(async_response.status_code, 200)
+        self.assertEqual(async_response.json(), sync_response.json())
+        self.assertEqual(async_response["ETag"], sync_response["ETag"])
+
+    async def test_async_detail_and_revalidation(self):
+        url = f"/api/v1/properties/{self.properties[0].pk}"
+        response = await self.async_client.get(url)
+        self.assertEqual(response.json()["price"], "600000.00")
+
+        revalidated = await self.async_client.get(url, headers={"If-None-Match": response["ETag"]})
+        self.assertEqual(revalidated.status_code, 304)
+
+    async def test_async_stream_matches_drf_view(self):
+        url = "/api/v1/properties?stream=ndjson"
+        async_response = await self.async_client.get(url)
+        async_body = b"".join([chunk async for chunk in async_response.streaming_content])
+        with override_settings(ROOT_URLCONF="config.urls"):
+            sync_response = await self.async_client.get(url)
+            # Sync iterator with DB access: consume it off the event loop
+            sync_body = await sync_to_async(b"".join)(sync_response.streaming_content)
+
+        self.assertEqual(async_response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(async_body.splitlines()), 3)
+        self.assertEqual(async_body, sync_body)
+
+    async def test_async_detail_rejects_bad_filter(self):
+        response = await self.async_client.get(f"/api/v1/properties/{self.properties[0].pk}?min_price=cheap")
+        self.assertEqual(response.status_code, 400)
+
+    async def test_async_detail_missing_returns_json_404(self):
+        response = await self.async_client.get("/api/v1/properties/999999")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "No Property matches the given query."})
+
+
+class PropertySearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user_model = get_user_model()
+        cls.alice = user_model.objects.create_user(username="alice", password="pw")
+        cls.bob = user_model.objects.create_user(username="bob", password="pw")
+        Property.objects.create(owner=cls.alice, price=Decimal("80000.00"), title="Garden flat", is_published=True)
+        Property.objects.create(owner=cls.alice, price=Decimal("300000.00"), title="Sea view villa", is_published=True)
+        Property.objects.create(owner=cls.bob, price=Decimal("1200000.00"), description="Garden and pool", is_published=True)
+        Property.objects.create(owner=cls.bob, price=Decimal("90000.00"), title="Garden shed", is_published=False)
+
+    def setUp(self):
+        cache.clear()
+
+    def _prices(self, response):
+        return sorted(row["price"] for row in response.json()["results"])
+
+    def test_price_range_filters_list(self):
+        response = self.client.get(reverse("api_v1:property-list"), {"min_price": "100000", "max_price": "1200000"})
+        self.assertEqual(self._prices(response), ["1200000.00", "300000.00"])
+
+    def test_invalid_price_returns_400(self):
+        response = self.client.get(reverse("api_v1:property-list"), {"min_price": "cheap"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("min_price", response.json())
+
+    def test_search_returns_matches_and_facets(self):
+        response = self.client.get(reverse("api_v1:property-search"), {"q": "garden"})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(self._prices(response), ["1200000.00", "80000.00"])
+        self.assertNotIn("search_vector", body["results"][0])
+
+        facets = body["facets"]
+        self.assertEqual(facets["total"], 2)
+        self.assertEqual([bucket["count"] for bucket in facets["price"]], [1, 0, 0, 0, 1])
+        self.assertEqual(
+            sorted((row["owner"], row["count"]) for row in facets["owner"]),
+            [(self.alice.pk, 1), (self.bob.pk, 1)],
+        )
+
+    def test_facets_follow_writes(self):
+        url = reverse("api_v1:property-search")
+        self.assertEqual(self.client.get(url).json()["facets"]["total"], 3)
+        with self.captureOnCommitCallbacks(execute=True):
+            Property.objects.create(owner=self.bob, price=Decimal("600000.00"), is_published=True)
+        self.assertEqual(self.client.get(url).json()["facets"]["total"], 4)
+
+
+class PropertyGeoTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create_user(username="owner", password="pw")
+        places = {
+            "louvre": (48.8606, 2.3376),
+            "versailles": (48.8049, 2.1204),  # ~17 km from the Louvre
+            "lyon": (45.7640, 4.8357),
+        }
+        for title, (lat, lon) in places.items():
+            Property.objects.create(
+                owner=owner, price=Decimal("400000.00"), title=title,
+                latitude=lat, longitude=lon, is_published=True,
+            )
+        Property.objects.create(owner=owner, price=Decimal("400000.00"), title="unplaced", is_published=True)
+
+    def setUp(self):
+        cache.clear()
+
+    def _titles(self, params):
+        response = self.client.get(reverse("api_v1:property-list"), params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(row["title"] for row in response.json()["results"])
+
+    def test_bbox_returns_properties_in_viewport(self):
+        self.assertEqual(self._titles({"bbox": "2.0,48.7,2.5,49.0"}), ["louvre", "versailles"])
+
+    def test_radius_applies_exact_distance(self):
+        self.assertEqual(self._titles({"near": "48.8606,2.3376", "radius_km": "10"}), ["louvre"])
+        self.assertEqual(self._titles({"near": "48.8606,2.3376", "radius_km": "20"}), ["louvre", "versailles"])
+
+    def test_invalid_geo_parameters_return_400(self):
+        url = reverse("api_v1:property-list")
+        for params in (
+            {"bbox": "2.5,48.7,2.0,49.0"},
+            {"bbox": "1,2,3"},
+            {"near": "48.86,2.33"},
+            {"near": "91,0", "radius_km": "5"},
+            {"near": "48.86,2.33", "radius_km": "5000"},
+        ):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
+
+
+class BulkWriteTests(QueryBudgetMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user_model = get_user_model()
+        cls.agent = user_model.objects.create_user(username="agent", password="pw")
+        cls.other = user_model.objects.create_user(username="other", password="pw")
+        cls.listing = Property.objects.create(owner=cls.other, price=Decimal("500000.00"), is_published=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.agent)
+
+    def _send(self, method, url, items):
+        return getattr(self.client, method)(url, json.dumps(items), content_type="application/json")
+
+    def test_bulk_create_properties_reports_per_item_results(self):
+        items = [{"price": "150000.00", "title": f"Unit {i}", "is_published": True} for i in range(3)]
+        items.insert(1, {"price": "100.00"})
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self._send("post", reverse("api_v1:property-bulk"), items)
+
+        self.assertEqual(response.status_code, 207)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (3, 1))
+        self.assertEqual([row["status"] for row in body["results"]], ["created", "invalid", "created", "created"])
+        self.assertIn("price", body["results"][1]["errors"])
+        self.assertEqual(Property.objects.filter(owner=self.agent).count(), 3)
+
+        feed = self.client.get(reverse("api_v1:property-list")).json()["results"]
+        self.assertEqual(len(feed), 4)  # Cache generation bumped on commit
+
+    def test_bulk_update_only_touches_own_rows(self):
+        mine = Property.objects.create(owner=self.agent, price=Decimal("200000.00"))
+        response = self._send("patch", reverse("api_v1:property-bulk"), [
+            {"id": mine.pk, "price": "210000.00"},
+            {"id": self.listing.pk, "price": "1.00"},
+        ])
+
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([row["status"] for row in response.json()["results"]], ["updated", "not_found"])
+        mine.refresh_from_db()
+        self.assertEqual(mine.price, Decimal("210000.00"))
+        self.assertEqual(Property.objects.get(pk=self.listing.pk).price, Decimal("500000.00"))
+
+    def test_bulk_rejects_unpaired_coordinates_per_item(self):
+        located = Property.objects.create(owner=self.agent, price=Decimal("200000.00"), latitude=48.1, longitude=11.5)
+        unlocated = Property.objects.create(owner=self.agent, price=Decimal("200000.00"))
+        response = self._send("post", reverse("api_v1:property-bulk"), [
+            {"price": "150000.00", "latitude": 48.0},
+            {"price": "150000.00", "latitude": 48.0, "longitude": 11.0},
+        ])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual(response.json()["results"][0]["errors"], {"longitude": ["Latitude and longitude must be set together."]})
+
+        response = self._send("patch", reverse("api_v1:property-bulk"), [
+            {"id": located.pk, "latitude": 47.0},  # Pairs with the stored longitude
+            {"id": unlocated.pk, "latitude": 47.0},
+        ])
+        self.assertEqual(response.status_code, 207)
+        self.assertEqual([row["status"] for row in response.json()["results"]], ["updated", "invalid"])
+        self.assertIsNone(Property.objects.get(pk=unlocated.pk).latitude)
+
+    def test_bulk_offer_create_resolves_properties_in_one_query(self):
+        items = [{"property": self.listing.pk, "amount": f"{400000 + i}.00"} for i in range(50)]
+        # session + user, related properties, savepoint/insert
+        with self.assertQueryBudget(6):
+            response = self._send("post", reverse("api_v1:offer-bulk"), items)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Offer.objects.filter(buyer=self.agent).count(), 50)
+
+    def test_bulk_requires_authentication(self):
+        self.client.logout()
+        response = self._send("post", reverse("api_v1:property-bulk"), [{"price": "150000.00"}])
+        self.assertIn(response.status_code, (401, 403))
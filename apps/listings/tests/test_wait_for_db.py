@@ -0,0 +1,63 @@
+import subprocess
+import sys
+import time
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from apps.listings.management.commands.wait_for_db import Command
+
+
+class WaitForDbTests(TestCase):
+    def test_reports_every_dependency(self):
+        out = StringIO()
+        call_command("wait_for_db", timeout=5, stdout=out)
+        self.assertIn("database:default", out.getvalue())
+        self.assertIn("cache:default", out.getvalue())
+
+    def test_fails_at_the_deadline_with_backoff(self):
+        attempts = []
+
+        def failing_probe(alias):
+            def probe():
+                attempts.append(time.monotonic())
+                raise ConnectionError("refused")
+            return probe
+
+        out = StringIO()
+        started = time.monotonic()
+        with mock.patch.object(Command, "_database_probe", staticmethod(failing_probe)), \
+                self.assertRaisesMessage(CommandError, "database:default"):
+            call_command("wait_for_db", timeout=0.5, interval=0.01, max_interval=0.1, stdout=out)
+        self.assertLess(time.monotonic() - started, 1.5)
+        self.assertGreater(len(attempts), 2)
+        self.assertIn("refused", out.getvalue())
+
+    def test_hung_probe_does_not_outlive_the_deadline(self):
+        # The process must exit at the deadline, not when the hung connect returns
+        script = (
+            "import time, django; django.setup()\n"
+            "from unittest import mock\n"
+            "from django.core.management import call_command\n"
+            "from django.core.management.base import CommandError\n"
+            "from apps.listings.management.commands.wait_for_db import Command\n"
+            "hung = staticmethod(lambda alias: lambda: time.sleep(30))\n"
+            "with mock.patch.object(Command, '_database_probe', hung):\n"
+            "    try:\n"
+            "        call_command('wait_for_db', db_alias=['default'], no_cache=True, timeout=0.5)\n"
+            "    except CommandError:\n"
+            "        print('timed out', flush=True)\n"
+            "print(time.monotonic(), flush=True)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=20)
+        exited = time.monotonic()
+        self.assertIn("timed out", result.stdout, result.stderr)
+        finished = float(result.stdout.splitlines()[-1])
+        self.assertLess(exited - finished, 5)  # Not held open by the 30s sleep
+
+    def test_unknown_alias(self):
+        with self.assertRaisesMessage(CommandError, "Unknown database alias"):
+            call_command("wait_for_db", db_alias=["nope"], stdout=StringIO())
@@ -0,0 +1,32 @@
+# apps/listings/tests/utils.py
+"""
+Shared Test Helpers for Listing Endpoints
+
+QueryBudgetMixin:
+- Fails when a block runs more queries than a fixed budget
+- Budgets are independent of page size, so N+1 regressions surface
+  as soon as a test renders more than a handful of rows
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetMixin:
+    """TestCase mixin providing assertQueryBudget()"""
+
+    @contextmanager
+    def assertQueryBudget(self, budget: int, using: str = "default") -> Iterator[CaptureQueriesContext]:
+        """Assert the wrapped block runs at most `budget` queries"""
+        with CaptureQueriesContext(connections[using]) as context:
+            yield context
+
+        executed = len(context.captured_queries)
+        if executed > budget:
+            queries = "\n".join(
+                f"{i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1)
+            )
+            self.fail(f"{executed} queries executed, budget is {budget}\n{queries}")
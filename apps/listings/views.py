@@ -10,24 +10,113 @@ Maintains:
 Adds:
 - Read-only API endpoints
 - Ownership validation
+- Keyset pagination for the public feed
+- Opt-in NDJSON streaming exports (?stream=ndjson)
+- values_list() fast path for list/retrieve (FastReadMixin)
+- Versioned read-through cache for public reads (CachedResponseMixin)
+- ETag / Last-Modified revalidation with 304 answers (ConditionalGetMixin)
+- Keyword/price filtering and a faceted search action (search.py)
+- Map viewport and radius filtering (geo.py)
+- Precomputed price statistics (PropertySummaryViewSet, summary.py)
+- Batch create/update endpoints (<list-url>/bulk, bulk.py)
 """
 
+from django.db import transaction
 from rest_framework import viewsets, permissions
-from .models import Property
+from rest_framework.exceptions import ValidationError
+from .bulk import BulkWriteMixin
+from .cache import CachedResponseMixin, bump_generation
+from .conditional import ConditionalGetMixin
+from .fastread import FastReadMixin
+from .geo import PropertyGeoFilter
+from .models import Property, PropertySummary, Offer
+from .pagination import PropertyCursorPagination, SummaryCursorPagination
+from .search import FacetedSearchMixin, PropertySearchFilter
+from .serializers import PropertySerializer, PropertySummarySerializer, OfferSerializer
+from .streaming import StreamingListMixin
 
-class PropertyViewSet(viewsets.ReadOnlyModelViewSet):
+class PropertyViewSet(
+    BulkWriteMixin,
+    FacetedSearchMixin,
+    StreamingListMixin,
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    FastReadMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """
-    Read-only API for published properties
+    Read-only API for published properties, plus batch writes by owners
     
     Safety Features:
     - Inherits security headers from middleware.py
     - Uses existing auth classes from settings
     - Compatible with current nginx routing
+    - Bounded, index-backed pages (PropertyCursorPagination)
+    - POST/PATCH bulk requires authentication and only touches own rows
     """
     queryset = Property.objects.filter(is_published=True)
     serializer_class = PropertySerializer
     permission_classes = [permissions.AllowAny]  # Matches original public access
+    pagination_class = PropertyCursorPagination
+    filter_backends = [PropertySearchFilter, PropertyGeoFilter]
+    cache_validators = True  # Generation bumps on Property writes keep these fresh
 
     def get_queryset(self):
-        """Maintains original filtering behavior"""
-        return super().get_queryset().order_by('-created_at')
\ No newline at end of file
+        """
+        Maintains original filtering behavior (id breaks timestamp ties)
+
+        No select_related: the serializer renders owner as its id (owner_id
+        column), so a join would only pull user rows (password hashes
+        included) into every list, stream and detail read.
+        """
+        return super().get_queryset().order_by('-created_at', '-id')
+
+    def on_bulk_write(self):
+        """bulk_create/bulk_update skip post_save: invalidate on commit"""
+        transaction.on_commit(bump_generation)
+
+class OfferViewSet(BulkWriteMixin, StreamingListMixin, FastReadMixin, viewsets.ModelViewSet):
+    """
+    Offer API scoped to the authenticated buyer
+
+    Safety Features:
+    - Buyers only ever see their own offers
+    - Buyer is taken from the request, never from the payload
+    """
+    serializer_class = OfferSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    bulk_owner_field = 'buyer'
+
+    def get_queryset(self):
+        """Buyer-scoped offers; relations render as ids, so no joins are needed"""
+        return Offer.objects.filter(buyer=self.request.user).order_by('-created_at', '-id')
+
+    def perform_create(self, serializer):
+        serializer.save(buyer=self.request.user)
+
+class PropertySummaryViewSet(FastReadMixin, viewsets.GenericViewSet):
+    """
+    Read-only dashboard statistics per owner or creation month
+
+    Query Parameters:
+    - dimension: owner | month (required)
+    - key: optional exact group (owner id or YYYY-MM)
+
+    Rows are precomputed by refresh_property_summary, so every request is an
+    index seek on (dimension, key) regardless of catalog size.
+    """
+    serializer_class = PropertySummarySerializer
+    permission_classes = [permissions.AllowAny]  # Aggregates over public listings only
+    pagination_class = SummaryCursorPagination
+
+    def get_queryset(self):
+        params = self.request.query_params
+        dimension = params.get('dimension')
+        choices = dict(PropertySummary.DIMENSION_CHOICES)
+        if dimension not in choices:
+            raise ValidationError({'dimension': f"Must be one of: {', '.join(choices)}."})
+
+        queryset = PropertySummary.objects.filter(dimension=dimension)
+        if params.get('key'):
+            queryset = queryset.filter(key=params['key'])
+        return queryset
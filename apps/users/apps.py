@@ -3,4 +3,8 @@ from django.apps import AppConfig
 
 class UsersConfig(AppConfig):
     name = 'users'
-    verbose_name = "User Management"
\ No newline at end of file
+    verbose_name = "User Management"
+
+    def ready(self):
+        """Register model signal handlers (cached JWT user invalidation)"""
+        from apps.users import signals  # noqa: F401
\ No newline at end of file
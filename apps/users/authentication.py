@@ -0,0 +1,138 @@
+# apps/users/authentication.py
+"""
+JWT Authentication with Cached User Resolution
+
+Performance Purpose:
+- The access token is decoded and verified once per request (signature
+  and expiry, no I/O); the User row then comes from the cache, so an
+  authenticated API call costs zero auth queries on a hit
+- Misses load the user once and cache a small projection of it for
+  JWT_USER_CACHE_TIMEOUT
+
+Security:
+- Tokens carry a "ver" claim derived from the user's password hash;
+  changing the password invalidates every outstanding token at once
+- Inactive users are rejected from the cached copy as well
+- The password hash never reaches the shared cache: entries hold
+  JWT_USER_CACHE_FIELDS plus the precomputed token version
+- post_save/post_delete on the user model drop the cached entries for the
+  old and new version (signals.py), so password and is_active changes
+  apply immediately; queryset.update() bypasses signals and waits for the TTL
+
+Cache layout: jwt:user:<id>:<ver> -> {"ver": <ver>, "fields": {...}}
+request.user is then built like User.objects.only(*JWT_USER_CACHE_FIELDS):
+other fields (password included) load on first access, and save() only
+writes the loaded fields.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.crypto import salted_hmac
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, Token
+
+logger = logging.getLogger(__name__)
+
+VERSION_CLAIM = "ver"
+# Fields request.user consumers read (permissions, admin, logging)
+DEFAULT_CACHE_FIELDS = ("id", "username", "is_active", "is_staff", "is_superuser")
+
+
+def password_version(encoded: str) -> str:
+    """Short digest of a password hash; changes whenever the password does"""
+    return salted_hmac("apps.users.token_version", encoded, algorithm="sha256").hexdigest()[:16]
+
+
+def token_version(user: Any) -> str:
+    return password_version(user.password)
+
+
+def user_cache_key(user_id: Any, version: str) -> str:
+    return f"jwt:user:{user_id}:{version}"
+
+
+def cache_fields() -> List[str]:
+    """Projected field names; the password is never cached"""
+    fields = getattr(settings, "JWT_USER_CACHE_FIELDS", DEFAULT_CACHE_FIELDS)
+    return [name for name in fields if name != "password"]
+
+
+def invalidate_user(user_id: Any, *versions: str) -> None:
+    """Drop the cached entries for these token versions so the next request reloads the user"""
+    try:
+        cache.delete_many([user_cache_key(user_id, version) for version in versions])
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Could not invalidate cached user %s", user_id, exc_info=True)
+
+
+class VersionedRefreshToken(RefreshToken):
+    """RefreshToken whose access tokens inherit the user's token version"""
+
+    @classmethod
+    def for_user(cls, user: Any) -> Token:
+        token = super().for_user(user)
+        token[VERSION_CLAIM] = token_version(user)
+        return token
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication resolving the user from the cache before the DB"""
+
+    def get_user(self, validated_token: Token) -> Any:
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+            version = validated_token[VERSION_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        key = user_cache_key(user_id, version)
+        payload = self._cached_payload(key)
+        if payload is not None:
+            current, user = payload["ver"], self._from_payload(payload)
+        else:
+            try:
+                user = get_user_model()._default_manager.get(**{api_settings.USER_ID_FIELD: user_id})
+            except get_user_model().DoesNotExist:
+                raise AuthenticationFailed("User not found", code="user_not_found")
+            current = token_version(user)
+            if current == version:  # Revoked tokens never create entries
+                self._store(key, user, current)
+
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if version != current:
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+        return user
+
+    @staticmethod
+    def _cached_payload(key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return cache.get(key)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("User cache unavailable, falling back to the database", exc_info=True)
+            return None
+
+    @staticmethod
+    def _from_payload(payload: Dict[str, Any]) -> Any:
+        """User with only the projected fields loaded (like .only())"""
+        fields = payload["fields"]
+        user_model = get_user_model()
+        # from_db() expects values in concrete field order
+        names = [field.attname for field in user_model._meta.concrete_fields if field.attname in fields]
+        return user_model.from_db(DEFAULT_DB_ALIAS, names, [fields[name] for name in names])
+
+    @staticmethod
+    def _store(key: str, user: Any, version: str) -> None:
+        payload = {"ver": version, "fields": {name: getattr(user, name) for name in cache_fields()}}
+        try:
+            cache.set(key, payload, getattr(settings, "JWT_USER_CACHE_TIMEOUT", 300))
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not cache user %s", user.pk, exc_info=True)
+
@@ -0,0 +1,62 @@
+# apps/users/backends.py
+"""
+Authentication Backend with Pooled Password Hashing
+
+Purpose: ModelBackend semantics, with the password hash offloaded to the
+         bounded pool in apps/users/hashing.py
+Security:
+- Unknown usernames still pay for one hash (same timing as a wrong
+  password, as in ModelBackend)
+- Inactive users are rejected after the hash, as in ModelBackend
+Flow:
+1. Look the user up on the request thread
+2. Verify the password on the pool (raises LoginCapacityExceeded when full)
+3. Upgrade outdated hashes on the request thread (rare; one extra hash)
+"""
+
+from typing import Any, List, Optional, Tuple
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import check_password, make_password
+from django.http import HttpRequest
+
+from .hashing import pool
+
+
+def _verify(password: str, encoded: str) -> Tuple[bool, bool]:
+    """(valid, needs_rehash); runs on the pool, touches no database"""
+    outdated: List[bool] = []
+    valid = check_password(password, encoded, setter=lambda raw: outdated.append(True))
+    return valid, bool(outdated)
+
+
+class PooledModelBackend(ModelBackend):
+    """Drop-in ModelBackend whose hashing is capped per process"""
+
+    def authenticate(
+        self,
+        request: Optional[HttpRequest],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        user_model = get_user_model()
+        if username is None:
+            username = kwargs.get(user_model.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            user = user_model._default_manager.get_by_natural_key(username)
+        except user_model.DoesNotExist:
+            pool.run(make_password, password)
+            return None
+
+        valid, needs_rehash = pool.run(_verify, password, user.password)
+        if not valid:
+            return None
+        if needs_rehash:
+            user.password = pool.run(make_password, password)
+            user.save(update_fields=["password"])
+        return user if self.user_can_authenticate(user) else None
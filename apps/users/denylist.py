@@ -0,0 +1,32 @@
+# apps/users/denylist.py
+"""
+Refresh Token Denylist
+
+Performance Purpose:
+- One O(1) cache operation per refresh: SET NX on jwt:denied:<jti>
+- Entries expire with the token itself (TTL = exp - now), so the
+  denylist never needs cleanup and holds only still-valid tokens
+
+Security:
+- deny() is atomic: of two concurrent refreshes with the same token,
+  exactly one wins; the other is treated as token reuse
+- Cache failures surface as exceptions so callers fail closed
+"""
+
+import time
+from typing import Any
+
+from django.core.cache import cache
+
+
+def _key(jti: str) -> str:
+    return f"jwt:denied:{jti}"
+
+
+def _ttl(token: Any) -> int:
+    return max(int(token["exp"] - time.time()), 1)
+
+
+def deny(token: Any) -> bool:
+    """Revoke the token; False when it was already revoked (reuse)"""
+    return cache.add(_key(token["jti"]), 1, timeout=_ttl(token))
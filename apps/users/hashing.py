@@ -0,0 +1,119 @@
+# apps/users/hashing.py
+"""
+Bounded Password Hashing Pool
+
+Performance Purpose:
+- PBKDF2 is deliberately slow (~100ms+ of CPU per attempt); a login burst
+  or credential-stuffing run must not take every worker thread with it
+- At most LOGIN_HASH_WORKERS hashes run per process, with at most
+  LOGIN_HASH_QUEUE waiting; anything beyond is rejected immediately
+  (LoginCapacityExceeded -> 503 + Retry-After) instead of queueing
+- A waiting login holds its request thread, so settings keep workers +
+  queue below GUNICORN_THREADS (threads stay free for listings) and a
+  login queues for at most LOGIN_HASH_TIMEOUT (about one hash)
+- Sync workers serve one request per process: the cap then never fills,
+  and isolation comes from the gunicorn process count instead
+- hashlib releases the GIL while hashing, so the pool threads do not
+  stall request threads serving listings (gthread/ASGI workers)
+
+Scope:
+- Only the hash runs in the pool: no database access happens on pool
+  threads, so connections and transactions stay on the request thread
+
+Metrics (multiprocess safe):
+- login_hash_queue_depth / login_hash_in_flight gauges
+- login_hash_wait_seconds histogram, login_hash_rejected_total counter
+- No-ops without prometheus-client, so login works on base requirements
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+
+from apps.core.metric_types import Counter, Gauge, Histogram
+
+QUEUE_DEPTH = Gauge(
+    "login_hash_queue_depth",
+    "Password hashes waiting for a pool thread",
+    multiprocess_mode="livesum",
+)
+IN_FLIGHT = Gauge(
+    "login_hash_in_flight",
+    "Password hashes currently running",
+    multiprocess_mode="livesum",
+)
+WAIT_SECONDS = Histogram(
+    "login_hash_wait_seconds",
+    "Time a password hash waited for a pool thread",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),  # HARDCODED: One hash is ~0.1-0.5s
+)
+REJECTED = Counter(
+    "login_hash_rejected_total",
+    "Login attempts rejected because the hashing pool was saturated",
+    ["reason"],
+)
+
+
+class LoginCapacityExceeded(Exception):
+    """The hashing pool is full (or the wait timed out); retry later"""
+
+
+class HashingPool:
+    """Fixed-size executor with a hard cap on queued work"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+
+    def _start(self) -> None:
+        # Lazy: threads must not exist before gunicorn forks its workers
+        with self._lock:
+            if self._executor is None:
+                workers = getattr(settings, "LOGIN_HASH_WORKERS", 2)
+                queue = getattr(settings, "LOGIN_HASH_QUEUE", 4)
+                self._slots = threading.BoundedSemaphore(workers + queue)
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="login-hash")
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) on the pool and wait for it, or reject immediately"""
+        if self._executor is None:
+            self._start()
+        if not self._slots.acquire(blocking=False):
+            REJECTED.labels(reason="full").inc()
+            raise LoginCapacityExceeded()
+
+        QUEUE_DEPTH.inc()
+        submitted = time.perf_counter()
+        started = threading.Event()
+
+        def task() -> Any:
+            started.set()
+            QUEUE_DEPTH.dec()
+            WAIT_SECONDS.observe(time.perf_counter() - submitted)
+            IN_FLIGHT.inc()
+            try:
+                return func(*args)
+            finally:
+                IN_FLIGHT.dec()
+
+        future = self._executor.submit(task)
+        future.add_done_callback(lambda _: self._slots.release())
+        # Bound the queue wait only: a hash that has started always finishes
+        if not started.wait(getattr(settings, "LOGIN_HASH_TIMEOUT", 0.5)) and future.cancel():
+            QUEUE_DEPTH.dec()  # Never started, so task() did not decrement
+            REJECTED.labels(reason="timeout").inc()
+            raise LoginCapacityExceeded()
+        return future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+pool = HashingPool()
@@ -0,0 +1,14 @@
+# apps/users/schema.py
+"""
+OpenAPI Extensions for the users app
+
+Loaded only by apps.core.schema.build_schema (OPENAPI_EXTENSION_MODULES),
+so serving requests never imports drf-spectacular.
+"""
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Documents CachedJWTAuthentication as bearer JWT in the OpenAPI schema"""
+    target_class = "apps.users.authentication.CachedJWTAuthentication"
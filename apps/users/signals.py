@@ -0,0 +1,44 @@
+# apps/users/signals.py
+"""
+User Model Signal Handlers
+
+Purpose:
+- Drop the cached user used by CachedJWTAuthentication when a user
+  changes (password, is_active, profile fields) or is deleted
+- Entries are keyed by token version: both the version before the save
+  (read in pre_save when the password may change) and after it are dropped
+- Deleted now and again on commit, so a concurrent request cannot
+  re-cache the pre-commit row
+
+Note: QuerySet.update() bypasses these signals; call
+authentication.invalidate_user(pk, token_version(user)) after bulk user updates.
+"""
+
+from functools import partial
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user, password_version, token_version
+
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="users_user_saving")
+def remember_token_version(sender: Any, instance: Any, update_fields: Any = None, **kwargs: Any) -> None:
+    """Version of the stored password, whose cache entry the save orphans"""
+    if instance.pk is None or (update_fields is not None and "password" not in update_fields):
+        return  # e.g. update_last_login: the stored password is unchanged
+    stored = sender._default_manager.filter(pk=instance.pk).values_list("password", flat=True).first()
+    if stored is not None:
+        instance._stored_token_version = password_version(stored)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL, dispatch_uid="users_user_saved")
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL, dispatch_uid="users_user_deleted")
+def invalidate_cached_user(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Forget the cached copies of the user"""
+    versions = {token_version(instance), getattr(instance, "_stored_token_version", None)} - {None}
+    invalidate_user(instance.pk, *versions)
+    transaction.on_commit(partial(invalidate_user, instance.pk, *versions))
@@ -0,0 +1,70 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from apps.users.authentication import (
+    VERSION_CLAIM, CachedJWTAuthentication, VersionedRefreshToken, token_version, user_cache_key,
+)
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="alice", password="s3cret-pass")
+
+    def setUp(self):
+        cache.delete(user_cache_key(self.user.pk, token_version(self.user)))
+        self.backend = CachedJWTAuthentication()
+
+    def _authenticate(self, token):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.backend.authenticate(request)
+
+    def test_second_request_uses_cache(self):
+        token = VersionedRefreshToken.for_user(self.user).access_token
+        with self.assertNumQueries(1):
+            user, _ = self._authenticate(token)
+        self.assertEqual(user, self.user)
+        with self.assertNumQueries(0):
+            user, _ = self._authenticate(token)
+        self.assertEqual(user, self.user)
+
+    def test_cache_holds_no_password_hash(self):
+        token = VersionedRefreshToken.for_user(self.user).access_token
+        self._authenticate(token)
+        payload = cache.get(user_cache_key(self.user.pk, token[VERSION_CLAIM]))
+        self.assertEqual(payload["ver"], token_version(self.user))
+        self.assertNotIn("password", payload["fields"])
+        self.assertNotIn(self.user.password, repr(payload))
+
+        user, _ = self._authenticate(token)  # From the cache
+        user.is_staff = True
+        user.save()  # Only the projected fields are written back
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_staff)
+        self.assertTrue(self.user.check_password("s3cret-pass"))
+
+    def test_password_change_revokes_tokens(self):
+        token = VersionedRefreshToken.for_user(self.user).access_token
+        self._authenticate(token)
+        self.user.set_password("n3w-secret-pass")
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(token)
+        self._authenticate(VersionedRefreshToken.for_user(self.user).access_token)
+
+    def test_deactivation_applies_to_cached_user(self):
+        token = VersionedRefreshToken.for_user(self.user).access_token
+        self._authenticate(token)
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(token)
+
+    def test_login_token_authenticates_api_requests(self):
+        response = self.client.post(reverse("auth:login"), {"username": "alice", "password": "s3cret-pass"},
+                                    REMOTE_ADDR="10.3.0.1")
+        self.assertEqual(self._authenticate(response.json()["access"])[0], self.user)
@@ -0,0 +1,91 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.contrib.auth import authenticate, get_user_model
+from django.contrib.auth.hashers import make_password
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.users.hashing import HashingPool, LoginCapacityExceeded
+
+
+class PooledModelBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="alice", password="s3cret-pass")
+
+    def test_authenticates_valid_credentials(self):
+        self.assertEqual(authenticate(username="alice", password="s3cret-pass"), self.user)
+        self.assertIsNone(authenticate(username="alice", password="wrong"))
+        self.assertIsNone(authenticate(username="nobody", password="s3cret-pass"))
+
+    def test_inactive_user_rejected(self):
+        get_user_model().objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNone(authenticate(username="alice", password="s3cret-pass"))
+
+    @override_settings(PASSWORD_HASHERS=[
+        "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+        "django.contrib.auth.hashers.MD5PasswordHasher",
+    ])
+    def test_outdated_hash_is_upgraded(self):
+        get_user_model().objects.filter(pk=self.user.pk).update(
+            password=make_password("s3cret-pass", hasher="md5")
+        )
+        self.assertEqual(authenticate(username="alice", password="s3cret-pass"), self.user)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$"))
+
+    def test_saturated_pool_returns_503(self):
+        with mock.patch("apps.users.backends.pool.run", side_effect=LoginCapacityExceeded):
+            response = self.client.post(
+                reverse("auth:login"), {"username": "alice", "password": "s3cret-pass"},
+                REMOTE_ADDR="10.2.0.1",
+            )
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+
+@override_settings(LOGIN_HASH_WORKERS=1, LOGIN_HASH_QUEUE=0)
+class HashingPoolTests(TestCase):
+    def test_rejects_beyond_capacity(self):
+        pool = HashingPool()
+        self.addCleanup(pool.shutdown)
+        self.assertEqual(pool.run(sum, [1, 2]), 3)
+
+        pool._slots.acquire()  # Occupy the only slot
+        with self.assertRaises(LoginCapacityExceeded):
+            pool.run(sum, [1, 2])
+
+
+class LoginIsolationTests(SimpleTestCase):
+    def test_login_burst_leaves_request_threads_for_listings(self):
+        """Default pool settings against the default gthread worker (GUNICORN_THREADS=4)"""
+        pool = HashingPool()
+        release = threading.Event()
+        self.addCleanup(pool.shutdown)
+        self.addCleanup(release.set)
+
+        def slow_hash():
+            release.wait(10)
+            return True
+
+        def login():
+            try:
+                return pool.run(slow_hash)
+            except LoginCapacityExceeded:
+                return "503"
+
+        # One gthread worker: 4 request threads, 6 logins arriving at once
+        with ThreadPoolExecutor(max_workers=4) as request_threads:
+            logins = [request_threads.submit(login) for _ in range(6)]
+            started = time.monotonic()
+            listing = request_threads.submit(self.client.get, reverse("health-live"))
+            self.assertEqual(listing.result(timeout=2).status_code, 200)
+            self.assertLess(time.monotonic() - started, 1)
+            release.set()
+            outcomes = [future.result(timeout=5) for future in logins]
+        # Beyond the 2 slots (one hashing, one queued) logins were refused at once
+        self.assertGreaterEqual(outcomes.count("503"), 4)
+        self.assertIn(True, outcomes)
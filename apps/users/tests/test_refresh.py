@@ -0,0 +1,74 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.users.authentication import VersionedRefreshToken, token_version, user_cache_key
+
+
+class TokenRefreshTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(username="alice", password="s3cret-pass")
+
+    def setUp(self):
+        # Test rollbacks fire no signals, so primary keys reused across tests can hit stale entries
+        cache.delete(user_cache_key(self.user.pk, token_version(self.user)))
+
+    def _refresh(self, token=None):
+        if token is not None:
+            self.client.cookies["refresh_token"] = token
+        return self.client.post(reverse("auth:refresh"), REMOTE_ADDR="10.4.0.1")
+
+    def test_login_cookie_lives_as_long_as_the_token(self):
+        response = self.client.post(reverse("auth:login"), {"username": "alice", "password": "s3cret-pass"},
+                                    REMOTE_ADDR="10.4.0.2")
+        self.assertEqual(response.cookies["refresh_token"]["max-age"], 7 * 24 * 3600)
+
+    def test_rotation_issues_new_pair_and_denies_reuse(self):
+        original = str(VersionedRefreshToken.for_user(self.user))
+        response = self._refresh(original)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.json())
+        self.assertNotEqual(response.cookies["refresh_token"].value, original)
+
+        self.assertEqual(self._refresh(original).status_code, 401)
+
+    def test_rotated_token_keeps_working(self):
+        first = self._refresh(str(VersionedRefreshToken.for_user(self.user)))
+        second = self._refresh(first.cookies["refresh_token"].value)
+        self.assertEqual(second.status_code, 200)
+
+    def test_password_change_revokes_refresh_token(self):
+        token = str(VersionedRefreshToken.for_user(self.user))
+        self.user.set_password("n3w-secret-pass")
+        self.user.save()
+        self.assertEqual(self._refresh(token).status_code, 401)
+
+    def test_logout_revokes_token(self):
+        token = str(VersionedRefreshToken.for_user(self.user))
+        self.client.cookies["refresh_token"] = token
+        self.assertEqual(self.client.post(reverse("auth:logout")).status_code, 204)
+        self.assertEqual(self._refresh(token).status_code, 401)
+
+    def test_missing_or_garbage_token(self):
+        self.assertEqual(self._refresh().status_code, 401)
+        self.assertEqual(self._refresh("not-a-token").status_code, 401)
+
+    def test_non_object_json_bodies_are_rejected_cleanly(self):
+        for body in ("[1, 2]", '"token"', "42"):
+            refresh = self.client.post(reverse("auth:refresh"), body, content_type="application/json",
+                                       REMOTE_ADDR="10.4.0.3")
+            self.assertEqual(refresh.status_code, 401)
+            logout = self.client.post(reverse("auth:logout"), body, content_type="application/json")
+            self.assertEqual(logout.status_code, 204)
+
+    def test_logout_succeeds_when_the_denylist_is_down(self):
+        self.client.cookies["refresh_token"] = str(VersionedRefreshToken.for_user(self.user))
+        with mock.patch("apps.users.denylist.cache.add", side_effect=ConnectionError("redis down")), \
+                self.assertLogs(level="ERROR"):
+            response = self.client.post(reverse("auth:logout"))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.cookies["refresh_token"].value, "")
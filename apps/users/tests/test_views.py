@@ -1,10 +1,11 @@
 # File: apps/users/tests/test_views.py
 from django.test import TestCase
+from django.urls import reverse
 
 class RateLimitTests(TestCase):
     def test_login_rate_limiting(self):
         for _ in range(4):
-            response = self.client.post("/api/auth/login/", {
+            response = self.client.post(reverse("auth:login"), {
                 "username": "test",
                 "password": "wrong"
             })
@@ -7,8 +7,10 @@ app_name = "users"
 urlpatterns = [
     # Authentication endpoints
     path("login/", views.user_login, name="login"),
-    path("password-reset/", views.password_reset, name="password-reset"),
+    path("refresh/", views.token_refresh, name="refresh"),
+    path("logout/", views.user_logout, name="logout"),
     
     # Add other endpoints:
+    # path("password-reset/", views.password_reset, name="password-reset"),
     # path("register/", views.user_register, name="register"),
 ]
\ No newline at end of file
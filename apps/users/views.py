@@ -7,21 +7,64 @@ Security Features:
 - JWT token authentication
 - Secure session management
 - Brute-force protection
+- Password hashing capped per process (users.backends.PooledModelBackend)
+- Refresh tokens rotate on every use; used tokens are denylisted until
+  they expire, so a replayed refresh token is rejected
 """
 
-from datetime import timedelta
+import logging
 from django.conf import settings
 from django.contrib.auth import authenticate
-from django.http import HttpRequest, JsonResponse
-from django_ratelimit.decorators import ratelimit
-from rest_framework_simplejwt.tokens import RefreshToken
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 
+from apps.core.ratelimit import Limit, rate_limits
+from apps.users import denylist
+from apps.users.authentication import CachedJWTAuthentication, VersionedRefreshToken
+from apps.users.hashing import LoginCapacityExceeded
+
+logger = logging.getLogger(__name__)
+
+REFRESH_COOKIE = 'refresh_token'
+
+
+def _set_refresh_cookie(response: HttpResponse, refresh: VersionedRefreshToken) -> None:
+    """HTTP-only refresh cookie living exactly as long as the token"""
+    response.set_cookie(
+        key=REFRESH_COOKIE,
+        value=str(refresh),
+        httponly=True,
+        secure=not settings.DEBUG,
+        samesite='Strict',
+        max_age=int(jwt_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+    )
+
+
+def _raw_refresh(request: HttpRequest) -> str:
+    """Refresh token from the cookie, else "refresh" in a JSON/form object body"""
+    raw = request.COOKIES.get(REFRESH_COOKIE)
+    if not raw and isinstance(request.data, dict):
+        raw = request.data.get('refresh')
+    return raw if isinstance(raw, str) else ''
+
+
+def _unauthorized(message: str) -> JsonResponse:
+    return JsonResponse(
+        {'error': message},
+        status=401,
+        headers={'X-Reason': 'AuthenticationFailure'}
+    )
+
+
+@rate_limits(
+    Limit('login-username', 'post:username', '3/m'),
+    Limit('login-ip', 'ip', '10/m'),
+)
 @api_view(['POST'])
 @permission_classes([AllowAny])
-@ratelimit(key='post:username', rate='3/m', method='POST')
-@ratelimit(key='ip', rate='10/m', method='POST', block=True)
 def user_login(request: HttpRequest) -> JsonResponse:
     """
     JWT Token Authentication Endpoint
@@ -39,7 +82,15 @@ def user_login(request: HttpRequest) -> JsonResponse:
     username = request.data.get('username')
     password = request.data.get('password')
     
-    user = authenticate(request, username=username, password=password)
+    try:
+        user = authenticate(request, username=username, password=password)
+    except LoginCapacityExceeded:
+        # Hashing pool saturated: fail fast rather than tie up the worker
+        return JsonResponse(
+            {'error': 'Login temporarily unavailable, please retry'},
+            status=503,
+            headers={'Retry-After': '1', 'X-Reason': 'LoginCapacity'}
+        )
     
     if not user:
         return JsonResponse(
@@ -48,20 +99,81 @@ def user_login(request: HttpRequest) -> JsonResponse:
             headers={'X-Reason': 'AuthenticationFailure'}
         )
     
-    refresh = RefreshToken.for_user(user)
+    refresh = VersionedRefreshToken.for_user(user)
     response = JsonResponse({
         'user_id': user.id,
         'access': str(refresh.access_token)
     })
     
     # Set secure cookies for token refresh
-    response.set_cookie(
-        key='refresh_token',
-        value=str(refresh),
-        httponly=True,
-        secure=not settings.DEBUG,
-        samesite='Strict',
-        max_age=timedelta(days=7).seconds
-    )
+    _set_refresh_cookie(response, refresh)
+    
+    return response
+
+
+@rate_limits(Limit('refresh-ip', 'ip', '30/m'))
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def token_refresh(request: HttpRequest) -> JsonResponse:
+    """
+    Refresh Token Rotation Endpoint
+    
+    Flow:
+    1. Read the refresh token (cookie, or "refresh" in the body)
+    2. Verify signature, expiry and token version (no password hash)
+    3. Denylist it (atomic; a second use is rejected as reuse)
+    4. Issue a new access/refresh pair and reset the cookie
+    """
+    raw = _raw_refresh(request)
+    if not raw:
+        return _unauthorized('Refresh token required')
+    
+    try:
+        refresh = VersionedRefreshToken(raw)
+        user = CachedJWTAuthentication().get_user(refresh)
+    except (TokenError, InvalidToken, AuthenticationFailed):
+        return _unauthorized('Invalid refresh token')
+    
+    try:
+        rotated = denylist.deny(refresh)
+    except Exception:  # pylint: disable=broad-except
+        # Fail closed: without the denylist a stolen token could be replayed
+        logger.exception("Refresh denylist unavailable")
+        return JsonResponse(
+            {'error': 'Token refresh temporarily unavailable, please retry'},
+            status=503,
+            headers={'Retry-After': '1'}
+        )
+    if not rotated:
+        logger.warning("Refresh token reuse for user %s", user.pk)
+        return _unauthorized('Refresh token already used')
     
+    new_refresh = VersionedRefreshToken.for_user(user)
+    response = JsonResponse({
+        'user_id': user.id,
+        'access': str(new_refresh.access_token)
+    })
+    _set_refresh_cookie(response, new_refresh)
+    return response
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def user_logout(request: HttpRequest) -> HttpResponse:
+    """
+    Revoke the refresh token (if any) and clear its cookie
+
+    Unlike refresh, logout fails open: a denylist outage is logged and the
+    cookie is still cleared (the token then lives until it expires).
+    """
+    raw = _raw_refresh(request)
+    if raw:
+        try:
+            denylist.deny(VersionedRefreshToken(raw))
+        except TokenError:
+            pass  # Expired or forged: nothing to revoke
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Refresh denylist unavailable, logout could not revoke the token")
+    response = HttpResponse(status=204)
+    response.delete_cookie(REFRESH_COOKIE, samesite='Strict')
     return response
\ No newline at end of file
@@ -0,0 +1,32 @@
+# config/asgi.py
+"""
+ASGI Configuration for Async Deployment
+
+Security Critical:
+- Initializes application with production settings
+- Sets environment variables before app initialization
+- Entry point for ASGI servers (gunicorn + uvicorn workers, uvicorn)
+
+Execution Flow:
+1. Set default environment variables (settings + ASGI URL configuration)
+2. Initialize Django application
+3. Export application handler for server
+
+Deployment:
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+"""
+
+import os
+from django.core.asgi import get_asgi_application
+from typing import Any
+
+# Security: Ensure production environment is explicitly set
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+# Async read paths (health, property list/detail) are mounted by config.asgi_urls
+os.environ.setdefault("DJANGO_ROOT_URLCONF", "config.asgi_urls")
+
+# Initialize application with production configuration
+application: Any = get_asgi_application()
+
+__all__ = ["application"]
@@ -0,0 +1,27 @@
+# config/asgi_urls.py
+"""
+ASGI URL Configuration
+
+Purpose:
+- Routes the read-heavy hot paths to native async views
+- Everything else falls through to config.urls unchanged
+
+Flow:
+1. Async health / property list / property detail routes match first
+2. Remaining requests → config.urls (DRF router, auth, admin, docs)
+"""
+
+from django.urls import path
+from typing import List, Any
+
+from apps.core.views import health_check_async
+from apps.listings.async_views import property_detail, property_list
+from config.urls import urlpatterns as wsgi_urlpatterns
+
+urlpatterns: List[Any] = [
+    path('health', health_check_async, name='health-check-async'),
+    path('health/ready', health_check_async, name='health-ready-async'),
+    path('api/v1/properties', property_list, name='property-list-async'),
+    path('api/v1/properties/<int:pk>', property_detail, name='property-detail-async'),
+    *wsgi_urlpatterns,
+]
@@ -0,0 +1,136 @@
+# config/gunicorn.py
+"""
+Gunicorn Configuration
+
+Performance Purpose:
+- preload_app: Django, the URLconf and the OpenAPI schema load once in the
+  master (config.wsgi.warm_up) and are shared copy-on-write by every worker;
+  gc.freeze() keeps the collector from touching (and copying) those pages
+- Workers and threads scale with the CPUs the container may actually use
+  (cgroup quota / affinity, not the host's core count)
+- max_requests + jitter recycles workers to bound memory creep without
+  restarting them all at once
+
+Safety:
+- DB connections are closed in the master before each fork and again in
+  the worker, so no socket is ever shared between processes
+- Heartbeat files live in /dev/shm (root filesystem is read-only)
+
+Metrics (apps.core.metrics, needs PROMETHEUS_MULTIPROC_DIR):
+- post_request samples worker RSS; worker_exit/worker_abort record requests
+  served and exit reason; child_exit (master) drops a dead worker's live gauges
+- ASGI (uvicorn) workers do not run post_request
+
+Usage:
+    gunicorn -c python:config.gunicorn config.wsgi:application
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker \
+        gunicorn -c python:config.gunicorn config.asgi:application
+
+Tuning (environment): GUNICORN_WORKERS, GUNICORN_THREADS, GUNICORN_WORKER_CLASS,
+GUNICORN_MAX_REQUESTS, GUNICORN_MAX_REQUESTS_JITTER, GUNICORN_TIMEOUT, GUNICORN_PRELOAD
+"""
+
+import gc
+import math
+import os
+
+import environ
+
+env = environ.Env()
+
+
+def cpu_count() -> int:
+    """CPUs this process may use: cgroup v2 quota, then affinity, then host count"""
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+# --- Server Socket ---
+bind = env("GUNICORN_BIND", default=f"0.0.0.0:{env('PORT', default='8000')}")
+backlog = 2048
+
+# --- Workers ---
+# gthread: a thread blocked on Postgres/Redis no longer idles a whole process.
+# Each thread holds its own DB connection (pgbouncer absorbs workers x threads).
+# Settings keep the login hashing pool below this thread count (LOGIN_HASH_*)
+worker_class = env("GUNICORN_WORKER_CLASS", default="gthread")
+workers = env.int("GUNICORN_WORKERS", default=2 * cpu_count() + 1)
+threads = env.int("GUNICORN_THREADS", default=4)  # HARDCODED: Validated with load_test, see commit log
+worker_tmp_dir = "/dev/shm"  # Heartbeat in memory, works with read_only containers
+
+# --- Recycling ---
+max_requests = env.int("GUNICORN_MAX_REQUESTS", default=1000)
+max_requests_jitter = env.int("GUNICORN_MAX_REQUESTS_JITTER", default=100)  # Staggers restarts
+
+# --- Timeouts ---
+timeout = env.int("GUNICORN_TIMEOUT", default=30)  # Matches the nginx upstream timeout
+graceful_timeout = 30
+keepalive = 5  # gthread only; nginx opens one upstream connection per request today
+
+# --- Application Loading ---
+preload_app = env.bool("GUNICORN_PRELOAD", default=True)
+
+# --- Logging ---
+errorlog = "-"
+loglevel = env("GUNICORN_LOG_LEVEL", default="info")
+
+
+# --- Server Hooks ---
+def when_ready(server):
+    """Master, after the app is loaded: build shared state, then freeze it for copy-on-write"""
+    if not server.cfg.preload_app:
+        return
+    from config.wsgi import warm_up
+
+    warm_up()
+    gc.freeze()
+
+
+def pre_fork(server, worker):
+    """Master: never hand an open DB socket to a child"""
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_fork(server, worker):
+    """Worker: drop any connection state inherited from the master"""
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_request(worker, req, request_environ, resp):
+    from apps.core.metrics import record_worker_request
+
+    record_worker_request(worker)
+
+
+def worker_abort(worker):
+    """Worker got SIGABRT from the master: it exceeded `timeout` (worker_exit follows)"""
+    worker.exit_reason = "timeout"
+
+
+def worker_exit(server, worker):
+    from apps.core.metrics import record_worker_exit
+
+    record_worker_exit(worker)
+
+
+def child_exit(server, worker):
+    """Master: runs for every dead worker, including ones killed outright"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -17,16 +17,18 @@ Hardcoded Values:
 - BLOCKED_PATH_PATTERNS: Common sensitive path patterns
 """
 
+from datetime import timedelta
 from pathlib import Path
 import os
 import environ
 from django.core.exceptions import ImproperlyConfigured
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 # --- Path Configuration ---
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # project_root/config/settings/../../..
 ROOT_URLCONF = "config.urls"
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 # --- Environment Setup ---
 env = environ.Env()
@@ -39,6 +41,7 @@ except FileNotFoundError:
 
 # --- Core Configuration ---
 DEBUG: bool = env.bool("DEBUG", False)
+ROOT_URLCONF = env("DJANGO_ROOT_URLCONF", default=ROOT_URLCONF)  # config/asgi.py selects config.asgi_urls
 SECRET_KEY: str = env("SECRET_KEY", default="dummy-key" if os.getenv("IN_DOCKER_BUILD") else None)  # type: ignore
 DEFAULT_AUTO_FIELD: str = "django.db.models.BigAutoField"  # HARDCODED: Required for migration stability
 
@@ -60,6 +63,10 @@ INSTALLED_APPS: List[str] = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     
+    # Third-party
+    "rest_framework",
+    "drf_spectacular",  # OpenAPI generation + Redoc template
+    
     # Project Apps
     "core.apps.CoreConfig",
     "listings.apps.ListingsConfig",
@@ -80,11 +87,12 @@ MIDDLEWARE: List[str] = [
     
     # Authentication
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.db_router.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     
     # Security Enhancements
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "django_ratelimit.middleware.RatelimitMiddleware",
+    "apps.core.ratelimit.RateLimitMiddleware",
 ]
 
 # --- Database Configuration ---
@@ -94,6 +102,13 @@ DATABASES: Dict[str, Dict[str, Any]] = {
     "default": env.db("DATABASE_URL", default=_default_db_url)
 }
 
+# Read replicas: aliases in DATABASES that serve reads of safe-method requests
+DATABASE_ROUTERS: List[str] = ["apps.core.db_router.PrimaryReplicaRouter"]
+DATABASE_REPLICAS: List[str] = []
+REPLICA_PIN_SECONDS: int = env.int("REPLICA_PIN_SECONDS", default=5)  # Read-your-writes window; above replica lag
+REPLICA_RETRY_SECONDS: int = 30  # HARDCODED: Skip a failed replica this long
+REPLICA_PRIMARY_APPS: Tuple[str, ...] = ("auth", "sessions", "contenttypes", "admin")  # Never read from replicas
+
 # --- Template Configuration ---
 TEMPLATES: List[Dict[str, Any]] = [{
     "BACKEND": "django.template.backends.django.DjangoTemplates",
@@ -115,6 +130,21 @@ STATIC_URL: str = "/static/"
 STATIC_ROOT: Path = BASE_DIR / "staticfiles"
 STATICFILES_STORAGE: str = "whitenoise.storage.CompressedManifestStaticFilesStorage"  # HARDCODED: Optimized storage
 
+# --- Health Checks ---
+HEALTH_CHECK_TIMEOUT: float = env.float("HEALTH_CHECK_TIMEOUT", default=2.0)  # Hard cap per readiness probe run
+HEALTH_CHECK_CACHE_TTL: float = env.float("HEALTH_CHECK_CACHE_TTL", default=5.0)  # Seconds a probe result is reused
+
+# --- OpenAPI Schema ---
+# Written by `manage.py generate_schema` at deploy; generated once per process if absent
+OPENAPI_SCHEMA_DIR: Path = Path(env("OPENAPI_SCHEMA_DIR", default=str(STATIC_ROOT / "openapi")))
+OPENAPI_SCHEMA_MAX_AGE: int = 300  # HARDCODED: Browser/proxy cache seconds; ETag revalidates after
+# drf-spectacular extensions, imported only when the schema is built (keeps it off the boot path)
+OPENAPI_EXTENSION_MODULES: List[str] = ["apps.users.schema"]
+
+# --- Listing Cache ---
+# Generation-versioned, so the TTL only bounds memory; writes invalidate instantly
+LISTINGS_CACHE_TIMEOUT: int = env.int("LISTINGS_CACHE_TIMEOUT", default=300)
+
 # --- Path Security ---
 BLOCKED_PATH_PATTERNS: List[str] = [
     r'\.git',  # Version control
@@ -130,8 +160,48 @@ AUTH_PASSWORD_VALIDATORS: List[Dict[str, str]] = [
     {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
+AUTHENTICATION_BACKENDS: List[str] = ["apps.users.backends.PooledModelBackend"]
+
+# Password hashing pool: PBKDF2 runs on at most LOGIN_HASH_WORKERS threads per
+# process; beyond LOGIN_HASH_QUEUE waiting logins the API answers 503 at once.
+# Logins hold their request thread while hashing, so workers + queue must stay
+# below the request threads per process (GUNICORN_THREADS, config/gunicorn.py)
+LOGIN_REQUEST_THREADS: int = env.int("GUNICORN_THREADS", default=4)
+LOGIN_HASH_WORKERS: int = env.int("LOGIN_HASH_WORKERS", default=max(1, LOGIN_REQUEST_THREADS // 4))
+LOGIN_HASH_QUEUE: int = env.int("LOGIN_HASH_QUEUE", default=max(0, LOGIN_REQUEST_THREADS // 2 - LOGIN_HASH_WORKERS))
+if LOGIN_REQUEST_THREADS > 1 and LOGIN_HASH_WORKERS + LOGIN_HASH_QUEUE >= LOGIN_REQUEST_THREADS:
+    raise ImproperlyConfigured(
+        f"LOGIN_HASH_WORKERS + LOGIN_HASH_QUEUE ({LOGIN_HASH_WORKERS + LOGIN_HASH_QUEUE}) must be below "
+        f"GUNICORN_THREADS ({LOGIN_REQUEST_THREADS}), or a login burst can occupy every request thread"
+    )
+LOGIN_HASH_TIMEOUT: float = env.float("LOGIN_HASH_TIMEOUT", default=0.5)  # Seconds a login may queue; about one hash
+
+# API authentication: JWT first (user resolved from cache), then DRF's defaults
+REST_FRAMEWORK: Dict[str, Any] = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "apps.users.authentication.CachedJWTAuthentication",
+        "rest_framework.authentication.SessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
+    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+}
+SPECTACULAR_SETTINGS: Dict[str, Any] = {
+    "TITLE": "My Property API",
+    "VERSION": "1.0.0",
+}
+SIMPLE_JWT: Dict[str, Any] = {
+    "ACCESS_TOKEN_LIFETIME": timedelta(minutes=env.int("JWT_ACCESS_MINUTES", default=5)),
+    "REFRESH_TOKEN_LIFETIME": timedelta(days=env.int("JWT_REFRESH_DAYS", default=7)),  # Also the cookie max_age
+}
+JWT_USER_CACHE_TIMEOUT: int = env.int("JWT_USER_CACHE_TIMEOUT", default=300)  # Seconds; saves invalidate earlier
+JWT_USER_CACHE_FIELDS: Tuple[str, ...] = ("id", "username", "is_active", "is_staff", "is_superuser")  # Never the password
 
 # --- Rate Limiting ---
 RATELIMIT_VIEW: str = "core.views.rate_limit_exceeded"  # HARDCODED: Path to custom view
 RATELIMIT_RATE: str = env("RATELIMIT_RATE", default="100/m")  # Production override suggested
-RATELIMIT_KEY: str = "header:x-forwarded-for" if not DEBUG else "ip"
\ No newline at end of file
+RATELIMIT_KEY: str = "header:x-forwarded-for" if not DEBUG else "ip"
+RATELIMIT_USE_CACHE: str = "default"  # Redis in production: one Lua call per request
+RATELIMIT_EXEMPT_PATHS: Tuple[str, ...] = ("/health", "/metrics")  # Probes and scrapes never limited
+RATELIMIT_LOCAL_FRACTION: float = env.float("RATELIMIT_LOCAL_FRACTION", default=0.05)  # Share of a limit leased to a worker
+RATELIMIT_LOCAL_THRESHOLD: float = env.float("RATELIMIT_LOCAL_THRESHOLD", default=0.5)  # No leases above this usage
+RATELIMIT_LOCAL_TTL: float = 1.0  # HARDCODED: Seconds a lease stays valid
\ No newline at end of file
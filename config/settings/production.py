@@ -18,33 +18,28 @@ Critical Paths:
 
 from pathlib import Path
 import os
-import environ
 from django.core.exceptions import ImproperlyConfigured
 from .base import *  # noqa: F403
 
 # --- Environment Initialization ---
-env = environ.Env()
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-
-# Load environment variables (3 directories up from config/settings)
-ENV_PATH = BASE_DIR / ".env"
-if ENV_PATH.exists():
-    environ.Env.read_env(str(ENV_PATH))
+# env, BASE_DIR and the .env file come from base (read once per process)
 
 # --- Core Configuration ---
 DEBUG = False
-ROOT_URLCONF = "config.urls"
+ROOT_URLCONF = env("DJANGO_ROOT_URLCONF", default="config.urls")  # config/asgi.py selects config.asgi_urls
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 # --- Security Configuration ---
 # HARDCODED: Replace with production domain in .env
 SECRET_KEY = env("SECRET_KEY")  # Must be 50+ characters
-ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=["130.61.246.120", "localhost"])
+ALLOWED_HOSTS = env.list("ALLOWED_HOSTS", default=["130.61.246.120", "localhost", "django-app"])  # django-app: Prometheus scrapes by service name
 CSRF_TRUSTED_ORIGINS = env.list("CSRF_TRUSTED_ORIGINS", default=["https://130.61.246.120"])
 
 # HTTPS Enforcement
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 SECURE_SSL_REDIRECT = True
+SECURE_REDIRECT_EXEMPT = [r"^metrics$", r"^health(/|$)"]  # Prometheus scrapes and container healthchecks use plain HTTP internally
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 
@@ -56,15 +51,29 @@ SECURE_CONTENT_TYPE_NOSNIFF = True
 X_FRAME_OPTIONS = "DENY"
 
 # --- Database Configuration ---
+# DB_POOL_MODE=pgbouncer routes through the pgbouncer compose service (transaction
+# pooling): workers keep cheap client connections, while pgbouncer caps real server
+# connections at PGBOUNCER_MAX_DB_CONNECTIONS however many replicas run.
+# DB_POOL_MODE=direct connects each worker straight to postgres-db.
+DB_POOL_MODE = env("DB_POOL_MODE", default="direct")
+if DB_POOL_MODE not in ("direct", "pgbouncer"):
+    raise ImproperlyConfigured(f"DB_POOL_MODE must be 'direct' or 'pgbouncer', not {DB_POOL_MODE!r}")
+_pooled = DB_POOL_MODE == "pgbouncer"
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
         "NAME": env("POSTGRES_DB"),
         "USER": env("POSTGRES_USER"),
         "PASSWORD": env("POSTGRES_PASSWORD"),
-        "HOST": env("POSTGRES_HOST", default="postgres-db"),  # Matches compose service name
-        "PORT": env("POSTGRES_PORT", default="5432"),
+        # Matches compose service names
+        "HOST": env("POSTGRES_HOST", default="pgbouncer" if _pooled else "postgres-db"),
+        "PORT": env("POSTGRES_PORT", default="6432" if _pooled else "5432"),
         "CONN_MAX_AGE": 600,  # Connection persistence
+        "CONN_HEALTH_CHECKS": True,  # Ping a reused connection before the first query of a request
+        # Transaction pooling hands each transaction any server connection, so
+        # cursors must not outlive it; iterator() then fetches client-side
+        "DISABLE_SERVER_SIDE_CURSORS": _pooled,
         "OPTIONS": {
             "sslmode": "disable",  # require: Enforce SSL connections
             # Disable SSL for development
@@ -76,11 +85,44 @@ DATABASES = {
     }
 }
 
+# Read replicas (streaming replicas of postgres-db, connected directly):
+# POSTGRES_REPLICA_HOSTS=replica-1,replica-2 -> aliases replica_1, replica_2
+for _index, _host in enumerate(env.list("POSTGRES_REPLICA_HOSTS", default=[]), start=1):
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host,
+        "PORT": env("POSTGRES_REPLICA_PORT", default="5432"),
+        "DISABLE_SERVER_SIDE_CURSORS": False,
+        "OPTIONS": {**DATABASES["default"]["OPTIONS"], "connect_timeout": 2},  # Fail over to the primary fast
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith("replica_")]
+
+# --- Cache Configuration ---
+# Shared Redis cache (redis-cache compose service) for rate limits and listing responses
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_URL", default="redis://redis-cache:6379/0"),
+        "TIMEOUT": 300,
+        "OPTIONS": {
+            "socket_connect_timeout": 2,  # Fail fast, cached views fall back to the DB
+            "socket_timeout": 2,
+        },
+    }
+}
+
+# --- Monitoring ---
+# Metrics are served at /metrics (see config/urls.py); set PROMETHEUS_MULTIPROC_DIR
+# in the environment so gunicorn workers share one aggregated view
+INSTALLED_APPS += ["django_prometheus"]  # noqa: F405
+
 # --- Middleware Stack ---
 # Order is critical: Security first, utilities next, features last
 MIDDLEWARE = [
     # Security & Infrastructure
     "apps.core.middleware.BlockGitAccessMiddleware",
+    "django_prometheus.middleware.PrometheusBeforeMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     
@@ -91,19 +133,22 @@ MIDDLEWARE = [
     
     # Authentication & Authorization
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "apps.core.db_router.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     
     # Security Enhancements
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "django_ratelimit.middleware.RatelimitMiddleware",
+    "apps.core.ratelimit.RateLimitMiddleware",
     
     # Monitoring & Diagnostics
     "django.middleware.common.BrokenLinkEmailsMiddleware",
+    "apps.core.metrics.QueryMetricsMiddleware",
+    "django_prometheus.middleware.PrometheusAfterMiddleware",
 ]
 
 # --- Logging Configuration ---
-LOG_DIR = Path("/var/log/django")
-LOG_DIR.mkdir(exist_ok=True, parents=True)  # Ensure log directory exists
+# Created on the first written record (LazyRotatingFileHandler), not at import
+LOG_DIR = Path(env("DJANGO_LOG_DIR", default="/var/log/django"))
 
 LOGGING = {
     "version": 1,
@@ -125,7 +170,8 @@ LOGGING = {
         },
         "file": {
             "level": "DEBUG",
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "apps.core.log_handlers.LazyRotatingFileHandler",
+            "delay": True,
             "filename": LOG_DIR / "app.log",
             "maxBytes": 5 * 1024 * 1024,  # 5MB per file
             "backupCount": 3,
@@ -133,7 +179,8 @@ LOGGING = {
         },
         "security_file": {
             "level": "WARNING",
-            "class": "logging.handlers.RotatingFileHandler",
+            "class": "apps.core.log_handlers.LazyRotatingFileHandler",
+            "delay": True,
             "filename": LOG_DIR / "security.log",
             "maxBytes": 2 * 1024 * 1024,  # 2MB per file
             "backupCount": 5,
@@ -19,21 +19,22 @@ Maintenance Notes:
 - Type hints aid IDE autocompletion
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 from django.views.generic import RedirectView
 from rest_framework import routers
 from typing import List, Union, Any
 
-# Import after DRF to ensure schema view works
-from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView
-
 # Local imports
-from apps.listings.views import PropertyViewSet, OfferViewSet
+from apps.core.schema import redoc_view, schema_view
+from apps.core.views import health_check, liveness_check
+from apps.listings.views import PropertyViewSet, PropertySummaryViewSet, OfferViewSet
 
 # Initialize DRF router with strict trailing slash config
 router: routers.DefaultRouter = routers.DefaultRouter(trailing_slash=False)
 router.register(r'properties', PropertyViewSet, basename='property')
+router.register(r'property-summaries', PropertySummaryViewSet, basename='property-summary')
 router.register(r'offers', OfferViewSet, basename='offer')
 
 # Type alias for URL patterns
@@ -46,17 +47,26 @@ urlpatterns: List[URLPattern] = [
     # Authentication subsystem
     path('api/v1/auth/', include('users.urls', namespace='auth')),
     
+    # Health probes (liveness: no I/O, readiness: memoized dependency checks)
+    path('health', health_check, name='health-check'),
+    path('health/live', liveness_check, name='health-live'),
+    path('health/ready', health_check, name='health-ready'),
+    
     # Admin interface (disabled in production)
     path('admin/', admin.site.urls),
     
-    # API documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
-    path('api/docs/', SpectacularRedocView.as_view(url_name='schema'), name='apidocs'),
+    # API documentation (schema precomputed, served from memory with ETag)
+    path('api/schema/', schema_view, name='schema'),
+    path('api/docs/', redoc_view, name='apidocs'),  # drf-spectacular imported on first hit
     
     # Default redirect (preserve existing behavior)
     path('', RedirectView.as_view(url='/api/docs/'))
 ]
 
+if "django_prometheus" in settings.INSTALLED_APPS:
+    # Prometheus scrape endpoint (/metrics), production only
+    urlpatterns += [path('', include('django_prometheus.urls'))]
+
 if settings.DEBUG:  # type: ignore
     # Debug toolbar only in development
     import debug_toolbar
@@ -11,6 +11,11 @@ Execution Flow:
 1. Set default environment variables
 2. Initialize Django application
 3. Export application handler for server
+
+Preloading (config/gunicorn.py):
+- With preload_app the master imports this module once and calls warm_up()
+  before forking, so lazily built state is shared by all workers
+- Nothing here may open a DB connection or start a thread at import time
 """
 
 import os
@@ -24,8 +29,18 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
 # Initialize application with production configuration
 application: Any = get_wsgi_application()
 
+
+def warm_up() -> None:
+    """Build per-process lazy state in the gunicorn master (preload_app) instead of per worker"""
+    from django.urls import get_resolver
+    from apps.core.schema import preload_documents
+
+    get_resolver().reverse_dict  # Imports every view/serializer and populates the resolver
+    preload_documents()  # OpenAPI schema files from OPENAPI_SCHEMA_DIR; never generated here
+
+
 # Security: Prevent accidental environment overrides after initialization
-__all__ = ["application"]  # Explicit exports for Python*
+__all__ = ["application", "warm_up"]  # Explicit exports for Python*
 
 # Optional Production Checks (Uncomment for strict environments)
 # if os.environ.get('DJANGO_ENV') != 'production':